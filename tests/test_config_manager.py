@@ -2,6 +2,7 @@
 
 import json
 import sys
+import time
 from pathlib import Path
 
 import pytest
@@ -43,6 +44,18 @@ class TestBasicLoadSave:
     def test_remove_missing_key_is_safe(self, config_manager):
         config_manager.remove("not-there")  # should not raise
 
+    def test_load_returns_independent_copies(self, config_manager):
+        config_manager.save({"libs": [1]})
+        first = config_manager.load()
+        first["libs"].append(2)
+        assert config_manager.load() == {"libs": [1]}
+
+    def test_load_picks_up_external_edit(self, config_manager):
+        config_manager.save({"foo": "bar"})
+        assert config_manager.load() == {"foo": "bar"}
+        config_manager.config_file.write_text(json.dumps({"foo": "changed!"}), encoding="utf-8")
+        assert config_manager.load() == {"foo": "changed!"}
+
 
 class TestApiKeys:
     def test_tmdb_api_key_roundtrip(self, config_manager):
@@ -88,6 +101,13 @@ class TestRecentLibraries:
             config_manager.add_recent_library(f"/path/{i}")
         assert len(config_manager.get_recent_libraries(max_count=3)) == 3
 
+    def test_timestamp_is_epoch_seconds(self, config_manager):
+        before = time.time()
+        config_manager.add_recent_library("/path/one")
+        timestamp = config_manager.get_recent_libraries()[0]["timestamp"]
+        assert isinstance(timestamp, float)
+        assert before <= timestamp <= time.time()
+
     def test_clear(self, config_manager):
         config_manager.add_recent_library("/path/one")
         config_manager.clear_recent_libraries()
@@ -159,3 +179,14 @@ class TestConfigPersistentSettings:
         config.load_persistent_settings()
 
         assert config.kept_languages == ["por-pt", "por", "eng"]
+
+
+class TestSharedInstance:
+    def test_get_config_manager_returns_same_instance(self, monkeypatch, tmp_path):
+        from jellyfix.utils import config_manager as module
+
+        monkeypatch.setattr(Path, "home", staticmethod(lambda: tmp_path))
+        monkeypatch.setattr(module, "_config_manager", None)
+        first = module.get_config_manager()
+        assert first is module.get_config_manager()
+        assert first.config_dir == tmp_path / ".jellyfix"
@@ -439,3 +439,20 @@ class TestParseDestinationForSearch:
         info = parse_destination_for_search(dest)
         assert info["is_episode"] is True
         assert info["year"] is None
+
+    def test_tmdb_id_from_folder(self):
+        dest = Path("/lib/Show (2010) [tmdbid-1399]/Season 01/Show - S01E05 - 720p.mkv")
+        info = parse_destination_for_search(dest)
+        assert info["tmdb_id"] == 1399
+        assert info["title"] == "Show"
+
+    def test_tmdb_id_missing(self):
+        info = parse_destination_for_search(Path("/lib/Untitled (2001).mkv"))
+        assert info["tmdb_id"] is None
+        assert info["year"] == 2001
+
+    def test_episode_year_only_read_from_folders(self):
+        dest = Path("/lib/Show/Season 01/Show (2011) - S01E01.mkv")
+        info = parse_destination_for_search(dest)
+        assert info["title"] == "Show (2011)"
+        assert info["year"] is None
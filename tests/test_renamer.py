@@ -42,3 +42,23 @@ def test_execute_aborts_before_delete_when_reversible_operation_fails(tmp_path):
     assert stats["failed"] == 1
     assert stats["deleted"] == 0
     assert delete_target.exists()
+
+
+def test_operation_path_helpers(tmp_path):
+    moved = RenameOperation(
+        source=tmp_path / "a" / "movie.mkv",
+        destination=tmp_path / "b" / "Movie (2020).mkv",
+        operation_type="move_rename",
+        reason="organize",
+    )
+    renamed = RenameOperation(
+        source=tmp_path / "a" / "movie.mkv",
+        destination=tmp_path / "a" / "Movie (2020).mkv",
+        operation_type="rename",
+        reason="rename",
+    )
+
+    assert moved.source_str == str(moved.source)
+    assert moved.destination_str == str(moved.destination)
+    assert moved.changes_folder
+    assert not renamed.changes_folder
@@ -153,3 +153,32 @@ class TestScanResult:
         result.subtitle_files = [Path("c.srt")]
         result.other_files = [Path("d.txt")]
         assert result.total_files == 4
+
+
+class TestScanCancellation:
+    def test_cancelled_scan_returns_early(self, scanner, tmp_path):
+        for i in range(3):
+            (tmp_path / f"movie{i}.mkv").write_bytes(b"\x00" * 100)
+        result = scanner.scan(tmp_path, is_cancelled=lambda: True)
+        assert result.total_files == 0
+
+
+class TestScanConcurrent:
+    def test_matches_sequential_scan(self, scanner, tmp_path):
+        for folder in ("a", "a/b", "c"):
+            (tmp_path / folder).mkdir(parents=True, exist_ok=True)
+        (tmp_path / "a" / "movie.mkv").write_bytes(b"\x00" * 100)
+        (tmp_path / "a" / "b" / "episode.mp4").write_bytes(b"\x00" * 100)
+        (tmp_path / "c" / "movie.nfo").write_text("<movie/>")
+        (tmp_path / "c" / "notes.txt").write_text("x")
+
+        sequential = scanner.scan(tmp_path)
+        concurrent = scanner.scan_concurrent(tmp_path, max_workers=4)
+
+        assert sorted(concurrent.video_files) == sorted(sequential.video_files)
+        assert sorted(concurrent.nfo_files) == sorted(sequential.nfo_files)
+        assert sorted(concurrent.other_files) == sorted(sequential.other_files)
+
+    def test_nonexistent_directory(self, scanner, tmp_path):
+        result = scanner.scan_concurrent(tmp_path / "nonexistent")
+        assert result.total_files == 0
@@ -74,3 +74,29 @@ def test_generic_portuguese_release_stays_generic(monkeypatch):
     sub = DummySubtitle(Language("por"), release_info="Portuguese subtitles")
 
     assert manager._subtitle_language_code(sub) == "por"
+
+
+class EncodedSubtitle:
+    def __init__(self, content, encoding):
+        self.content = content
+        self.encoding = encoding
+
+
+def test_write_subtitle_strips_utf8_bom(monkeypatch, tmp_path):
+    monkeypatch.setattr("jellyfix.core.subtitle_manager.get_config", lambda: DummyConfig())
+    manager = SubtitleManager()
+    path = tmp_path / "movie.por.srt"
+
+    manager._write_subtitle(path, EncodedSubtitle("\ufeffOlá".encode("utf-8"), "utf-8"))
+
+    assert path.read_bytes() == "Olá".encode("utf-8")
+
+
+def test_write_subtitle_reencodes_legacy_charset(monkeypatch, tmp_path):
+    monkeypatch.setattr("jellyfix.core.subtitle_manager.get_config", lambda: DummyConfig())
+    manager = SubtitleManager()
+    path = tmp_path / "movie.por.srt"
+
+    manager._write_subtitle(path, EncodedSubtitle("Olá".encode("latin-1"), "iso-8859-1"))
+
+    assert path.read_text(encoding="utf-8") == "Olá"
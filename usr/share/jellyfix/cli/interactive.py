@@ -20,7 +20,7 @@ from ..core.scanner import LibraryScanner
 from ..core.renamer import Renamer
 from ..core.subtitle_manager import SubtitleManager
 from ..utils.logger import get_logger
-from ..utils.config_manager import ConfigManager
+from ..utils.config_manager import get_config_manager
 from ..utils.config import APP_VERSION
 from ..utils.i18n import _
 from .display import (
@@ -58,7 +58,7 @@ class InteractiveCLI:
         """
         self.config = config
         self.logger = get_logger()
-        self.config_manager = ConfigManager()
+        self.config_manager = get_config_manager()
 
     def run(self):
         """Run interactive mode"""
@@ -1,5 +1,6 @@
 """Busca de metadados via TMDB e TVDB"""
 
+import threading
 import time
 from typing import Optional, List
 from dataclasses import dataclass
@@ -47,14 +48,20 @@ class MetadataFetcher:
         # Rate limiting: TMDB free tier = 40 req / 10 sec
         self._last_request_time: float = 0.0
         self._min_request_interval: float = 0.25  # 4 req/sec max
+        # Lookups may run from several threads (batch prefetch in the GUI)
+        self._rate_lock = threading.Lock()
 
     def _rate_limit(self) -> None:
         """Enforce minimum interval between TMDB API requests."""
-        now = time.monotonic()
-        elapsed = now - self._last_request_time
-        if elapsed < self._min_request_interval:
-            time.sleep(self._min_request_interval - elapsed)
-        self._last_request_time = time.monotonic()
+        # Reserve the next slot under the lock and sleep outside it, so
+        # concurrent callers are spaced out instead of serialized twice
+        with self._rate_lock:
+            start = max(time.monotonic(),
+                        self._last_request_time + self._min_request_interval)
+            self._last_request_time = start
+        delay = start - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
 
     # ------------------------------------------------------------------
     # Verificação de match (anti-erro): similaridade de título + ano
@@ -3,6 +3,7 @@
 from pathlib import Path
 from typing import Optional, List, Dict
 from dataclasses import dataclass
+from functools import cached_property
 import re
 import shutil
 
@@ -25,6 +26,24 @@ class RenameOperation:
     operation_type: str  # 'rename', 'move', 'delete'
     reason: str
 
+    # Valores derivados dos caminhos, usados a cada exibição na GUI;
+    # calculados uma vez, já que source/destination não mudam após a criação
+
+    @cached_property
+    def source_str(self) -> str:
+        """Caminho de origem como string"""
+        return str(self.source)
+
+    @cached_property
+    def destination_str(self) -> str:
+        """Caminho de destino como string"""
+        return str(self.destination)
+
+    @cached_property
+    def changes_folder(self) -> bool:
+        """Indica se o destino fica em outra pasta"""
+        return self.source.parent != self.destination.parent
+
     @property
     def will_overwrite(self) -> bool:
         """Verifica se vai sobrescrever um arquivo existente"""
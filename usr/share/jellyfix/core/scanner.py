@@ -1,7 +1,9 @@
 """Scanner de arquivos e análise de bibliotecas"""
 
+import os
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from pathlib import Path
-from typing import List
+from typing import Callable, List, Optional, Tuple
 from dataclasses import dataclass, field
 from ..utils.helpers import (
     is_video_file, is_subtitle_file, is_image_file,
@@ -10,6 +12,13 @@ from ..utils.helpers import (
 from ..utils.config import get_config
 from .detector import detect_media_type
 
+# Tipos de sistema de arquivos de rede (SMB/NFS/etc.), onde listar diretórios
+# custa um round-trip por diretório e o scan concorrente compensa
+NETWORK_FS_TYPES = frozenset({
+    'cifs', 'smb3', 'smbfs', 'nfs', 'nfs4', '9p', 'afs', 'ceph', 'glusterfs',
+    'davfs', 'fuse.sshfs', 'fuse.rclone',
+})
+
 
 @dataclass
 class ScanResult:
@@ -53,12 +62,15 @@ class LibraryScanner:
     def __init__(self):
         self.config = get_config()
 
-    def scan(self, directory: Path) -> ScanResult:
+    def scan(self, directory: Path,
+             is_cancelled: Optional[Callable[[], bool]] = None) -> ScanResult:
         """
         Escaneia um diretório e categoriza os arquivos.
 
         Args:
             directory: Diretório a escanear
+            is_cancelled: Função opcional consultada a cada arquivo; quando
+                retorna True o scan é interrompido (resultado parcial)
 
         Returns:
             ScanResult com os arquivos categorizados
@@ -70,56 +82,109 @@ class LibraryScanner:
 
         # Escaneia recursivamente (lazy — não materializa toda a árvore em memória)
         for file_path in directory.rglob('*'):
+            if is_cancelled and is_cancelled():
+                break
+
             if not file_path.is_file():
                 continue
 
-            # Hidden files (starting with '.') are only collected for removal
-            if file_path.name.startswith('.'):
-                if self.config.remove_non_media:
-                    result.other_files.append(file_path)
-                    result.non_media_files.append(file_path)
-                continue
+            self._categorize_file(file_path, result)
 
-            # Categoriza por tipo
-            if is_video_file(file_path):
-                result.video_files.append(file_path)
+        return result
 
-                # Detecta tipo de mídia
-                media_info = detect_media_type(file_path)
-                if media_info.is_movie():
-                    result.total_movies += 1
-                elif media_info.is_tvshow():
-                    result.total_episodes += 1
+    def scan_concurrent(self, directory: Path, max_workers: int = 16,
+                        is_cancelled: Optional[Callable[[], bool]] = None) -> ScanResult:
+        """
+        Escaneia um diretório listando vários subdiretórios em paralelo.
 
-            elif is_subtitle_file(file_path):
-                # Ignora legendas vazias ou muito pequenas
-                if file_path.stat().st_size < self.config.min_subtitle_bytes:
-                    continue
+        Indicado para bibliotecas em SMB/NFS, onde cada listagem espera um
+        round-trip de rede: mantém até max_workers os.scandir em andamento.
+        A categorização dos arquivos é igual à de scan().
 
-                result.subtitle_files.append(file_path)
-                self._categorize_subtitle(file_path, result)
+        Args:
+            directory: Diretório a escanear
+            max_workers: Número máximo de listagens simultâneas
+            is_cancelled: Função opcional que interrompe o scan ao retornar True
 
-            elif is_image_file(file_path):
-                result.image_files.append(file_path)
-                self._categorize_image(file_path, result)
-                # Marca imagens como non-media se configurado
-                if self.config.remove_non_media:
-                    result.non_media_files.append(file_path)
+        Returns:
+            ScanResult com os arquivos categorizados
+        """
+        result = ScanResult()
 
-            elif file_path.suffix.lower() == '.nfo':
-                result.nfo_files.append(file_path)
-                # Marca NFO como non-media se configurado
-                if self.config.remove_non_media:
-                    result.non_media_files.append(file_path)
+        if not directory.is_dir():
+            return result
 
-            else:
-                result.other_files.append(file_path)
-                # Marca arquivos que não são vídeos ou legendas para possível remoção
-                if self.config.remove_non_media:
-                    result.non_media_files.append(file_path)
+        for file_path in self._walk_concurrent(directory, max_workers, is_cancelled):
+            if is_cancelled and is_cancelled():
+                break
+            self._categorize_file(file_path, result)
 
         return result
 
+    def _walk_concurrent(self, directory: Path, max_workers: int,
+                         is_cancelled: Optional[Callable[[], bool]]) -> List[Path]:
+        """Lista todos os arquivos da árvore, reenviando cada subdiretório ao pool"""
+        files: List[Path] = []
+        with ThreadPoolExecutor(max_workers=max_workers,
+                                thread_name_prefix="jellyfix-scan") as pool:
+            pending = {pool.submit(_list_dir, directory)}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    subdirs, dir_files = future.result()
+                    files.extend(dir_files)
+                    if is_cancelled and is_cancelled():
+                        continue
+                    pending.update(pool.submit(_list_dir, d) for d in subdirs)
+        return files
+
+    def _categorize_file(self, file_path: Path, result: ScanResult):
+        """Categoriza um único arquivo encontrado no scan"""
+        # Hidden files (starting with '.') are only collected for removal
+        if file_path.name.startswith('.'):
+            if self.config.remove_non_media:
+                result.other_files.append(file_path)
+                result.non_media_files.append(file_path)
+            return
+
+        # Categoriza por tipo
+        if is_video_file(file_path):
+            result.video_files.append(file_path)
+
+            # Detecta tipo de mídia
+            media_info = detect_media_type(file_path)
+            if media_info.is_movie():
+                result.total_movies += 1
+            elif media_info.is_tvshow():
+                result.total_episodes += 1
+
+        elif is_subtitle_file(file_path):
+            # Ignora legendas vazias ou muito pequenas
+            if file_path.stat().st_size < self.config.min_subtitle_bytes:
+                return
+
+            result.subtitle_files.append(file_path)
+            self._categorize_subtitle(file_path, result)
+
+        elif is_image_file(file_path):
+            result.image_files.append(file_path)
+            self._categorize_image(file_path, result)
+            # Marca imagens como non-media se configurado
+            if self.config.remove_non_media:
+                result.non_media_files.append(file_path)
+
+        elif file_path.suffix.lower() == '.nfo':
+            result.nfo_files.append(file_path)
+            # Marca NFO como non-media se configurado
+            if self.config.remove_non_media:
+                result.non_media_files.append(file_path)
+
+        else:
+            result.other_files.append(file_path)
+            # Marca arquivos que não são vídeos ou legendas para possível remoção
+            if self.config.remove_non_media:
+                result.non_media_files.append(file_path)
+
     def _categorize_subtitle(self, file_path: Path, result: ScanResult):
         """Categoriza um arquivo de legenda"""
         import re
@@ -171,15 +236,79 @@ class LibraryScanner:
             result.unwanted_images.append(file_path)
 
 
-def scan_library(directory: Path) -> ScanResult:
+def _list_dir(directory: Path) -> Tuple[List[Path], List[Path]]:
+    """Lista um diretório, retornando (subdiretórios, arquivos)"""
+    subdirs: List[Path] = []
+    files: List[Path] = []
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                try:
+                    # Como rglob: não segue links simbólicos para diretórios
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(Path(entry.path))
+                    elif entry.is_file():
+                        files.append(Path(entry.path))
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return subdirs, files
+
+
+def is_network_path(path: Path) -> bool:
+    """
+    Verifica se o caminho está em um sistema de arquivos de rede.
+
+    Usa o ponto de montagem mais específico de /proc/self/mounts (Linux);
+    retorna False quando a informação não está disponível.
+    """
+    try:
+        target = os.path.realpath(path)
+        best_mount, fs_type = '', ''
+        with open('/proc/self/mounts', encoding='utf-8') as mounts:
+            for line in mounts:
+                parts = line.split()
+                if len(parts) < 3:
+                    continue
+                mount_point = parts[1].replace('\\040', ' ')
+                prefix = mount_point.rstrip('/') + '/'
+                if ((target == mount_point or target.startswith(prefix))
+                        and len(mount_point) > len(best_mount)):
+                    best_mount, fs_type = mount_point, parts[2]
+        return fs_type in NETWORK_FS_TYPES
+    except OSError:
+        return False
+
+
+def scan_library(directory: Path,
+                 is_cancelled: Optional[Callable[[], bool]] = None) -> ScanResult:
     """
     Escaneia uma biblioteca de mídia.
 
     Args:
         directory: Diretório da biblioteca
+        is_cancelled: Função opcional que interrompe o scan ao retornar True
+
+    Returns:
+        Resultado do scan
+    """
+    scanner = LibraryScanner()
+    return scanner.scan(directory, is_cancelled)
+
+
+def scan_library_concurrent(directory: Path, max_workers: int = 16,
+                            is_cancelled: Optional[Callable[[], bool]] = None) -> ScanResult:
+    """
+    Escaneia uma biblioteca de mídia listando diretórios em paralelo.
+
+    Args:
+        directory: Diretório da biblioteca
+        max_workers: Número máximo de listagens simultâneas
+        is_cancelled: Função opcional que interrompe o scan ao retornar True
 
     Returns:
         Resultado do scan
     """
     scanner = LibraryScanner()
-    return scanner.scan(directory)
+    return scanner.scan_concurrent(directory, max_workers, is_cancelled)
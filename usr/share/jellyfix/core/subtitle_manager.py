@@ -17,9 +17,12 @@ Implements a 3-level search strategy:
 """
 
 import os
+import threading
 from pathlib import Path
-from typing import List, Dict, Optional, Set, Any, Tuple
+from typing import List, Dict, Optional, Set, Any, Tuple, FrozenSet
+from collections import defaultdict
 from dataclasses import dataclass
+from functools import lru_cache
 import re
 
 from ..utils.logger import get_logger
@@ -35,9 +38,25 @@ try:
 except ImportError:
     HAS_SUBLIMINAL = False
 
+# Encoding detector for subtitles that don't decode with their declared
+# encoding. Resolved once here so the decode fallback is a plain call.
+try:
+    import cchardet as _charset_detector
+except ImportError:
+    try:
+        import charset_normalizer as _charset_detector
+    except ImportError:
+        try:
+            import chardet as _charset_detector
+        except ImportError:
+            _charset_detector = None
+
 _CACHE_CONFIGURED = False
 _OSCOM_LANGUAGES_PATCHED = False
 
+# Upper bound for SubtitleManager's scan_video cache (oldest entries evicted first)
+_VIDEO_CACHE_SIZE = 256
+
 
 def _configure_subliminal_cache() -> None:
     """Configure subliminal's dogpile cache region — required for downloads.
@@ -90,6 +109,39 @@ def _patch_opensubtitlescom_languages() -> None:
     except Exception:
         pass
 
+
+@lru_cache(maxsize=64)
+def _language(code: str, country: Optional[str] = None) -> Any:
+    """Return a babelfish Language, memoized to skip the ISO table walk."""
+    return Language(code, country) if country else Language(code)
+
+
+@lru_cache(maxsize=64)
+def _languages_for(codes: Tuple[str, ...]) -> FrozenSet:
+    """Convert normalized ISO 639-2 codes into a frozenset of Language objects.
+
+    Portuguese variants are special-cased: OpenSubtitles.com returns the
+    country-qualified variants (pt-BR / pt-PT), so the 'por-pt' preference
+    must be requested as Portuguese from Portugal.
+    """
+    langs: Set = set()
+    for lang in codes:
+        if lang in ("por-pt", "pt-pt"):
+            try:
+                langs.add(_language('por', 'PT'))
+            except Exception:
+                langs.add(_language('por'))
+        elif lang in ("por", "pt", "por-br", "pt-br"):
+            langs.add(_language('por'))
+            try:
+                langs.add(_language('por', 'BR'))
+            except Exception:
+                pass  # Some babelfish versions may not support country codes
+        else:
+            langs.add(_language(lang))
+    return frozenset(langs)
+
+
 # Curated provider list: fast and reliable for multilingual subtitle search.
 # NOTE: the legacy "opensubtitles" XML-RPC provider was intentionally dropped —
 # OpenSubtitles.org disabled that API and it now only raises Unauthorized,
@@ -163,6 +215,9 @@ class SubtitleManager:
         """Initialize subtitle manager"""
         self.logger = get_logger()
         self.config = get_config()
+        # scan_video results keyed by (path, mtime_ns, size) — see _scan_video
+        self._video_cache: Dict[Tuple[str, int, int], Any] = {}
+        self._video_cache_lock = threading.Lock()
 
         if not HAS_SUBLIMINAL:
             self.logger.warning("Subliminal library not found. Subtitle downloading disabled.")
@@ -178,33 +233,36 @@ class SubtitleManager:
     # Shared helpers (single source of truth for languages / providers)
     # ------------------------------------------------------------------
 
-    def _build_languages(self, languages: Optional[List[str]]) -> Set:
+    def _build_languages(self, languages: Optional[List[str]]) -> FrozenSet:
         """Convert ISO 639-2 codes into a set of babelfish Language objects.
 
-        Portuguese variants are special-cased: OpenSubtitles.com returns the
-        country-qualified variants (pt-BR / pt-PT), so the new 'por-pt'
-        preference must be requested as Portuguese from Portugal.
+        The conversion is cached per distinct language list (see
+        _languages_for), so batch scans don't rebuild the same handful of
+        Language objects for every video.
         """
         if not languages:
             languages = self.config.kept_languages or ['por', 'eng']
 
-        langs: Set = set()
-        for lang in languages:
-            lang = str(lang).lower()
-            if lang in ("por-pt", "pt-pt"):
-                try:
-                    langs.add(Language('por', 'PT'))
-                except Exception:
-                    langs.add(Language('por'))
-            elif lang in ("por", "pt", "por-br", "pt-br"):
-                langs.add(Language('por'))
-                try:
-                    langs.add(Language('por', 'BR'))
-                except Exception:
-                    pass  # Some babelfish versions may not support country codes
-            else:
-                langs.add(Language(lang))
-        return langs
+        return _languages_for(tuple(sorted({str(lang).lower() for lang in languages})))
+
+    def _scan_video(self, video_path: Path) -> Any:
+        """Return subliminal's scan_video result, reusing it while the file is unchanged.
+
+        scan_video hashes the first and last 64 KB of the file, so a search
+        followed by a download on the same video would otherwise read it twice.
+        """
+        st = video_path.stat()
+        key = (str(video_path), st.st_mtime_ns, st.st_size)
+        video = self._video_cache.get(key)
+        if video is None:
+            video = scan_video(video_path)
+            # Batch searches call this from a thread pool
+            with self._video_cache_lock:
+                if len(self._video_cache) >= _VIDEO_CACHE_SIZE:
+                    # dicts keep insertion order: drop the oldest entry (FIFO)
+                    self._video_cache.pop(next(iter(self._video_cache)))
+                self._video_cache[key] = video
+        return video
 
     def _language_country_code(self, language: Any) -> str:
         """Return a language object's country code (BR/PT/etc.), if present."""
@@ -477,7 +535,7 @@ class SubtitleManager:
             from concurrent.futures import ThreadPoolExecutor
             max_workers = min(8, max(2, (os.cpu_count() or 4)))
             with ThreadPoolExecutor(max_workers=max_workers) as pool:
-                future_to_path = {pool.submit(scan_video, vp): vp for vp in existing_videos}
+                future_to_path = {pool.submit(self._scan_video, vp): vp for vp in existing_videos}
                 for future in future_to_path:
                     vp = future_to_path[future]
                     try:
@@ -580,7 +638,7 @@ class SubtitleManager:
         """
         try:
             # Scan video for information (hash, size, etc.)
-            video = scan_video(video_path)
+            video = self._scan_video(video_path)
 
             # Download best subtitles using AsyncProviderPool for parallel queries
             subtitles = download_best_subtitles(
@@ -1071,17 +1129,7 @@ class SubtitleManager:
             lang = subtitle_result.language
             subtitle_path = video_path.with_suffix(f".{lang}.srt")
             
-            # Handle encoding
-            encoding = getattr(sub, 'encoding', None) or 'utf-8'
-            try:
-                content = sub.content.decode(encoding)
-            except (UnicodeDecodeError, LookupError):
-                # Fallback to chardet
-                import chardet
-                detected = chardet.detect(sub.content)
-                content = sub.content.decode(detected.get('encoding', 'utf-8'), errors='replace')
-            
-            subtitle_path.write_text(content, encoding='utf-8')
+            self._write_subtitle(subtitle_path, sub)
             self.logger.info(_("Downloaded subtitle: %s") % subtitle_path.name)
             
             return subtitle_path
@@ -1092,6 +1140,41 @@ class SubtitleManager:
             traceback.print_exc()
             return None
 
+    def _decode_fallback(self, content: bytes) -> str:
+        """Decode subtitle bytes whose declared encoding failed, guessing the charset."""
+        try:
+            detected = _charset_detector.detect(content[:16384])
+            return content.decode(detected.get('encoding') or 'utf-8', errors='replace')
+        except Exception:
+            return content.decode('utf-8', errors='replace')
+
+    def _write_subtitle(self, subtitle_path: Path, sub: Any) -> None:
+        """Write a downloaded subtitle to disk as UTF-8 (without BOM).
+
+        Content that already is valid UTF-8 — the common case — is written
+        back byte-for-byte instead of being re-encoded from a decoded str.
+        """
+        data = sub.content
+        encoding = (getattr(sub, 'encoding', None) or 'utf-8').lower()
+
+        if encoding in ('utf-8', 'utf8', 'utf-8-sig'):
+            if data[:3] == b'\xef\xbb\xbf':
+                data = data[3:]
+            try:
+                data.decode('utf-8')  # validate only
+            except UnicodeDecodeError:
+                pass
+            else:
+                subtitle_path.write_bytes(data)
+                return
+
+        try:
+            content = sub.content.decode(encoding)
+        except (UnicodeDecodeError, LookupError):
+            content = self._decode_fallback(sub.content)
+
+        subtitle_path.write_text(content, encoding='utf-8')
+
     def _save_subtitles(self, video, video_path: Path, 
                         downloaded_subs: List) -> Dict[str, List[Path]]:
         """Save downloaded subtitles and normalize language codes to 3-letter format.
@@ -1103,7 +1186,7 @@ class SubtitleManager:
         from subliminal import download_subtitles as subliminal_download
 
         provider_configs = self._get_provider_configs()
-        result = {}
+        result: Dict[str, List[Path]] = defaultdict(list)
 
         for sub in downloaded_subs:
             try:
@@ -1118,27 +1201,11 @@ class SubtitleManager:
                 # Keep 3-letter codes, preserving pt-PT as Jellyfix's por-pt.
                 lang_alpha3 = self._subtitle_language_code(sub)
                 
-                if lang_alpha3 not in result:
-                    result[lang_alpha3] = []
-                
                 # Save directly to video_path location with 3-letter code
                 subtitle_path = video_path.with_suffix(f".{lang_alpha3}.srt")
                 
-                # Handle encoding
-                encoding = getattr(sub, 'encoding', None) or 'utf-8'
-                try:
-                    content = sub.content.decode(encoding)
-                except (UnicodeDecodeError, LookupError):
-                    # Fallback to chardet
-                    try:
-                        import chardet
-                        detected = chardet.detect(sub.content)
-                        content = sub.content.decode(detected.get('encoding', 'utf-8'), errors='replace')
-                    except Exception:
-                        content = sub.content.decode('utf-8', errors='replace')
-                
-                # Write to file
-                subtitle_path.write_text(content, encoding='utf-8')
+                # Write to file (normalized to UTF-8)
+                self._write_subtitle(subtitle_path, sub)
                 self.logger.info(f"Saved subtitle: {subtitle_path.name}")
                 
                 result[lang_alpha3].append(subtitle_path)
@@ -1148,7 +1215,7 @@ class SubtitleManager:
                 import traceback
                 traceback.print_exc()
 
-        return result
+        return dict(result)
 
     def list_providers(self) -> List[str]:
         """List available subtitle providers"""
@@ -15,13 +15,16 @@ import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
 
-from gi.repository import Gtk, Adw, Gio, Gdk
+from gi.repository import Gtk, Adw, Gio, Gdk, GLib
 from pathlib import Path
 from ..utils.config import APP_VERSION
 from ..utils.logger import get_logger
 from ..utils.i18n import _
-from .windows.main_window import JellyfixMainWindow
-from .windows.preferences_window import PreferencesWindow
+
+# Compiled from jellyfix.gresource.xml at package build time; missing when
+# running from a source checkout, in which case style.css is read directly.
+RESOURCE_FILE = Path(__file__).parent / 'jellyfix.gresource'
+CSS_RESOURCE_PATH = '/org/talesam/jellyfix/style.css'
 
 
 class JellyfixApplication(Adw.Application):
@@ -36,12 +39,15 @@ class JellyfixApplication(Adw.Application):
         
         self.logger = get_logger()
         self.window = None
+        self._api_dialog = None  # Created on first "Configure API Keys"
+        self._help_window = None  # Created on first "Help"
         self.initial_paths = []  # Paths passed via command line
     
     def do_activate(self):
         """Activate application (create main window)"""
         # Create window if not exists
         if not self.window:
+            from .windows.main_window import JellyfixMainWindow
             self.window = JellyfixMainWindow(application=self)
         
         # If we have initial paths, load them
@@ -76,20 +82,32 @@ class JellyfixApplication(Adw.Application):
         # Setup application actions
         self._setup_actions()
 
-    def _load_css(self):
-        """Load custom CSS styles"""
+    def _register_resources(self) -> bool:
+        """Register the bundled GResource, returning False if it isn't available"""
         try:
-            # Get CSS file path
-            gui_dir = Path(__file__).parent
-            css_file = gui_dir / 'style.css'
+            Gio.resources_register(Gio.Resource.load(str(RESOURCE_FILE)))
+            return True
+        except GLib.Error:
+            return False
 
-            if not css_file.exists():
-                self.logger.warning(f"CSS file not found: {css_file}")
-                return
+    def _on_css_parsing_error(self, provider, section, error):
+        """Log a missing or broken stylesheet"""
+        self.logger.warning(f"CSS load failed: {error.message}")
 
-            # Load CSS
+    def _load_css(self):
+        """Load custom CSS styles"""
+        try:
             css_provider = Gtk.CssProvider()
-            css_provider.load_from_path(str(css_file))
+            # GTK4 reports unreadable or invalid CSS through this signal,
+            # not by raising from load_from_*()
+            css_provider.connect("parsing-error", self._on_css_parsing_error)
+
+            if self._register_resources():
+                css_provider.load_from_resource(CSS_RESOURCE_PATH)
+            else:
+                # Development mode: no compiled bundle, read the stylesheet
+                css_file = Path(__file__).parent / 'style.css'
+                css_provider.load_from_path(str(css_file))
 
             # Apply to display
             Gtk.StyleContext.add_provider_for_display(
@@ -105,37 +123,22 @@ class JellyfixApplication(Adw.Application):
     
     def _setup_actions(self):
         """Setup application-level actions"""
-        # Quit action
-        quit_action = Gio.SimpleAction.new("quit", None)
-        quit_action.connect("activate", lambda *args: self.quit())
-        self.add_action(quit_action)
-
-        # About action
-        about_action = Gio.SimpleAction.new("about", None)
-        about_action.connect("activate", self._on_about)
-        self.add_action(about_action)
-
-        # Preferences action
-        preferences_action = Gio.SimpleAction.new("preferences", None)
-        preferences_action.connect("activate", self._on_preferences)
-        self.add_action(preferences_action)
-
-        # Configure API action
-        configure_api_action = Gio.SimpleAction.new("configure_api", None)
-        configure_api_action.connect("activate", self._on_configure_api)
-        self.add_action(configure_api_action)
-
-        # Help action
-        help_action = Gio.SimpleAction.new("help", None)
-        help_action.connect("activate", self._on_help)
-        self.add_action(help_action)
+        # (name, activate) entries; PyGObject's add_action_entries builds the
+        # SimpleActions and passes a trailing user_data to each callback.
+        self.add_action_entries([
+            ("quit", lambda *args: self.quit()),
+            ("about", self._on_about),
+            ("preferences", self._on_preferences),
+            ("configure_api", self._on_configure_api),
+            ("help", self._on_help),
+        ])
 
         # Keyboard shortcuts
         self.set_accels_for_action("app.quit", ["<Control>q"])
         self.set_accels_for_action("app.preferences", ["<Control>comma"])
         self.set_accels_for_action("app.help", ["F1"])
     
-    def _on_about(self, action, param):
+    def _on_about(self, action, param, user_data=None):
         """Show about dialog"""
         about = Adw.AboutWindow(
             transient_for=self.window,
@@ -152,22 +155,25 @@ class JellyfixApplication(Adw.Application):
         )
         about.present()
     
-    def _on_preferences(self, action, param):
+    def _on_preferences(self, action, param, user_data=None):
         """Show preferences window"""
+        from .windows.preferences_window import PreferencesWindow
         preferences = PreferencesWindow(self.window)
         preferences.present()
 
-    def _on_configure_api(self, action, param):
+    def _on_configure_api(self, action, param, user_data=None):
         """Show API configuration dialog"""
         from .windows.api_config_dialog import APIConfigDialog
-        dialog = APIConfigDialog(self.window)
-        dialog.present()
+        if self._api_dialog is None:
+            self._api_dialog = APIConfigDialog(self.window)
+        self._api_dialog.present()
 
-    def _on_help(self, action, param):
+    def _on_help(self, action, param, user_data=None):
         """Show help window"""
         from .windows.help_window import HelpWindow
-        help_window = HelpWindow(self.window)
-        help_window.present()
+        if self._help_window is None:
+            self._help_window = HelpWindow(self.window)
+        self._help_window.present()
 
 
 def run_gui():
@@ -20,18 +20,32 @@ import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
 
-from gi.repository import Gtk, Adw, GLib
+from gi.repository import Gtk, Adw, GLib, Gio
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional, List, Callable
-
-from ...core.scanner import scan_library
+import errno
+import os
+import shutil
+import threading
+import time
+import traceback
+
+from ...core.scanner import scan_library, scan_library_concurrent, is_network_path
 from ...core.renamer import Renamer
 from ...core.metadata import MetadataFetcher
 from ...core.image_manager import ImageManager
 from ...utils.logger import get_logger
 from ...utils.config import get_config
+from ...utils.config_manager import get_config_manager
 from ...utils.i18n import _
 
+# Minimum seconds between progress updates posted to the main loop (~30 Hz)
+PROGRESS_INTERVAL = 0.033
+
+# Successful renames/deletes are logged in blocks of this many lines
+LOG_BATCH_SIZE = 256
+
 
 class OperationsHandler:
     """Handler for GUI operations"""
@@ -46,16 +60,57 @@ class OperationsHandler:
         self.window = window
         self.logger = get_logger()
         self.config = get_config()
-        self.metadata_fetcher = None
-        self.image_manager = None
         self.current_directory: Optional[Path] = None
         self.scanned_files: List[Path] = []
         self.operations: List = []
 
-        # Initialize metadata fetcher if enabled
-        if self.config.fetch_metadata:
-            self.metadata_fetcher = MetadataFetcher()
-            self.image_manager = ImageManager()
+        # Shared worker pool for scans, operation generation, poster downloads
+        # and execution, instead of spawning a thread per user action
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="jellyfix-op")
+
+        # Cancels the in-flight scan (new scan requested or window closed)
+        self._scan_cancellable: Optional[Gio.Cancellable] = None
+
+        # One cancellable per open file dialog, cancelled when the window closes
+        self._pending_dialogs: List[Gio.Cancellable] = []
+
+        # Created on first use (see properties below) so opening the window
+        # doesn't pay for HTTP sessions and caches a local rename never needs
+        self._metadata_fetcher: Optional[MetadataFetcher] = None
+        self._image_manager: Optional[ImageManager] = None
+        self._lazy_lock = threading.Lock()
+
+    @property
+    def metadata_fetcher(self) -> Optional[MetadataFetcher]:
+        """TMDB fetcher, or None when metadata fetching is disabled."""
+        if self._metadata_fetcher is None and self.config.fetch_metadata:
+            with self._lazy_lock:
+                if self._metadata_fetcher is None:
+                    self._metadata_fetcher = MetadataFetcher()
+        return self._metadata_fetcher
+
+    @property
+    def image_manager(self) -> Optional[ImageManager]:
+        """Poster downloader, or None when metadata fetching is disabled."""
+        if self._image_manager is None and self.config.fetch_metadata:
+            with self._lazy_lock:
+                if self._image_manager is None:
+                    self._image_manager = ImageManager()
+        return self._image_manager
+
+    def shutdown(self):
+        """Stop accepting background work; called when the window closes."""
+        for cancellable in self._pending_dialogs:
+            cancellable.cancel()
+        self._pending_dialogs.clear()
+        self.cancel_scan()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def cancel_scan(self):
+        """Cancel the scan currently running, if any."""
+        if self._scan_cancellable:
+            self._scan_cancellable.cancel()
+            self._scan_cancellable = None
 
     def select_directory(self, callback: Optional[Callable] = None):
         """
@@ -64,10 +119,7 @@ class OperationsHandler:
         Args:
             callback: Optional callback to run after selection
         """
-        from ...utils.config_manager import ConfigManager
-        from gi.repository import Gio
-        
-        config_manager = ConfigManager()
+        config_manager = get_config_manager()
         
         dialog = Gtk.FileDialog()
         dialog.set_title(_("Select Directory to Scan"))
@@ -79,7 +131,14 @@ class OperationsHandler:
             initial_folder = Gio.File.new_for_path(last_dir)
             dialog.set_initial_folder(initial_folder)
 
+        cancellable = Gio.Cancellable()
+        self._pending_dialogs.append(cancellable)
+
         def on_response(dialog, result):
+            if cancellable in self._pending_dialogs:
+                self._pending_dialogs.remove(cancellable)
+            if cancellable.is_cancelled():
+                return
             try:
                 folder = dialog.select_folder_finish(result)
                 if folder:
@@ -95,7 +154,7 @@ class OperationsHandler:
                 if "dismissed" not in str(e).lower():
                     self.logger.error(f"Error selecting directory: {e}")
 
-        dialog.select_folder(self.window, None, on_response)
+        dialog.select_folder(self.window, cancellable, on_response)
 
     def scan_directory(self, directory: Optional[Path] = None,
                       progress_callback: Optional[Callable] = None,
@@ -116,11 +175,25 @@ class OperationsHandler:
 
         self.logger.info(f"Scanning directory: {scan_dir}")
 
+        # Only the most recent scan may report back
+        self.cancel_scan()
+        cancellable = Gio.Cancellable()
+        self._scan_cancellable = cancellable
+
         def scan_task():
             """Background scan task"""
             try:
                 # Scan directory
-                scan_result = scan_library(scan_dir)
+                if self.config.network_scan or is_network_path(scan_dir):
+                    # Network mounts: keep many directory listings in flight
+                    scan_result = scan_library_concurrent(
+                        scan_dir, is_cancelled=cancellable.is_cancelled
+                    )
+                else:
+                    scan_result = scan_library(scan_dir, cancellable.is_cancelled)
+                if cancellable.is_cancelled():
+                    self.logger.debug(f"Scan cancelled: {scan_dir}")
+                    return
 
                 # Extract all files from scan result
                 all_files = (
@@ -135,14 +208,11 @@ class OperationsHandler:
 
             except Exception as e:
                 self.logger.error(f"Scan failed: {e}")
-                import traceback
                 traceback.print_exc()
                 GLib.idle_add(self._on_scan_error, str(e))
 
-        # Run scan in background thread
-        import threading
-        thread = threading.Thread(target=scan_task, daemon=True)
-        thread.start()
+        # Run on the shared worker pool
+        self._executor.submit(scan_task)
 
     def _on_scan_complete(self, scan_result, callback: Optional[Callable] = None):
         """
@@ -212,14 +282,11 @@ class OperationsHandler:
 
             except Exception as e:
                 self.logger.error(f"Operation generation failed: {e}")
-                import traceback
                 traceback.print_exc()
                 GLib.idle_add(self._on_operations_error, str(e))
 
-        # Run in background thread
-        import threading
-        thread = threading.Thread(target=generate_task, daemon=True)
-        thread.start()
+        # Run on the shared worker pool
+        self._executor.submit(generate_task)
 
     def _on_operations_complete(self, operations: List, callback: Optional[Callable] = None):
         """
@@ -278,10 +345,8 @@ class OperationsHandler:
                 self.logger.error(f"Poster download failed: {e}")
                 GLib.idle_add(self._on_poster_downloaded, None, callback)
 
-        # Run in background thread
-        import threading
-        thread = threading.Thread(target=download_task, daemon=True)
-        thread.start()
+        # Run on the shared worker pool
+        self._executor.submit(download_task)
 
     def _on_poster_downloaded(self, poster_path: Optional[Path],
                              callback: Optional[Callable] = None):
@@ -319,11 +384,12 @@ class OperationsHandler:
             self.logger.error("No operations to execute")
             return
 
-        # Check if in dry-run mode
+        # Dry-run: report straight back without building the execution task
         if self.config.dry_run:
-            self.logger.warning("Dry-run mode: operations will not be executed")
+            self.logger.warning(f"Dry-run mode: skipping execution of {len(ops)} operations")
             if complete_callback:
-                complete_callback(ops, dry_run=True)
+                # Same main-loop delivery as a real execution
+                GLib.idle_add(complete_callback, ops, True)
             return
 
         self.logger.info(f"Executing {len(ops)} operations")
@@ -331,49 +397,98 @@ class OperationsHandler:
         def execute_task():
             """Background execution task"""
             try:
-                import shutil
-
-                # Execute irreversible deletes last.
-                ordered_ops = sorted(
-                    ops,
-                    key=lambda op: getattr(op, 'operation_type', '') == 'delete'
-                )
+                # Resolve each op's paths and kind once; the loops below only
+                # touch locals. Irreversible deletes run last, after every
+                # move has succeeded.
+                plan = [(op, op.source, op.destination, getattr(op, 'operation_type', ''))
+                        for op in ops]
+                moves = [(op, src, dst) for op, src, dst, kind in plan if kind != 'delete']
+                deletes = [(op, src) for op, src, _, kind in plan if kind == 'delete']
+                total = len(ops)
+                done = 0
+                last_emit = 0.0
                 results = []
                 errors = []
-                source_folders = set()  # Track source folders for cleanup
-
-                for i, op in enumerate(ordered_ops):
-                    try:
-                        source = op.source
-                        destination = op.destination
-
-                        # Handle delete operations
-                        if getattr(op, 'operation_type', '') == 'delete':
-                            source.unlink()
-                            self.logger.success(f"Deleted: {source.name}")
-                            results.append(op)
+                # Source folders of the files that were actually moved
+                source_folders = set()
+                success_lines = []
+
+                def report_progress():
+                    """Forward progress to the UI at most ~30 times per second."""
+                    nonlocal last_emit
+                    if not progress_callback:
+                        return
+                    now = time.monotonic()
+                    if now - last_emit >= PROGRESS_INTERVAL or done == total:
+                        last_emit = now
+                        GLib.idle_add(progress_callback, done, total)
+
+                def log_success(line=None):
+                    """Buffer a success line; flush every LOG_BATCH_SIZE lines (or when called empty)."""
+                    if line:
+                        success_lines.append(line)
+                        if len(success_lines) < LOG_BATCH_SIZE:
+                            return
+                    if success_lines:
+                        self.logger.success("\n".join(success_lines))
+                        success_lines.clear()
+
+                # Destination folders already created by a move; each folder
+                # is made by the first move into it, so moves cancelled after
+                # a failure leave no empty folders behind
+                made_folders = set()
+                made_lock = threading.Lock()
+
+                # Moves are latency-bound on network mounts and slow disks, so
+                # run them concurrently. Chained renames (one op's destination
+                # is another op's source) must keep their order.
+                sources = {src for _, src, _ in moves}
+                chained = any(dst in sources for _, _, dst in moves)
+                workers = 1 if chained else max(1, min(16, len(moves)))
+
+                with ThreadPoolExecutor(max_workers=workers,
+                                        thread_name_prefix="jellyfix-move") as pool:
+                    futures = {pool.submit(self._apply_move, src, dst,
+                                           made_folders, made_lock): (op, src, dst)
+                               for op, src, dst in moves}
+                    for future in as_completed(futures):
+                        if future.cancelled():
+                            continue
+                        op, src, dst = futures[future]
+                        try:
+                            future.result()
+                        except Exception as e:
+                            # Keep the log in order: earlier successes first
+                            log_success()
+                            self.logger.error(f"Failed to rename {src.name}: {e}")
+                            errors.append((op, str(e)))
+                            # Stop at the first failure: drop moves not yet started
+                            for pending in futures:
+                                pending.cancel()
                             continue
 
-                        # Track source folder for cleanup
-                        source_folders.add(source.parent)
-
-                        # Create parent directory if needed
-                        destination.parent.mkdir(parents=True, exist_ok=True)
-
-                        # Move/rename the file
-                        shutil.move(str(source), str(destination))
-
-                        self.logger.success(f"Renamed: {source.name} → {destination.name}")
                         results.append(op)
+                        source_folders.add(src.parent)
+                        log_success(f"Renamed: {src.name} → {dst.name}")
+                        done += 1
+                        report_progress()
+
+                if not errors:
+                    for op, src in deletes:
+                        try:
+                            src.unlink()
+                            log_success(f"Deleted: {src.name}")
+                            results.append(op)
+                        except Exception as e:
+                            log_success()
+                            self.logger.error(f"Failed to delete {src.name}: {e}")
+                            errors.append((op, str(e)))
+                            break
 
-                    except Exception as e:
-                        self.logger.error(f"Failed to rename {op.source.name}: {e}")
-                        errors.append((op, str(e)))
-                        break
+                        done += 1
+                        report_progress()
 
-                    # Report progress
-                    if progress_callback:
-                        GLib.idle_add(progress_callback, i + 1, len(ordered_ops))
+                log_success()
 
                 # Clean up empty folders after moving files
                 self._cleanup_empty_folders(source_folders)
@@ -388,10 +503,33 @@ class OperationsHandler:
                 self.logger.error(f"Execution failed: {e}")
                 GLib.idle_add(self._on_execution_error, str(e))
 
-        # Run in background thread
-        import threading
-        thread = threading.Thread(target=execute_task, daemon=True)
-        thread.start()
+        # Run on the shared worker pool
+        self._executor.submit(execute_task)
+
+    def _apply_move(self, source: Path, destination: Path,
+                    made_folders: set, made_lock: threading.Lock):
+        """
+        Move/rename a single file (runs on a worker thread).
+
+        Args:
+            source: File to move
+            destination: Target path; its folder is created if needed
+            made_folders: Folders already created during this execution
+            made_lock: Guards made_folders across worker threads
+        """
+        folder = destination.parent
+        with made_lock:
+            if folder not in made_folders:
+                folder.mkdir(parents=True, exist_ok=True)
+                made_folders.add(folder)
+        try:
+            # Same-filesystem rename is a single syscall
+            os.rename(source, destination)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            # Cross-device: copy + delete
+            shutil.move(str(source), str(destination))
 
     def _cleanup_empty_folders(self, source_folders: set):
         """
@@ -401,28 +539,31 @@ class OperationsHandler:
         Args:
             source_folders: Set of folder paths to check for cleanup
         """
-        # Track all folders to check (including parents)
+        # Collect each folder and its ancestors once: the climb stops at the
+        # first folder already seen (siblings share their ancestors) or at
+        # root / top-level mount depth
         folders_to_check = set()
 
         for folder in source_folders:
-            # Add the folder and all its parents up to the work directory
             current = folder
-            while current and current != current.parent:
+            while current not in folders_to_check and len(current.parts) > 2:
                 folders_to_check.add(current)
                 current = current.parent
-                # Stop at root or work directory level (3 levels up from source usually)
-                if len(current.parts) <= 2:
-                    break
 
-        # Sort by path length (deepest first) to clean up from bottom to top
-        for folder in sorted(folders_to_check, key=lambda p: len(str(p)), reverse=True):
+        # Deepest first, so children are removed before their parents
+        for folder in sorted(folders_to_check, key=lambda p: len(p.parts), reverse=True):
             try:
-                if folder.exists() and folder.is_dir():
-                    # Check if folder is empty (no files or subdirectories)
-                    if not any(folder.iterdir()):
-                        folder.rmdir()
-                        self.logger.success(f"Removed empty folder: {folder.name}")
-            except Exception as e:
+                # Check if folder is empty: scandir stops at the first entry
+                # instead of listing the whole directory
+                with os.scandir(folder) as it:
+                    empty = next(it, None) is None
+                if empty:
+                    folder.rmdir()
+                    self.logger.success(f"Removed empty folder: {folder.name}")
+            except (FileNotFoundError, NotADirectoryError):
+                # Already gone, or replaced by a file: nothing to clean up
+                continue
+            except OSError as e:
                 self.logger.debug(f"Could not remove folder {folder}: {e}")
 
     def _on_execution_complete(self, results: List, callback: Optional[Callable] = None):
@@ -20,14 +20,47 @@ gi.require_version('Adw', '1')
 from gi.repository import Gtk, Adw, Gdk, GLib
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
+import time
 from ...utils.i18n import _
-from ...utils.config_manager import ConfigManager
+from ...utils.config_manager import get_config_manager
+
+# "Time ago" suffixes, translated once (gettext is bound when utils.i18n loads)
+_WEEKS_AGO = _("weeks ago")
+_DAYS_AGO = _("days ago")
+_HOURS_AGO = _("hours ago")
+_JUST_NOW = _("Just now")
 
 
 def _markup_escape(value) -> str:
     return GLib.markup_escape_text(str(value))
 
 
+@lru_cache(maxsize=256)
+def _format_time_ago_cached(timestamp, now_bucket: int) -> str:
+    """Format an epoch timestamp relative to now_bucket (minutes since the epoch).
+
+    Keying on the minute bucket lets repeated refreshes reuse the formatted
+    result while still invalidating it once a minute. ISO strings written by
+    older versions are still accepted.
+    """
+    try:
+        if isinstance(timestamp, str):
+            timestamp = datetime.fromisoformat(timestamp).timestamp()
+        diff = now_bucket * 60 - float(timestamp)
+
+        if diff > 8 * 86400:
+            return f"{int(diff // 604800)} " + _WEEKS_AGO
+        elif diff > 86400:
+            return f"{int(diff // 86400)} " + _DAYS_AGO
+        elif diff > 3600:
+            return f"{int(diff // 3600)} " + _HOURS_AGO
+        else:
+            return _JUST_NOW
+    except Exception:
+        return ""
+
+
 class DashboardView(Gtk.Box):
     """Dashboard view widget with Welcome Screen"""
 
@@ -44,7 +77,17 @@ class DashboardView(Gtk.Box):
         # Store callbacks
         self.on_scan_clicked = on_scan_clicked
         self.on_process_clicked = on_process_clicked
-        self.config_manager = ConfigManager()
+        self.config_manager = get_config_manager()
+
+        # Recent libraries group and its rows keyed by path, in display order
+        self.recent_group = None
+        self._recent_rows = {}
+        self._clear_recent_row = None
+
+        # Drop zone highlight state; leave is delayed so crossing child
+        # widgets during a drag doesn't toggle the CSS class back and forth
+        self._drop_active = False
+        self._drag_leave_id = 0
 
         # Set expansion
         self.set_vexpand(True)
@@ -151,67 +194,54 @@ class DashboardView(Gtk.Box):
         )
         self.recent_group.set_margin_top(16)
 
+        self._recent_rows = {}
         for lib in recent_libs:
-            path = lib.get('path', '')
-            timestamp = lib.get('timestamp', '')
-
-            # Format time ago
-            time_text = self._format_time_ago(timestamp)
-
-            row = Adw.ActionRow(
-                title=_markup_escape(Path(path).name),
-                subtitle=_markup_escape(path),
-                activatable=True
-            )
-            row.add_prefix(Gtk.Image.new_from_icon_name("folder-symbolic"))
-
-            # Time label
-            time_label = Gtk.Label(label=time_text)
-            time_label.add_css_class("dim-label")
-            row.add_suffix(time_label)
-
-            row.add_suffix(Gtk.Image.new_from_icon_name("go-next-symbolic"))
-
-            # Store path for callback
-            row.library_path = path
-            row.connect("activated", self._on_recent_library_clicked)
-
+            row = self._create_recent_row(lib.get('path', ''))
+            row.time_label.set_label(self._format_time_ago(lib.get('timestamp', '')))
+            self._recent_rows[row.library_path] = row
             self.recent_group.add(row)
 
         # Add clear button
-        clear_row = Adw.ActionRow(
+        self._clear_recent_row = Adw.ActionRow(
             title=_("Clear recent libraries"),
             activatable=True
         )
-        clear_row.add_prefix(Gtk.Image.new_from_icon_name("user-trash-symbolic"))
-        clear_row.add_css_class("destructive-action")
-        clear_row.connect("activated", self._on_clear_recent_clicked)
-        self.recent_group.add(clear_row)
+        self._clear_recent_row.add_prefix(Gtk.Image.new_from_icon_name("user-trash-symbolic"))
+        self._clear_recent_row.add_css_class("destructive-action")
+        self._clear_recent_row.connect("activated", self._on_clear_recent_clicked)
+        self.recent_group.add(self._clear_recent_row)
 
         parent.append(self.recent_group)
 
+    def _create_recent_row(self, path: str) -> Adw.ActionRow:
+        """Create the row for one recent library (time label filled in by caller)"""
+        row = Adw.ActionRow(
+            title=_markup_escape(Path(path).name),
+            subtitle=_markup_escape(path),
+            activatable=True
+        )
+        row.add_prefix(Gtk.Image.new_from_icon_name("folder-symbolic"))
+
+        # Time label
+        row.time_label = Gtk.Label()
+        row.time_label.add_css_class("dim-label")
+        row.add_suffix(row.time_label)
+
+        row.add_suffix(Gtk.Image.new_from_icon_name("go-next-symbolic"))
+
+        # Store path for callback
+        row.library_path = path
+        row.connect("activated", self._on_recent_library_clicked)
+        return row
+
     def _on_clear_recent_clicked(self, row):
         """Handle clear recent libraries click"""
         self.config_manager.clear_recent_libraries()
         self.refresh_recent_libraries()
 
-    def _format_time_ago(self, timestamp_str: str) -> str:
-        """Format timestamp as time ago string"""
-        try:
-            timestamp = datetime.fromisoformat(timestamp_str)
-            now = datetime.now()
-            diff = now - timestamp
-
-            if diff.days > 7:
-                return f"{diff.days // 7} " + _("weeks ago")
-            elif diff.days > 0:
-                return f"{diff.days} " + _("days ago")
-            elif diff.seconds > 3600:
-                return f"{diff.seconds // 3600} " + _("hours ago")
-            else:
-                return _("Just now")
-        except Exception:
-            return ""
+    def _format_time_ago(self, timestamp) -> str:
+        """Format timestamp (epoch seconds, or legacy ISO string) as time ago string"""
+        return _format_time_ago_cached(timestamp, int(time.time()) // 60)
 
     def _setup_drag_drop(self):
         """Setup drag and drop for folder"""
@@ -225,16 +255,41 @@ class DashboardView(Gtk.Box):
 
     def _on_drag_enter(self, drop_target, x, y):
         """Handle drag enter"""
-        self.drop_zone.add_css_class("drop-active")
+        self._cancel_drag_leave()
+        self._set_drop_active(True)
         return Gdk.DragAction.COPY
 
     def _on_drag_leave(self, drop_target):
         """Handle drag leave"""
-        self.drop_zone.remove_css_class("drop-active")
+        if not self._drag_leave_id:
+            self._drag_leave_id = GLib.timeout_add(50, self._on_drag_leave_timeout)
+
+    def _on_drag_leave_timeout(self):
+        """Remove the highlight once the pointer has really left"""
+        self._drag_leave_id = 0
+        self._set_drop_active(False)
+        return False
+
+    def _cancel_drag_leave(self):
+        """Cancel a pending delayed leave"""
+        if self._drag_leave_id:
+            GLib.source_remove(self._drag_leave_id)
+            self._drag_leave_id = 0
+
+    def _set_drop_active(self, active: bool):
+        """Toggle the drop-active CSS class only when the state changes"""
+        if active == self._drop_active:
+            return
+        self._drop_active = active
+        if active:
+            self.drop_zone.add_css_class("drop-active")
+        else:
+            self.drop_zone.remove_css_class("drop-active")
 
     def _on_drop(self, drop_target, value, x, y):
         """Handle folder drop - supports multiple folders and files"""
-        self.drop_zone.remove_css_class("drop-active")
+        self._cancel_drag_leave()
+        self._set_drop_active(False)
 
         if isinstance(value, Gdk.FileList):
             # Get all files from the list
@@ -319,14 +374,48 @@ class DashboardView(Gtk.Box):
             self.on_scan_clicked(self)
 
     def refresh_recent_libraries(self):
-        """Refresh the recent libraries list"""
-        # Remove old recent group if exists
-        if hasattr(self, 'recent_group'):
-            parent = self.recent_group.get_parent()
-            if parent:
-                parent.remove(self.recent_group)
-
-        # Rebuild
-        content = self.get_first_child()
-        if content:
-            self._build_recent_libraries(content)
+        """Refresh the recent libraries list, reusing rows that are still listed"""
+        recent_libs = self.config_manager.get_recent_libraries(5)
+
+        if not recent_libs:
+            # Nothing to show: drop the whole group
+            if self.recent_group is not None:
+                parent = self.recent_group.get_parent()
+                if parent:
+                    parent.remove(self.recent_group)
+            self.recent_group = None
+            self._recent_rows = {}
+            return
+
+        if self.recent_group is None:
+            content = self.get_first_child()
+            if content:
+                self._build_recent_libraries(content)
+            return
+
+        paths = [lib.get('path', '') for lib in recent_libs]
+
+        # Remove rows for libraries that dropped off the list
+        for path in set(self._recent_rows) - set(paths):
+            self.recent_group.remove(self._recent_rows.pop(path))
+
+        # Create rows only for new libraries; refresh the time label on all
+        order_changed = list(self._recent_rows) != paths
+        rows = {}
+        for lib, path in zip(recent_libs, paths):
+            row = self._recent_rows.get(path)
+            if row is None:
+                row = self._create_recent_row(path)
+                order_changed = True
+            row.time_label.set_label(self._format_time_ago(lib.get('timestamp', '')))
+            rows[path] = row
+
+        if order_changed:
+            # PreferencesGroup only appends, so re-add the rows in order
+            for row in list(self._recent_rows.values()) + [self._clear_recent_row]:
+                self.recent_group.remove(row)
+            for row in rows.values():
+                self.recent_group.add(row)
+            self.recent_group.add(self._clear_recent_row)
+
+        self._recent_rows = rows
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# gui/widgets/icons.py - Shared themed icons
+#
+
+"""Themed icons shared by the widgets."""
+
+import gi
+gi.require_version('Gtk', '4.0')
+
+from gi.repository import Gio
+
+# Themed icons by name, created once and shared by every image that shows them
+_ICON_CACHE = {}
+
+
+def themed_icon(name: str) -> Gio.ThemedIcon:
+    """
+    Return the themed icon for name, creating it on first use.
+
+    Args:
+        name: Icon name (e.g. "folder-symbolic")
+
+    Returns:
+        Gio.ThemedIcon shared by all callers
+    """
+    icon = _ICON_CACHE.get(name)
+    if icon is None:
+        icon = _ICON_CACHE[name] = Gio.ThemedIcon.new(name)
+    return icon
@@ -19,85 +19,184 @@ import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
 
-from gi.repository import Gtk, Adw, GLib
+from gi.repository import Gtk, Adw, GLib, GObject, Gio
+from bisect import bisect_right
+from collections import OrderedDict
 from typing import Optional, Callable, List
+import re
 
 from ...utils.i18n import _
 from ...core.renamer import RenameOperation
+from .icons import themed_icon
+
+
+VIDEO_EXTS = {'.mp4', '.mkv', '.avi', '.mov', '.wmv', '.flv', '.webm', '.m4v', '.ts', '.mpg', '.mpeg'}
+SUBTITLE_EXTS = {'.srt', '.sub', '.ass', '.ssa', '.vtt'}
+IMAGE_EXTS = {'.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp'}
+
+# Language tags stripped from a subtitle stem before matching it to a video
+SUBTITLE_LANG_SUFFIXES = ('.por', '.eng', '.spa', '.fre', '.ger', '.ita', '.jpn', '.chi', '.kor')
+
+# Row prefix icon by operation type, for files without a type-specific icon
+_ICON_NAMES = {
+    'delete': 'user-trash-symbolic',
+    'move': 'folder-symbolic',
+    'move_rename': 'folder-symbolic',
+}
+_DEFAULT_ICON = 'document-edit-symbolic'
+
+# Filtered results kept per (filter, query), so backspacing is a lookup
+FILTER_CACHE_SIZE = 16
+
+# Operation types matched by each filter button (move_rename counts as both)
+FILTER_TYPES = {
+    'rename': ('rename', 'move_rename'),
+    'move': ('move', 'move_rename'),
+    'delete': ('delete',),
+}
+
+# From this many operations on, searches over a whole type bucket scan one
+# joined string with str.find (a C loop) instead of testing names one by one
+BLOB_SEARCH_MIN = 5000
+
+# Items added to the list model per main-loop iteration
+ITEM_CHUNK_SIZE = 500
 
 
 def _markup_escape(value) -> str:
     return GLib.markup_escape_text(str(value))
 
 
-class OperationRow(Adw.ActionRow):
-    """Single operation row"""
+def _char_bits(text: str) -> int:
+    """128-bit set of the characters in text (code points folded to 7 bits).
+
+    A name can only contain the query if its bits include all of the
+    query's bits, which is a cheap test to run before the substring scan.
+    """
+    bits = 0
+    for char in set(text):
+        bits |= 1 << (ord(char) & 127)
+    return bits
+
+
+def _row_content(operation: RenameOperation) -> tuple:
+    """
+    Compute what a row shows for an operation.
+
+    Returns:
+        Tuple (title markup, subtitle markup, icon name, CSS classes)
+    """
+    title = _markup_escape(operation.source.name)
+
+    # Subtitle shows the destination, with its folder if it changes
+    dest_name = operation.destination.name
+    if operation.changes_folder:
+        dest_name = f"{operation.destination.parent.name}/{dest_name}"
+    subtitle = f"→ {_markup_escape(dest_name)}"
+
+    # Determine file type and icon based on extension
+    ext = operation.source.suffix.lower()
+    css_classes = []
+
+    if ext in VIDEO_EXTS:
+        icon_name = 'video-x-generic-symbolic'
+        css_classes.append('video-row')
+    elif ext in SUBTITLE_EXTS:
+        icon_name = 'text-x-generic-symbolic'
+        css_classes.append('subtitle-row')
+    elif ext in IMAGE_EXTS:
+        icon_name = 'image-x-generic-symbolic'
+    else:
+        icon_name = _ICON_NAMES.get(operation.operation_type, _DEFAULT_ICON)
+
+    # Add visual styling for operation type
+    if operation.operation_type == 'delete':
+        css_classes.append('error')
+    elif operation.will_overwrite:
+        css_classes.append('warning')
+
+    return title, subtitle, icon_name, tuple(css_classes)
+
+
+def _item_key(operation: RenameOperation, is_subtitle: bool) -> tuple:
+    """Identity of a list entry across refreshes"""
+    return (operation.source, operation.destination, operation.operation_type, is_subtitle)
+
+
+class OpItem(GObject.Object):
+    """List model item wrapping one RenameOperation"""
+
+    __gtype_name__ = 'JellyfixOpItem'
 
     def __init__(self, operation: RenameOperation, index: int, is_subtitle: bool = False):
-        """
-        Initialize operation row.
+        super().__init__()
+        self.op = operation
+        self.index = index
+        self.is_subtitle = is_subtitle
+        # _row_content() result, computed on first bind and reused whenever
+        # the item scrolls back into view
+        self.content: Optional[tuple] = None
 
-        Args:
-            operation: RenameOperation instance
-            index: Operation index
-            is_subtitle: Whether this is a subtitle (for indentation)
-        """
+
+class OperationRow(Adw.ActionRow):
+    """Operation row, recycled by the list view factory for whichever item scrolls into view"""
+
+    def __init__(self):
+        """Initialize an empty row; content is set by bind()."""
         super().__init__()
 
-        self.operation = operation
-        self.index = index
+        self.item: Optional[OpItem] = None
+        self.operation: Optional[RenameOperation] = None
+        self.index = -1
 
-        # Set title to source filename
-        self.set_title(_markup_escape(operation.source.name))
+        self.prefix_icon = Gtk.Image()
+        self.add_prefix(self.prefix_icon)
+        self._icon_name: Optional[str] = None
+        # Type/state classes added by the current binding
+        self._css_classes: tuple = ()
 
-        # Set subtitle to destination
-        dest_name = operation.destination.name
-        if operation.source.parent != operation.destination.parent:
-            # Different folder, show relative path
-            dest_name = f"{operation.destination.parent.name}/{dest_name}"
+        # Make row activatable
+        self.set_activatable(True)
 
-        self.set_subtitle(f"→ {_markup_escape(dest_name)}")
+    def bind(self, item: OpItem):
+        """
+        Show an item's operation in this row.
 
-        # Determine file type and icon based on extension
-        ext = operation.source.suffix.lower()
-        
-        # Video extensions
-        video_exts = {'.mp4', '.mkv', '.avi', '.mov', '.wmv', '.flv', '.webm', '.m4v', '.ts', '.mpg', '.mpeg'}
-        # Subtitle extensions
-        subtitle_exts = {'.srt', '.sub', '.ass', '.ssa', '.vtt'}
-        # Image extensions
-        image_exts = {'.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp'}
-        
-        if ext in video_exts:
-            icon_name = 'video-x-generic-symbolic'
-            self.add_css_class('video-row')
-        elif ext in subtitle_exts:
-            icon_name = 'text-x-generic-symbolic'
-            self.add_css_class('subtitle-row')
-        elif ext in image_exts:
-            icon_name = 'image-x-generic-symbolic'
-        elif operation.operation_type == 'delete':
-            icon_name = 'user-trash-symbolic'
-        elif operation.operation_type == 'move' or operation.operation_type == 'move_rename':
-            icon_name = 'folder-symbolic'
-        else:
-            icon_name = 'document-edit-symbolic'
+        Args:
+            item: OpItem from the list model
+        """
+        if item.content is None:
+            item.content = _row_content(item.op)
+        title, subtitle, icon_name, css_classes = item.content
 
-        prefix_icon = Gtk.Image.new_from_icon_name(icon_name)
-        self.add_prefix(prefix_icon)
+        self.item = item
+        self.operation = item.op
+        self.index = item.index
+
+        self.set_title(title)
+        self.set_subtitle(subtitle)
+
+        # The row is reused across bindings; only touch what changes
+        if icon_name != self._icon_name:
+            self.prefix_icon.set_from_gicon(themed_icon(icon_name))
+            self._icon_name = icon_name
+
+        if css_classes != self._css_classes:
+            for css_class in self._css_classes:
+                self.remove_css_class(css_class)
+            for css_class in css_classes:
+                self.add_css_class(css_class)
+            self._css_classes = css_classes
 
-        # Add visual styling for operation type
-        if operation.operation_type == 'delete':
-            self.add_css_class('error')
-        elif operation.will_overwrite:
-            self.add_css_class('warning')
-        
         # Indent subtitles slightly
-        if is_subtitle:
-            self.set_margin_start(24)
+        self.set_margin_start(24 if item.is_subtitle else 0)
 
-        # Make row activatable
-        self.set_activatable(True)
+    def set_selected(self, selected: bool):
+        """Toggle the persistent click highlight (.row-selected)."""
+        if selected:
+            self.add_css_class('row-selected')
+        else:
+            self.remove_css_class('row-selected')
 
 
 class OperationsListView(Gtk.Box):
@@ -123,12 +222,46 @@ class OperationsListView(Gtk.Box):
         self.filtered_operations: List[RenameOperation] = []
         self.current_filter = "all"  # all, rename, move, delete
         self.search_text = ""
-        # Tracks (row, handler_id) so we can disconnect on every rebuild.
-        self._row_handlers: List = []
-        # Linha atualmente selecionada — recebe a classe CSS .row-selected
-        # para feedback visual ao usuário (Adw.ActionRow não mantém estado
-        # selecionado nativamente em PreferencesGroup).
-        self._selected_row: Optional[OperationRow] = None
+        # Item atualmente selecionado — sua linha recebe a classe CSS
+        # .row-selected para feedback visual ao usuário. As linhas são
+        # recicladas pelo ListView, então o estado fica no item.
+        self._selected_item: Optional[OpItem] = None
+        # Linhas atualmente ligadas a itens (apenas as visíveis)
+        self._bound_rows = set()
+        # Source id of the queued filter refresh (0 = none pending)
+        self._pending_refresh = 0
+        # Filter results for recent (filter, lowercased query) pairs; reset
+        # whenever the operations change
+        self._filter_cache: OrderedDict = OrderedDict()
+        self._last_filter_key = ("all", "")
+        # Grouped (operation, is_subtitle) pairs still being added to the
+        # model; a newer refresh bumps the generation and stops the old one
+        self._pending_items: List = []
+        self._populate_gen = 0
+        # Python-side mirror of the model's items and their _item_key()s,
+        # so a refresh can keep the unchanged runs (see _splice_changes)
+        self._items: List[OpItem] = []
+        self._item_keys: List[tuple] = []
+        # Per-operation values read by the filters, computed once in
+        # set_operations (parallel to self.operations)
+        # "source\ndestination", lowercased; search tokens never contain
+        # whitespace, so a token found here is in one of the two names
+        self._names_lower: List[str] = []
+        self._types: List[str] = []
+        self._char_bits: List[int] = []
+        # Indices behind filtered_operations; _display_current is False
+        # until they have been shown for the current operations
+        self._filtered_indices: List[int] = []
+        self._display_current = False
+        # _names_lower joined by NUL, plus each name's offset in it (large
+        # lists only, see BLOB_SEARCH_MIN)
+        self._names_blob: Optional[str] = None
+        self._name_starts: List[int] = []
+        # Indices of the operations matched by each filter button
+        self._by_type: dict = {}
+        # True while a background task (batch subtitle download) works on
+        # the listed files; Apply stays disabled meanwhile (see set_busy)
+        self._busy = False
 
         # Set expansion - CRITICAL for layout
         self.set_vexpand(True)
@@ -164,6 +297,8 @@ class OperationsListView(Gtk.Box):
         # Search entry
         self.search_entry = Gtk.SearchEntry()
         self.search_entry.set_placeholder_text(_("Search..."))
+        # Let GTK coalesce fast typing before emitting search-changed
+        self.search_entry.set_search_delay(150)
         self.search_entry.connect("search-changed", self._on_search_changed)
         toolbar.append(self.search_entry)
 
@@ -221,32 +356,41 @@ class OperationsListView(Gtk.Box):
 
         self.append(toolbar)
 
-        # Scrolled window
-        scrolled = Gtk.ScrolledWindow()
-        scrolled.set_vexpand(True)
-        scrolled.set_hexpand(True)
-        scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
-
-        # Operations list container
-        self.operations_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
-        self.operations_box.set_spacing(0)
+        # Empty state / list
+        self.content_stack = Gtk.Stack()
+        self.content_stack.set_vexpand(True)
+        self.content_stack.set_hexpand(True)
 
-        # Empty state
         self.empty_state = Adw.StatusPage(
             icon_name="document-properties-symbolic",
             title=_("No Operations"),
             description=_("Scan a directory to generate operations")
         )
-        self.operations_box.append(self.empty_state)
+        self.content_stack.add_named(self.empty_state, "empty")
+
+        # Operations list: GTK only creates rows for the visible items and
+        # re-binds them while scrolling
+        self.store = Gio.ListStore.new(OpItem)
 
-        # Operations group (hidden initially)
-        self.operations_group = Adw.PreferencesGroup()
-        self.operations_group.set_visible(False)
+        factory = Gtk.SignalListItemFactory()
+        factory.connect("setup", self._on_factory_setup)
+        factory.connect("bind", self._on_factory_bind)
+        factory.connect("unbind", self._on_factory_unbind)
 
-        self.operations_box.append(self.operations_group)
+        self.list_view = Gtk.ListView.new(Gtk.NoSelection.new(self.store), factory)
+        self.list_view.set_single_click_activate(True)
+        self.list_view.add_css_class("operations-listview")
+        self.list_view.connect("activate", self._on_row_activated)
+
+        scrolled = Gtk.ScrolledWindow()
+        scrolled.set_vexpand(True)
+        scrolled.set_hexpand(True)
+        scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
+        scrolled.set_child(self.list_view)
+        self.content_stack.add_named(scrolled, "list")
 
-        scrolled.set_child(self.operations_box)
-        self.append(scrolled)
+        self.content_stack.set_visible_child_name("empty")
+        self.append(self.content_stack)
 
         # Status bar with apply button
         self.status_bar = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
@@ -286,11 +430,9 @@ class OperationsListView(Gtk.Box):
             # User probably expects what they see to be processed, or all available.
             # Let's pass filtered operations to be consistent with "what I see is what I get"
             # BUT, we only want video operations.
-            video_exts = {'.mp4', '.mkv', '.avi', '.mov', '.wmv', '.flv', '.webm', '.m4v', '.ts', '.mpg', '.mpeg'}
-            
             videos = [
-                op for op in self.filtered_operations 
-                if op.source.suffix.lower() in video_exts
+                op for op in self.filtered_operations
+                if op.source.suffix.lower() in VIDEO_EXTS
             ]
             
             self.on_download_subs_clicked(videos)
@@ -303,149 +445,299 @@ class OperationsListView(Gtk.Box):
             operations: List of RenameOperation instances
         """
         self.operations = operations
+        self._names_lower = [
+            f"{op.source.name}\n{op.destination.name}".lower() for op in operations
+        ]
+        self._types = [op.operation_type for op in operations]
+        self._char_bits = [_char_bits(names) for names in self._names_lower]
+        if len(operations) >= BLOB_SEARCH_MIN:
+            self._names_blob = "\0".join(self._names_lower)
+            self._name_starts = []
+            offset = 0
+            for names in self._names_lower:
+                self._name_starts.append(offset)
+                offset += len(names) + 1
+        else:
+            self._names_blob = None
+            self._name_starts = []
+        self._by_type = {name: [] for name in FILTER_TYPES}
+        for i, op_type in enumerate(self._types):
+            for name, types in FILTER_TYPES.items():
+                if op_type in types:
+                    self._by_type[name].append(i)
+        self._filter_cache.clear()
+        self._display_current = False
+        # The list is refreshed right away; drop any queued refresh
+        if self._pending_refresh:
+            GLib.source_remove(self._pending_refresh)
+            self._pending_refresh = 0
         self._apply_filters()
 
         # Enable/disable apply button
-        self.apply_button.set_sensitive(len(operations) > 0)
+        self.apply_button.set_sensitive(len(operations) > 0 and not self._busy)
         
         # Enable/disable download button
         self.download_subs_btn.set_sensitive(len(operations) > 0)
 
+    def set_busy(self, busy: bool):
+        """
+        Disable Apply while a background task works on the listed files.
+
+        Args:
+            busy: True while the task runs
+        """
+        self._busy = busy
+        self.apply_button.set_sensitive(bool(self.operations) and not busy)
+
     def _apply_filters(self):
         """Apply current filters and search to operations"""
-        # Start with all operations
-        filtered = self.operations
-
-        # Apply type filter
-        if self.current_filter != "all":
-            if self.current_filter == "rename":
-                # Rename e move_rename contêm renomeação
-                filtered = [op for op in filtered if op.operation_type in ('rename', 'move_rename')]
-            elif self.current_filter == "move":
-                # Move e move_rename contêm movimentação
-                filtered = [op for op in filtered if op.operation_type in ('move', 'move_rename')]
-            else:
-                filtered = [op for op in filtered if op.operation_type == self.current_filter]
+        # Whitespace-separated terms must all match; normalizing the spacing
+        # lets "star  1080p" and "star 1080p " share a cache entry
+        search_lower = " ".join(self.search_text.lower().split())
+        key = (self.current_filter, search_lower)
+
+        indices = self._filter_cache.get(key)
+        if indices is not None:
+            self._filter_cache.move_to_end(key)
+        else:
+            indices = self._compute_filtered(search_lower)
+            self._filter_cache[key] = indices
+            if len(self._filter_cache) > FILTER_CACHE_SIZE:
+                self._filter_cache.popitem(last=False)
+
+        self._last_filter_key = key
+
+        # Same operations, same result (e.g. re-clicking the active filter,
+        # or a longer query matching the same items): leave the list as is
+        if self._display_current and indices == self._filtered_indices:
+            return
+
+        operations = self.operations
+        self._filtered_indices = indices
+        self.filtered_operations = [operations[i] for i in indices]
+        self._update_display()
+        self._display_current = True
+
+    def _compute_filtered(self, search_lower: str) -> List[int]:
+        """
+        Filter operations by type and search text.
+
+        When the query only extends the previous one under the same type
+        filter, the previous result is narrowed instead of the full list.
+
+        Args:
+            search_lower: Lowercased, space-normalized search text
+
+        Returns:
+            Indices into self.operations, in order
+        """
+        last_filter, last_search = self._last_filter_key
+        previous = self._filter_cache.get(self._last_filter_key)
+        if (previous is not None and last_search
+                and last_filter == self.current_filter
+                and search_lower.startswith(last_search)):
+            # Every term of the old query is a term (or the prefix of the
+            # last term) of the new one, so matches can only shrink
+            return self._search(previous, search_lower.split())
+
+        # Apply type filter (indices partitioned once in set_operations)
+        if self.current_filter == "all":
+            indices = range(len(self.operations))
+        else:
+            indices = self._by_type.get(self.current_filter, [])
 
         # Apply search filter
-        if self.search_text:
-            search_lower = self.search_text.lower()
-            filtered = [
-                op for op in filtered
-                if search_lower in op.source.name.lower()
-                or search_lower in op.destination.name.lower()
+        if search_lower:
+            terms = search_lower.split()
+            if self._names_blob is None:
+                return self._search(indices, terms)
+
+            # Large list: locate the longest term in the joined names first,
+            # then apply the type filter and remaining terms to those hits
+            hits = self._blob_search(max(terms, key=len))
+            if hits is None:
+                return self._search(indices, terms)
+            if self.current_filter != "all":
+                wanted = FILTER_TYPES.get(self.current_filter, ())
+                types = self._types
+                hits = [i for i in hits if types[i] in wanted]
+            return hits if len(terms) == 1 else self._search(hits, terms)
+
+        return list(indices)
+
+    def _blob_search(self, term: str) -> Optional[List[int]]:
+        """
+        Indices of all operations whose names contain term, found with
+        str.find over the joined names (the loop runs once per hit, not per name).
+
+        Args:
+            term: Lowercased search term (no whitespace)
+
+        Returns:
+            Matching indices, or None once the term matches too many
+            operations for this to beat testing each name (>1/32 of them)
+        """
+        blob = self._names_blob
+        starts = self._name_starts
+        last = len(starts) - 1
+        limit = len(starts) // 32
+        found = []
+
+        pos = blob.find(term)
+        while pos != -1:
+            i = bisect_right(starts, pos) - 1
+            found.append(i)
+            if i == last:
+                break
+            if len(found) > limit:
+                return None
+            # Skip the rest of this operation's names
+            pos = blob.find(term, starts[i + 1])
+
+        return found
+
+    def _search(self, indices, terms: List[str]) -> List[int]:
+        """
+        Keep the indices whose source or destination name contains every term.
+
+        Args:
+            indices: Candidate indices into self.operations
+            terms: Lowercased search terms
+        """
+        names = self._names_lower
+        char_bits = self._char_bits
+        query_bits = _char_bits("".join(terms))
+
+        if len(terms) == 1:
+            term = terms[0]
+            return [
+                i for i in indices
+                if char_bits[i] & query_bits == query_bits and term in names[i]
             ]
 
-        self.filtered_operations = filtered
-        self._update_display()
+        # One lookahead per term, evaluated by the C regex engine
+        matches = re.compile(
+            "".join(f"(?=.*{re.escape(term)})" for term in terms), re.DOTALL
+        ).match
+        return [
+            i for i in indices
+            if char_bits[i] & query_bits == query_bits and matches(names[i])
+        ]
 
     def _update_display(self):
         """Update the display with filtered operations, grouped by video"""
         operations = self.filtered_operations
 
-        # Disconnect handlers from previous rows before the old group is dropped,
-        # so we don't leave stale connections holding references to `self`.
-        for row, handler_id in self._row_handlers:
-            try:
-                row.disconnect(handler_id)
-            except (TypeError, RuntimeError):
-                # Row already destroyed by GTK — handler is gone too.
-                pass
-        self._row_handlers = []
-        # As linhas antigas vão ser descartadas; esquece a seleção anterior.
-        self._selected_row = None
-
-        # Clear existing rows - rebuild the group instead of removing children
-        # Remove old group from operations_box
-        self.operations_box.remove(self.operations_group)
-
-        # Create new operations group
-        self.operations_group = Adw.PreferencesGroup()
-        self.operations_group.set_visible(False)
-
-        # Add new group to box
-        self.operations_box.append(self.operations_group)
+        # A lista vai ser redesenhada; esquece a seleção anterior.
+        self._selected_item = None
+        for row in self._bound_rows:
+            row.set_selected(False)
+        # A partially populated model can't be diffed against the new grouping
+        model_complete = not self._pending_items
+        self._populate_gen += 1
+        self._pending_items = []
 
         if not operations:
             # Show empty state
-            self.empty_state.set_visible(True)
-            self.operations_group.set_visible(False)
+            self.store.remove_all()
+            self._items = []
+            self._item_keys = []
+            self.content_stack.set_visible_child_name("empty")
             self.status_label.set_text("")
             return
 
-        # Hide empty state, show operations
-        self.empty_state.set_visible(False)
-        self.operations_group.set_visible(True)
-
         # Separate videos from subtitles and other files
-        video_exts = {'.mp4', '.mkv', '.avi', '.mov', '.wmv', '.flv', '.webm', '.m4v', '.ts', '.mpg', '.mpeg'}
-        subtitle_exts = {'.srt', '.sub', '.ass', '.ssa', '.vtt'}
-        
         videos = []
         subtitles = []
         others = []
-        
+
         for op in operations:
             ext = op.source.suffix.lower()
-            if ext in video_exts:
+            if ext in VIDEO_EXTS:
                 videos.append(op)
-            elif ext in subtitle_exts:
+            elif ext in SUBTITLE_EXTS:
                 subtitles.append(op)
             else:
                 others.append(op)
         
         # Group subtitles with their videos by matching base name
         # Build a sorted list: video, then its subtitles, then next video, etc.
+        # Each subtitle goes to the first video whose stem equals its base
+        # name or prefixes its stem; only stems of the lengths the videos
+        # actually have are looked up, so this stays linear in the list size
+        first_video = {}
+        for v_idx, video in enumerate(videos):
+            first_video.setdefault(video.source.stem, v_idx)
+        stem_lengths = sorted({len(stem) for stem in first_video})
+
+        subs_by_video = {}
+        unmatched_subtitles = []
+        for sub in subtitles:
+            sub_stem = sub.source.stem
+            # Remove language codes like .por, .eng from subtitle stem
+            base_sub = sub_stem
+            for lang in SUBTITLE_LANG_SUFFIXES:
+                if base_sub.lower().endswith(lang):
+                    base_sub = base_sub[:-4]
+                    break
+
+            owner = first_video.get(base_sub)
+            for length in stem_lengths:
+                if length > len(sub_stem):
+                    break
+                v_idx = first_video.get(sub_stem[:length])
+                if v_idx is not None and (owner is None or v_idx < owner):
+                    owner = v_idx
+
+            if owner is None:
+                unmatched_subtitles.append(sub)
+            else:
+                subs_by_video.setdefault(owner, []).append(sub)
+
         grouped_operations = []
-        used_subtitle_indices = set()  # Use indices since RenameOperation isn't hashable
-        
-        for video in videos:
+        for v_idx, video in enumerate(videos):
             grouped_operations.append((video, False))  # (operation, is_subtitle)
-            
-            # Find matching subtitles (same base name without extension)
-            video_stem = video.source.stem
-            for idx, sub in enumerate(subtitles):
-                if idx in used_subtitle_indices:
-                    continue
-                # Check if subtitle matches video (starts with video name)
-                sub_stem = sub.source.stem
-                # Remove language codes like .por, .eng from subtitle stem
-                base_sub = sub_stem
-                for lang in ['.por', '.eng', '.spa', '.fre', '.ger', '.ita', '.jpn', '.chi', '.kor']:
-                    if base_sub.lower().endswith(lang):
-                        base_sub = base_sub[:-4]
-                        break
-                
-                if base_sub == video_stem or sub_stem.startswith(video_stem):
-                    grouped_operations.append((sub, True))
-                    used_subtitle_indices.add(idx)
-        
+            for sub in subs_by_video.get(v_idx, ()):
+                grouped_operations.append((sub, True))
+
         # Add remaining subtitles (not matched to videos)
-        for idx, sub in enumerate(subtitles):
-            if idx not in used_subtitle_indices:
-                grouped_operations.append((sub, False))
+        for sub in unmatched_subtitles:
+            grouped_operations.append((sub, False))
         
         # Add other files at the end
         for other in others:
             grouped_operations.append((other, False))
         
-        # Add operation rows in grouped order
-        for i, (operation, is_subtitle) in enumerate(grouped_operations):
-            row = OperationRow(operation, i, is_subtitle=is_subtitle)
+        keys = [_item_key(operation, is_subtitle) for operation, is_subtitle in grouped_operations]
+        if not (model_complete and self._splice_changes(grouped_operations, keys)):
+            # Replace the model contents with the first chunk right away; the
+            # rest is appended on idle so huge result sets don't block the UI
+            self._items = [
+                OpItem(operation, i, is_subtitle)
+                for i, (operation, is_subtitle) in enumerate(grouped_operations[:ITEM_CHUNK_SIZE])
+            ]
+            self._item_keys = keys
+            self.store.splice(0, self.store.get_n_items(), self._items)
 
-            # Connect activation signal and track it for future disconnect.
-            handler_id = row.connect("activated", self._on_row_activated)
-            self._row_handlers.append((row, handler_id))
+            if len(grouped_operations) > ITEM_CHUNK_SIZE:
+                self._pending_items = grouped_operations
+                GLib.idle_add(self._add_chunk, self._populate_gen)
 
-            self.operations_group.add(row)
+        self.content_stack.set_visible_child_name("list")
 
         # Update status
         total_ops = len(self.operations)
         shown_ops = len(operations)
 
-        rename_count = sum(1 for op in operations if op.operation_type == 'rename')
-        move_count = sum(1 for op in operations if op.operation_type == 'move')
-        delete_count = sum(1 for op in operations if op.operation_type == 'delete')
+        # Count types with list.count (a C loop) over the parallel type list
+        if shown_ops == total_ops:
+            shown_types = self._types
+        else:
+            types = self._types
+            shown_types = [types[i] for i in self._filtered_indices]
+        rename_count = shown_types.count('rename')
+        move_count = shown_types.count('move')
+        delete_count = shown_types.count('delete')
 
         status_parts = []
         if rename_count:
@@ -465,25 +757,125 @@ class OperationsListView(Gtk.Box):
 
         self.status_label.set_text(status_text)
 
-    def _on_row_activated(self, row: OperationRow):
+    def _splice_changes(self, grouped_operations: List, keys: List[tuple]) -> bool:
+        """
+        Update the model in place when it differs from the new grouping only
+        in one run: the common leading and trailing items are kept and just
+        the run between them is spliced, so a rescan that adds or drops a
+        few files only creates rows for those.
+
+        Args:
+            grouped_operations: New (operation, is_subtitle) pairs, in order
+            keys: _item_key() of each pair
+
+        Returns:
+            False if the changed run is too large, leaving the model untouched
+        """
+        old_keys = self._item_keys
+        n_old, n_new = len(old_keys), len(keys)
+        limit = min(n_old, n_new)
+
+        head = 0
+        while head < limit and old_keys[head] == keys[head]:
+            head += 1
+        tail = 0
+        while tail < limit - head and old_keys[n_old - 1 - tail] == keys[n_new - 1 - tail]:
+            tail += 1
+
+        if n_new - head - tail > ITEM_CHUNK_SIZE:
+            return False
+
+        new_items = [
+            OpItem(operation, i, is_subtitle)
+            for i, (operation, is_subtitle) in enumerate(grouped_operations[head:n_new - tail], head)
+        ]
+        kept_tail = self._items[n_old - tail:]
+        self.store.splice(head, n_old - head - tail, new_items)
+        self._items[head:n_old - tail] = new_items
+        self._item_keys = keys
+
+        # Kept items take this refresh's operation objects (a rescan creates
+        # new ones) and the tail moves to its new positions. Content such as
+        # the overwrite warning may differ for a new object, so it is
+        # recomputed and visible rows are re-bound
+        for i, item in enumerate(self._items[:head]):
+            self._retarget(item, grouped_operations[i][0])
+        for i, item in enumerate(kept_tail, n_new - tail):
+            self._retarget(item, grouped_operations[i][0])
+            item.index = i
+        for row in list(self._bound_rows):
+            if row.item is not None and row.operation is not row.item.op:
+                row.bind(row.item)
+        return True
+
+    @staticmethod
+    def _retarget(item: OpItem, operation: RenameOperation):
+        """Point a kept item at an equivalent operation object"""
+        if item.op is not operation:
+            item.op = operation
+            item.content = None
+
+    def _add_chunk(self, generation: int) -> bool:
+        """
+        Append the next chunk of pending items to the model (idle handler).
+
+        Args:
+            generation: Refresh this chunk belongs to; stale ones stop
+        """
+        if generation != self._populate_gen:
+            return False
+
+        start = self.store.get_n_items()
+        chunk = self._pending_items[start:start + ITEM_CHUNK_SIZE]
+        items = [
+            OpItem(operation, i, is_subtitle)
+            for i, (operation, is_subtitle) in enumerate(chunk, start)
+        ]
+        self.store.splice(start, 0, items)
+        self._items.extend(items)
+
+        if start + len(chunk) < len(self._pending_items):
+            return True  # More to add on the next idle
+
+        self._pending_items = []
+        return False  # Remove from GLib idle queue
+
+    def _on_factory_setup(self, factory, list_item: Gtk.ListItem):
+        """Create the reusable row for a list item"""
+        list_item.set_child(OperationRow())
+
+    def _on_factory_bind(self, factory, list_item: Gtk.ListItem):
+        """Show the list item's operation in its row"""
+        item = list_item.get_item()
+        row = list_item.get_child()
+        row.bind(item)
+        row.set_selected(item is self._selected_item)
+        self._bound_rows.add(row)
+
+    def _on_factory_unbind(self, factory, list_item: Gtk.ListItem):
+        """Forget a row that scrolled out of view"""
+        self._bound_rows.discard(list_item.get_child())
+
+    def _on_row_activated(self, list_view: Gtk.ListView, position: int):
         """
         Handle row activation.
 
         Args:
-            row: Activated row
+            list_view: Operations list view
+            position: Activated item position
         """
-        # Remove o destaque da linha anterior antes de aplicar na nova.
-        if self._selected_row is not None and self._selected_row is not row:
-            try:
-                self._selected_row.remove_css_class("row-selected")
-            except (RuntimeError, TypeError):
-                # Linha antiga já foi destruída pelo GTK
-                pass
-        row.add_css_class("row-selected")
-        self._selected_row = row
+        item = self.store.get_item(position)
+        if item is None:
+            return
+
+        # Move o destaque para a linha do novo item (só as linhas visíveis
+        # existem; as demais recebem o estado ao serem ligadas)
+        self._selected_item = item
+        for row in self._bound_rows:
+            row.set_selected(row.item is item)
 
         if self.on_operation_selected:
-            self.on_operation_selected(row.operation, row.index)
+            self.on_operation_selected(item.op, item.index)
 
     def _on_search_changed(self, entry: Gtk.SearchEntry):
         """
@@ -493,7 +885,7 @@ class OperationsListView(Gtk.Box):
             entry: Search entry widget
         """
         self.search_text = entry.get_text()
-        self._apply_filters()
+        self._queue_refresh()
 
     def _on_filter_changed(self, button: Gtk.ToggleButton, filter_type: str):
         """
@@ -505,7 +897,20 @@ class OperationsListView(Gtk.Box):
         """
         if button.get_active():
             self.current_filter = filter_type
-            self._apply_filters()
+            self._queue_refresh()
+
+    def _queue_refresh(self):
+        """Re-apply filters once on the next idle, however many changes arrive first"""
+        if not self._pending_refresh:
+            self._pending_refresh = GLib.idle_add(
+                self._do_refresh, priority=GLib.PRIORITY_DEFAULT_IDLE
+            )
+
+    def _do_refresh(self):
+        """Idle handler for _queue_refresh"""
+        self._pending_refresh = 0
+        self._apply_filters()
+        return False  # Remove from GLib idle queue
 
     def clear(self):
         """Clear all operations"""
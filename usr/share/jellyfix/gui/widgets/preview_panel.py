@@ -17,11 +17,53 @@ Shows:
 import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
+gi.require_version('GdkPixbuf', '2.0')
 
-from gi.repository import Gtk, Adw, Pango
+from gi.repository import Gtk, Adw, Gdk, GdkPixbuf, GLib, Pango
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
+import re
 
 from ...utils.i18n import _
+from ...utils.logger import get_logger
+from .icons import themed_icon
+
+
+# Decoded posters kept in memory, by file path
+POSTER_CACHE_SIZE = 64
+
+# Poster area size in logical pixels; larger files are decoded down to it
+POSTER_WIDTH = 200
+POSTER_HEIGHT = 300
+
+# Quality tags shown as a badge, in priority order
+_QUALITY_TAGS = ('2160p', '1080p', '720p', '480p', '4K')
+_QUALITY_RE = re.compile('|'.join(_QUALITY_TAGS), re.IGNORECASE)
+
+
+@lru_cache(maxsize=512)
+def _quality_for(filename: str) -> Optional[str]:
+    """Return the quality tag found in filename, if any (cached per name)."""
+    found = {m.group(0).lower() for m in _QUALITY_RE.finditer(filename)}
+    for tag in _QUALITY_TAGS:
+        if tag.lower() in found:
+            return tag
+    return None
+
+
+def _set_text(label: Gtk.Label, text: str):
+    """Set a label's text only when it differs (avoids a relayout)."""
+    if label.get_text() != text:
+        label.set_text(text)
+
+
+def _set_visible(widget: Gtk.Widget, visible: bool):
+    """Set a widget's visibility only when it differs (avoids a relayout)."""
+    if widget.get_visible() != visible:
+        widget.set_visible(visible)
 
 
 class PreviewPanel(Gtk.Box):
@@ -38,8 +80,21 @@ class PreviewPanel(Gtk.Box):
         # Add CSS class
         self.add_css_class("preview-panel")
 
+        self.logger = get_logger()
+
+        # Posters are decoded off the main thread; only the result for the
+        # latest requested path is shown
+        self._poster_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="jellyfix-poster")
+        self._poster_textures: OrderedDict = OrderedDict()
+        self._poster_key: Optional[str] = None
+        self.connect("destroy", self._on_destroy)
+
         # Build UI
         self._build_ui()
+
+    def _on_destroy(self, *_args):
+        """Stop the poster decoder with the panel"""
+        self._poster_executor.shutdown(wait=False, cancel_futures=True)
     
     def _build_ui(self):
         """Build preview panel UI"""
@@ -91,7 +146,7 @@ class PreviewPanel(Gtk.Box):
         
         # Poster image (optional, for movies)
         self.poster_image = Gtk.Picture()
-        self.poster_image.set_size_request(200, 300)
+        self.poster_image.set_size_request(POSTER_WIDTH, POSTER_HEIGHT)
         self.poster_image.set_content_fit(Gtk.ContentFit.CONTAIN)
         self.poster_image.set_halign(Gtk.Align.CENTER)
         self.poster_image.set_visible(False)
@@ -226,13 +281,66 @@ class PreviewPanel(Gtk.Box):
         Args:
             poster_path: Path to poster image
         """
-        if poster_path and poster_path.exists():
-            try:
-                self.poster_image.set_filename(str(poster_path))
-                self.poster_image.set_visible(True)
-            except Exception as e:
-                print(f"Error loading poster: {e}")
-                self.poster_image.set_visible(False)
+        if not poster_path:
+            self._poster_key = None
+            self.poster_image.set_visible(False)
+            return False
+
+        key = str(poster_path)
+        self._poster_key = key
+
+        texture = self._poster_textures.get(key)
+        if texture is not None:
+            self._poster_textures.move_to_end(key)
+            self._show_texture(texture)
+        else:
+            self._poster_executor.submit(self._decode_poster, key, self.get_scale_factor())
+        return False  # Remove from GLib idle queue (called via idle_add)
+
+    def _decode_poster(self, key: str, scale: int):
+        """
+        Decode a poster file into a texture (worker thread).
+
+        Files bigger than the poster area (in device pixels) are scaled
+        down while decoding, so only the displayed size is kept in memory.
+
+        Args:
+            key: Poster file path
+            scale: Widget scale factor, read on the main thread
+        """
+        max_width = POSTER_WIDTH * scale
+        max_height = POSTER_HEIGHT * scale
+        try:
+            file_format, width, height = GdkPixbuf.Pixbuf.get_file_info(key)
+            if file_format is not None and (width > max_width or height > max_height):
+                pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(key, max_width, max_height, True)
+                texture = Gdk.Texture.new_for_pixbuf(pixbuf)
+            else:
+                texture = Gdk.Texture.new_from_filename(key)
+        except Exception as e:
+            # Nothing reads the future, so report the failure here
+            self.logger.error(f"Error loading poster {key}: {e}")
+            texture = None
+        GLib.idle_add(self._on_poster_decoded, key, texture)
+
+    def _on_poster_decoded(self, key: str, texture: Optional[Gdk.Texture]):
+        """Cache a decoded poster and show it if it is still the one wanted"""
+        if texture is not None:
+            self._poster_textures[key] = texture
+            self._poster_textures.move_to_end(key)
+            if len(self._poster_textures) > POSTER_CACHE_SIZE:
+                self._poster_textures.popitem(last=False)
+
+        # A different poster (or none) was requested meanwhile
+        if key == self._poster_key:
+            self._show_texture(texture)
+        return False  # Remove from GLib idle queue
+
+    def _show_texture(self, texture: Optional[Gdk.Texture]):
+        """Show a decoded poster, or hide the poster area when there is none"""
+        if texture is not None:
+            self.poster_image.set_paintable(texture)
+            self.poster_image.set_visible(True)
         else:
             self.poster_image.set_visible(False)
     
@@ -243,61 +351,60 @@ class PreviewPanel(Gtk.Box):
         Args:
             operation: RenameOperation instance
         """
+        # Re-selecting the operation already shown changes nothing
+        if operation is self.current_operation:
+            return
+
         # Store current operation for search callback
         self.current_operation = operation
+
+        # A poster still decoding for the previous operation must not show up
+        self._poster_key = None
         
         # Hide empty state, show content
-        self.empty_state.set_visible(False)
-        self.preview_content.set_visible(True)
+        _set_visible(self.empty_state, False)
+        _set_visible(self.preview_content, True)
         
         # Show search button for all operations except 'delete'
         op_type = getattr(operation, 'operation_type', 'rename')
-        self.search_button.set_visible(op_type != 'delete')
+        _set_visible(self.search_button, op_type != 'delete')
         
         # Show download subs button for video files (all operations except 'delete')
         # Check extensions
         video_exts = {'.mp4', '.mkv', '.avi', '.mov', '.wmv', '.flv', '.webm', '.m4v', '.ts', '.mpg', '.mpeg'}
         is_video = operation.source.suffix.lower() in video_exts
-        self.download_subs_button.set_visible(is_video and op_type != 'delete')
+        _set_visible(self.download_subs_button, is_video and op_type != 'delete')
 
         # Set operation type
-        op_type = getattr(operation, 'operation_type', 'rename')
         if op_type == 'move':
-            self.operation_icon.set_from_icon_name("folder-symbolic")
-            self.operation_type_label.set_text(_("MOVE"))
+            icon_name, type_text = "folder-symbolic", _("MOVE")
         elif op_type == 'delete':
-            self.operation_icon.set_from_icon_name("user-trash-symbolic")
-            self.operation_type_label.set_text(_("DELETE"))
+            icon_name, type_text = "user-trash-symbolic", _("DELETE")
+        elif operation.changes_folder:
+            # Move + rename
+            icon_name, type_text = "document-edit-symbolic", _("MOVE + RENAME")
         else:
-            # Check if it's move+rename
-            source_parent = operation.source.parent
-            dest_parent = operation.destination.parent
-            if source_parent != dest_parent:
-                self.operation_icon.set_from_icon_name("document-edit-symbolic")
-                self.operation_type_label.set_text(_("MOVE + RENAME"))
-            else:
-                self.operation_icon.set_from_icon_name("document-edit-symbolic")
-                self.operation_type_label.set_text(_("RENAME"))
+            icon_name, type_text = "document-edit-symbolic", _("RENAME")
+
+        icon = themed_icon(icon_name)
+        if self.operation_icon.get_gicon() is not icon:
+            self.operation_icon.set_from_gicon(icon)
+        _set_text(self.operation_type_label, type_text)
         
         # Set From path
-        self.from_path_label.set_text(str(operation.source))
+        _set_text(self.from_path_label, operation.source_str)
         
         # Set To path
-        self.to_path_label.set_text(str(operation.destination))
+        _set_text(self.to_path_label, operation.destination_str)
         
         # Extract quality from filename if available
-        filename = operation.destination.name
-        quality = None
-        for q in ['2160p', '1080p', '720p', '480p', '4K']:
-            if q.lower() in filename.lower():
-                quality = q
-                break
-        
+        quality = _quality_for(operation.destination.name)
+
         if quality:
-            self.quality_badge.set_text(quality)
-            self.quality_box.set_visible(True)
+            _set_text(self.quality_badge, quality)
+            _set_visible(self.quality_box, True)
         else:
-            self.quality_box.set_visible(False)
+            _set_visible(self.quality_box, False)
     
     def clear(self):
         """Clear preview and show empty state"""
@@ -308,6 +415,7 @@ class PreviewPanel(Gtk.Box):
         self.search_button.set_visible(False)
         self.download_subs_button.set_visible(False)
         self.current_operation = None
+        self._poster_key = None
     
     def _on_search_clicked(self, button):
         """Handle search button click - open manual search dialog"""
@@ -6,9 +6,24 @@
 
 """Window classes for Jellyfix GUI"""
 
-from .main_window import JellyfixMainWindow
-from .preferences_window import PreferencesWindow
-from .search_dialog import SearchDialog
+import importlib
 
-__all__ = ['JellyfixMainWindow', 'PreferencesWindow', 'SearchDialog']
+__all__ = ['JellyfixMainWindow', 'PreferencesWindow', 'SearchDialog', 'HelpWindow']
 
+# Windows are imported on first access (PEP 562), so importing one window
+# module doesn't load every other window with it
+_LAZY_MODULES = {
+    'JellyfixMainWindow': '.main_window',
+    'PreferencesWindow': '.preferences_window',
+    'SearchDialog': '.search_dialog',
+    'HelpWindow': '.help_window',
+}
+
+
+def __getattr__(name):
+    module = _LAZY_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
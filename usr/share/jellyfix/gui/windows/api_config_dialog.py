@@ -8,15 +8,28 @@
 API Configuration dialog for TMDB key management.
 """
 
+import threading
+
 import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
 
-from gi.repository import Gtk, Adw
+from gi.repository import Gtk, Adw, GLib
 
 from ...utils.logger import get_logger
 from ...utils.i18n import _
-from ...utils.config_manager import ConfigManager
+from ...utils.config import get_config
+from ...utils.config_manager import get_config_manager
+from ...core.metadata import MetadataFetcher
+from ...core.subtitle_manager import SubtitleManager
+
+# Body of the "view key" dialog, assembled once from the existing msgids
+_MASKED_KEY_BODY = _('Masked key') + ': {masked}\n\n' + _('Full key stored in') + ': {path}'
+
+
+def _mask_key(key: str) -> str:
+    """Show only the first and last four characters of an API key"""
+    return f"{key[:4]}...{key[-4:]}" if len(key) > 8 else "***"
 
 
 class APIConfigDialog(Adw.Window):
@@ -32,14 +45,39 @@ class APIConfigDialog(Adw.Window):
         super().__init__(transient_for=parent, modal=True)
 
         self.logger = get_logger()
-        self.config_manager = ConfigManager()
+        self.config_manager = get_config_manager()
+        # Fixed for the process lifetime (~/.jellyfix/config.json)
+        self._config_path_str = self.config_manager.get_config_path()
+        self._dialogs = {}  # Message dialogs, built once and reused
 
         # Window properties
         self.set_title(_("API Configuration"))
         self.set_default_size(660, 680)
 
-        # Build UI
-        self._build_ui()
+        # Hidden rather than destroyed on close so the app can re-present it;
+        # the widget tree is built on first show
+        self.set_hide_on_close(True)
+        self._ui_built = False
+
+    def present(self):
+        """Present the dialog, building its UI on first show"""
+        if self._ui_built:
+            self._refresh_status()
+        else:
+            self._build_ui()
+            self._ui_built = True
+        super().present()
+
+    def _refresh_status(self):
+        """Update the status rows from the stored configuration"""
+        tmdb_key = self.config_manager.get_tmdb_api_key()
+        self.status_row.set_subtitle(
+            _("✓ Configured") if tmdb_key else _("✗ Not configured")
+        )
+        os_user, os_pass = self.config_manager.get_opensubtitles_credentials()
+        self.os_status_row.set_subtitle(
+            _("✓ Configured (%s)") % os_user if (os_user and os_pass) else _("✗ Not configured")
+        )
 
     def _build_ui(self):
         """Build dialog UI"""
@@ -74,7 +112,7 @@ class APIConfigDialog(Adw.Window):
         tmdb_group.add(self.status_row)
 
         # Config file path row
-        config_path = str(self.config_manager.get_config_path())
+        config_path = self._config_path_str
         config_row = Adw.ActionRow(
             title=_("Config file"),
             subtitle=config_path
@@ -98,47 +136,22 @@ class APIConfigDialog(Adw.Window):
         )
         os_group.add(self.os_status_row)
 
-        # Configure login button
-        os_configure_row = Adw.ActionRow(
-            title=_("Configure OpenSubtitles Login"),
-            subtitle=_("Enter your username and password")
+        self._add_action_row(
+            os_group, _("Configure OpenSubtitles Login"), _("Enter your username and password"),
+            _("Configure"), self._on_configure_opensubtitles, "suggested-action"
         )
-        os_configure_button = Gtk.Button(label=_("Configure"), valign=Gtk.Align.CENTER)
-        os_configure_button.add_css_class("suggested-action")
-        os_configure_button.connect("clicked", self._on_configure_opensubtitles)
-        os_configure_row.add_suffix(os_configure_button)
-        os_group.add(os_configure_row)
-
-        # Test login button
-        os_test_row = Adw.ActionRow(
-            title=_("Test OpenSubtitles Login"),
-            subtitle=_("Verify your credentials actually work")
+        self._add_action_row(
+            os_group, _("Test OpenSubtitles Login"), _("Verify your credentials actually work"),
+            _("Test"), self._on_test_opensubtitles
         )
-        os_test_button = Gtk.Button(label=_("Test"), valign=Gtk.Align.CENTER)
-        os_test_button.connect("clicked", self._on_test_opensubtitles)
-        os_test_row.add_suffix(os_test_button)
-        os_group.add(os_test_row)
-
-        # Remove login button
-        os_remove_row = Adw.ActionRow(
-            title=_("Remove OpenSubtitles Login"),
-            subtitle=_("Delete stored credentials")
+        self._add_action_row(
+            os_group, _("Remove OpenSubtitles Login"), _("Delete stored credentials"),
+            _("Remove"), self._on_remove_opensubtitles, "destructive-action"
         )
-        os_remove_button = Gtk.Button(label=_("Remove"), valign=Gtk.Align.CENTER)
-        os_remove_button.add_css_class("destructive-action")
-        os_remove_button.connect("clicked", self._on_remove_opensubtitles)
-        os_remove_row.add_suffix(os_remove_button)
-        os_group.add(os_remove_row)
-
-        # Create account help
-        os_help_row = Adw.ActionRow(
-            title=_("Create a free account"),
-            subtitle="https://www.opensubtitles.com/newuser"
+        self._add_action_row(
+            os_group, _("Create a free account"), "https://www.opensubtitles.com/newuser",
+            _("Open"), self._on_opensubtitles_signup
         )
-        os_help_button = Gtk.Button(label=_("Open"), valign=Gtk.Align.CENTER)
-        os_help_button.connect("clicked", self._on_opensubtitles_signup)
-        os_help_row.add_suffix(os_help_button)
-        os_group.add(os_help_row)
 
         self.prefs_page.add(os_group)
 
@@ -147,59 +160,26 @@ class APIConfigDialog(Adw.Window):
             title=_("Actions")
         )
 
-        # Configure key button
-        configure_row = Adw.ActionRow(
-            title=_("Configure TMDB API Key"),
-            subtitle=_("Enter your TMDB API key")
-        )
-        configure_button = Gtk.Button(
-            label=_("Configure"),
-            valign=Gtk.Align.CENTER
-        )
-        configure_button.add_css_class("suggested-action")
-        configure_button.connect("clicked", self._on_configure_clicked)
-        configure_row.add_suffix(configure_button)
-        actions_group.add(configure_row)
-
-        # View key button
-        view_row = Adw.ActionRow(
-            title=_("View Current Key"),
-            subtitle=_("Show masked API key")
+        self._add_action_row(
+            actions_group, _("Configure TMDB API Key"), _("Enter your TMDB API key"),
+            _("Configure"), self._on_configure_clicked, "suggested-action"
         )
-        view_button = Gtk.Button(
-            label=_("View"),
-            valign=Gtk.Align.CENTER
+        self._add_action_row(
+            actions_group, _("View Current Key"), _("Show masked API key"),
+            _("View"), self._on_view_clicked
         )
-        view_button.connect("clicked", self._on_view_clicked)
-        view_row.add_suffix(view_button)
-        actions_group.add(view_row)
-
-        # Test connection button
-        test_row = Adw.ActionRow(
-            title=_("Test TMDB Connection"),
-            subtitle=_("Verify API key is working")
-        )
-        test_button = Gtk.Button(
-            label=_("Test"),
-            valign=Gtk.Align.CENTER
-        )
-        test_button.connect("clicked", self._on_test_clicked)
-        test_row.add_suffix(test_button)
-        actions_group.add(test_row)
-
-        # Remove key button
-        remove_row = Adw.ActionRow(
-            title=_("Remove TMDB Key"),
-            subtitle=_("Delete stored API key")
+
+        # Spinner shown while the connection test runs
+        self.test_spinner = Gtk.Spinner(valign=Gtk.Align.CENTER)
+        self.test_spinner.set_visible(False)
+        self._add_action_row(
+            actions_group, _("Test TMDB Connection"), _("Verify API key is working"),
+            _("Test"), self._on_test_clicked, extra_suffix=self.test_spinner
         )
-        remove_button = Gtk.Button(
-            label=_("Remove"),
-            valign=Gtk.Align.CENTER
+        self._add_action_row(
+            actions_group, _("Remove TMDB Key"), _("Delete stored API key"),
+            _("Remove"), self._on_remove_clicked, "destructive-action"
         )
-        remove_button.add_css_class("destructive-action")
-        remove_button.connect("clicked", self._on_remove_clicked)
-        remove_row.add_suffix(remove_button)
-        actions_group.add(remove_row)
 
         self.prefs_page.add(actions_group)
 
@@ -208,18 +188,10 @@ class APIConfigDialog(Adw.Window):
             title=_("Help")
         )
 
-        # How to get key button
-        help_row = Adw.ActionRow(
-            title=_("How to Get TMDB API Key"),
-            subtitle=_("Step-by-step tutorial")
-        )
-        help_button = Gtk.Button(
-            label=_("Tutorial"),
-            valign=Gtk.Align.CENTER
+        self._add_action_row(
+            help_group, _("How to Get TMDB API Key"), _("Step-by-step tutorial"),
+            _("Tutorial"), self._on_help_clicked
         )
-        help_button.connect("clicked", self._on_help_clicked)
-        help_row.add_suffix(help_button)
-        help_group.add(help_row)
 
         self.prefs_page.add(help_group)
 
@@ -235,10 +207,69 @@ class APIConfigDialog(Adw.Window):
         # Set content
         self.set_content(self.toast_overlay)
 
+    def _add_action_row(self, group, title, subtitle, button_label, handler,
+                        css_class=None, extra_suffix=None):
+        """
+        Add a row with a single action button to a preferences group.
+
+        Args:
+            group: Adw.PreferencesGroup to add the row to
+            title: Row title
+            subtitle: Row subtitle
+            button_label: Button label
+            handler: "clicked" handler
+            css_class: Optional style class for the button
+            extra_suffix: Optional widget placed before the button
+        """
+        row = Adw.ActionRow(title=title, subtitle=subtitle)
+        if extra_suffix is not None:
+            row.add_suffix(extra_suffix)
+
+        button = Gtk.Button(label=button_label, valign=Gtk.Align.CENTER)
+        if css_class:
+            button.add_css_class(css_class)
+        button.connect("clicked", handler)
+        row.add_suffix(button)
+
+        group.add(row)
+        return row
+
     def _toast(self, message: str):
         """Show a toast inside this dialog."""
         self.toast_overlay.add_toast(Adw.Toast(title=message))
 
+    def _message_dialog(self, name, heading, body, responses=None,
+                        destructive=None, on_response=None):
+        """
+        Return the cached message dialog *name* with updated heading and body.
+
+        The dialog, its responses and its response handler are created the
+        first time; later calls only change the text.
+
+        Args:
+            name: Cache key
+            heading: Dialog heading
+            body: Dialog body
+            responses: (id, label) pairs, defaults to a single OK
+            destructive: Response id shown as destructive
+            on_response: Handler for the "response" signal
+        """
+        dialog = self._dialogs.get(name)
+        if dialog is None:
+            dialog = Adw.MessageDialog(transient_for=self)
+            dialog.set_hide_on_close(True)
+            for response_id, label in responses or (("ok", _("OK")),):
+                dialog.add_response(response_id, label)
+            if destructive:
+                dialog.set_response_appearance(destructive, Adw.ResponseAppearance.DESTRUCTIVE)
+            if on_response:
+                dialog.connect("response", on_response)
+            self._dialogs[name] = dialog
+
+        dialog.set_heading(heading)
+        dialog.set_body(body)
+        return dialog
+
     def _on_configure_clicked(self, button):
         """Handle configure button click"""
         dialog = Adw.MessageDialog(
@@ -265,7 +296,6 @@ class APIConfigDialog(Adw.Window):
                     self.logger.success("TMDB key saved")
 
                     # IMPORTANT: Update the config singleton in memory
-                    from ...utils.config import get_config
                     config = get_config()
                     config.tmdb_api_key = api_key
 
@@ -320,7 +350,6 @@ class APIConfigDialog(Adw.Window):
                     self.config_manager.set_opensubtitles_credentials(username, password)
 
                     # Update the in-memory config singleton
-                    from ...utils.config import get_config
                     config = get_config()
                     config.opensubtitles_username = username
                     config.opensubtitles_password = password
@@ -335,30 +364,27 @@ class APIConfigDialog(Adw.Window):
 
     def _on_remove_opensubtitles(self, button):
         """Handle OpenSubtitles login removal"""
-        dialog = Adw.MessageDialog(
-            transient_for=self,
-            heading=_("Remove OpenSubtitles Login?"),
-            body=_("This will delete your stored credentials. You will not be "
-                   "able to download from opensubtitles.com until you configure it again.")
-        )
-        dialog.add_response("cancel", _("Cancel"))
-        dialog.add_response("remove", _("Remove"))
-        dialog.set_response_appearance("remove", Adw.ResponseAppearance.DESTRUCTIVE)
-
-        def on_response(dialog, response):
-            if response == "remove":
-                self.config_manager.remove_opensubtitles_credentials()
-
-                from ...utils.config import get_config
-                config = get_config()
-                config.opensubtitles_username = ""
-                config.opensubtitles_password = ""
-
-                self.os_status_row.set_subtitle(_("✗ Not configured"))
-                self._toast(_("OpenSubtitles login removed"))
-
-        dialog.connect("response", on_response)
-        dialog.present()
+        self._message_dialog(
+            "remove_opensubtitles",
+            _("Remove OpenSubtitles Login?"),
+            _("This will delete your stored credentials. You will not be "
+              "able to download from opensubtitles.com until you configure it again."),
+            responses=(("cancel", _("Cancel")), ("remove", _("Remove"))),
+            destructive="remove",
+            on_response=self._on_remove_opensubtitles_response
+        ).present()
+
+    def _on_remove_opensubtitles_response(self, dialog, response):
+        """Remove the OpenSubtitles login once confirmed"""
+        if response == "remove":
+            self.config_manager.remove_opensubtitles_credentials()
+
+            config = get_config()
+            config.opensubtitles_username = ""
+            config.opensubtitles_password = ""
+
+            self.os_status_row.set_subtitle(_("✗ Not configured"))
+            self._toast(_("OpenSubtitles login removed"))
 
     def _on_opensubtitles_signup(self, button):
         """Open the opensubtitles.com signup page in the browser"""
@@ -373,7 +399,6 @@ class APIConfigDialog(Adw.Window):
 
         self._toast(_("Testing login…"))
 
-        from ...core.subtitle_manager import SubtitleManager
         ok, message = SubtitleManager().test_opensubtitles_login(user, pw)
 
         if ok:
@@ -388,94 +413,92 @@ class APIConfigDialog(Adw.Window):
         key = self.config_manager.get_tmdb_api_key()
 
         if key:
-            # Mask key
-            masked_key = f"{key[:4]}...{key[-4:]}" if len(key) > 8 else "***"
-
-            dialog = Adw.MessageDialog(
-                transient_for=self,
-                heading=_("Current TMDB API Key"),
-                body=f"{_('Masked key')}: {masked_key}\n\n{_('Full key stored in')}: {self.config_manager.get_config_path()}"
+            dialog = self._message_dialog(
+                "info",
+                _("Current TMDB API Key"),
+                _MASKED_KEY_BODY.format(
+                    masked=_mask_key(key),
+                    path=self._config_path_str
+                )
             )
         else:
-            dialog = Adw.MessageDialog(
-                transient_for=self,
-                heading=_("No API Key"),
-                body=_("No TMDB API key configured yet")
+            dialog = self._message_dialog(
+                "info",
+                _("No API Key"),
+                _("No TMDB API key configured yet")
             )
 
-        dialog.add_response("ok", _("OK"))
         dialog.present()
 
     def _on_test_clicked(self, button):
         """Handle test button click"""
-        from ...core.metadata import MetadataFetcher
-
         key = self.config_manager.get_tmdb_api_key()
         if not key:
-            dialog = Adw.MessageDialog(
-                transient_for=self,
-                heading=_("No API Key"),
-                body=_("Please configure TMDB API key first")
-            )
-            dialog.add_response("ok", _("OK"))
-            dialog.present()
+            self._message_dialog(
+                "info",
+                _("No API Key"),
+                _("Please configure TMDB API key first")
+            ).present()
             return
 
-        # Test connection
-        try:
-            fetcher = MetadataFetcher()
-            result = fetcher.search_movie("The Matrix", 1999)
-
-            if result:
-                dialog = Adw.MessageDialog(
-                    transient_for=self,
-                    heading=_("✓ Connection Successful"),
-                    body=_("TMDB API key is working correctly!\n\nTest search returned: {}").format(result.title)
-                )
-            else:
-                dialog = Adw.MessageDialog(
-                    transient_for=self,
-                    heading=_("⚠ Connection Failed"),
-                    body=_("Could not fetch data from TMDB. Please check your API key.")
-                )
-        except Exception as e:
-            dialog = Adw.MessageDialog(
-                transient_for=self,
-                heading=_("✗ Connection Error"),
-                body=_("Error testing connection: {}").format(str(e))
-            )
+        # Test connection off the main thread so the dialog stays responsive
+        button.set_sensitive(False)
+        self.test_spinner.set_visible(True)
+        self.test_spinner.start()
+
+        def do_test():
+            try:
+                result = MetadataFetcher().search_movie("The Matrix", 1999)
+                GLib.idle_add(self._show_test_result, button, result, None)
+            except Exception as e:
+                GLib.idle_add(self._show_test_result, button, None, str(e))
+
+        threading.Thread(target=do_test, daemon=True).start()
+
+    def _show_test_result(self, button, result, error):
+        """Show the TMDB connection test outcome (runs on the GTK thread)"""
+        self.test_spinner.stop()
+        self.test_spinner.set_visible(False)
+        button.set_sensitive(True)
+
+        if error is not None:
+            heading = _("✗ Connection Error")
+            body = _("Error testing connection: {}").format(error)
+        elif result:
+            heading = _("✓ Connection Successful")
+            body = _("TMDB API key is working correctly!\n\nTest search returned: {}").format(result.title)
+        else:
+            heading = _("⚠ Connection Failed")
+            body = _("Could not fetch data from TMDB. Please check your API key.")
 
-        dialog.add_response("ok", _("OK"))
-        dialog.present()
+        self._message_dialog("info", heading, body).present()
+        return False
 
     def _on_remove_clicked(self, button):
         """Handle remove button click"""
-        dialog = Adw.MessageDialog(
-            transient_for=self,
-            heading=_("Remove API Key?"),
-            body=_("This will delete your stored TMDB API key. You will need to configure it again.")
-        )
-        dialog.add_response("cancel", _("Cancel"))
-        dialog.add_response("remove", _("Remove"))
-        dialog.set_response_appearance("remove", Adw.ResponseAppearance.DESTRUCTIVE)
-
-        def on_response(dialog, response):
-            if response == "remove":
-                self.config_manager.remove_tmdb_api_key()
-
-                # IMPORTANT: Update the config singleton in memory
-                from ...utils.config import get_config
-                config = get_config()
-                config.tmdb_api_key = ""
-
-                self.status_row.set_subtitle(_("✗ Not configured"))
-                self.logger.info("TMDB key removed")
-
-                # Show toast
-                self._toast(_("API key removed"))
-
-        dialog.connect("response", on_response)
-        dialog.present()
+        self._message_dialog(
+            "remove_tmdb",
+            _("Remove API Key?"),
+            _("This will delete your stored TMDB API key. You will need to configure it again."),
+            responses=(("cancel", _("Cancel")), ("remove", _("Remove"))),
+            destructive="remove",
+            on_response=self._on_remove_response
+        ).present()
+
+    def _on_remove_response(self, dialog, response):
+        """Remove the TMDB key once confirmed"""
+        if response == "remove":
+            self.config_manager.remove_tmdb_api_key()
+
+            # IMPORTANT: Update the config singleton in memory
+            config = get_config()
+            config.tmdb_api_key = ""
+
+            self.status_row.set_subtitle(_("✗ Not configured"))
+            self.logger.info("TMDB key removed")
+
+            # Show toast
+            self._toast(_("API key removed"))
 
     def _on_help_clicked(self, button):
         """Handle help button click"""
@@ -495,10 +518,8 @@ The API key is free and allows you to:
 • Get accurate titles and release dates
 • Organize your library with TMDB IDs""")
 
-        dialog = Adw.MessageDialog(
-            transient_for=self,
-            heading=_("How to Get TMDB API Key"),
-            body=help_text
-        )
-        dialog.add_response("ok", _("OK"))
-        dialog.present()
+        self._message_dialog(
+            "help",
+            _("How to Get TMDB API Key"),
+            help_text
+        ).present()
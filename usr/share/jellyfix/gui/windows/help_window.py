@@ -12,77 +12,38 @@ import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
 
-from gi.repository import Gtk, Adw
+from gi.repository import Gtk, Adw, GLib, Pango
+from functools import lru_cache
+from pathlib import Path
 
 from ...utils.i18n import _
 from ...utils.config import APP_VERSION
 
+# Static widget tree; the bundled copy is registered by the application at
+# startup (see gui/app.py), the file next to style.css is the fallback
+UI_RESOURCE_PATH = '/org/talesam/jellyfix/help_window.ui'
+UI_FILE = Path(__file__).parent.parent / 'help_window.ui'
 
-class HelpWindow(Adw.Window):
-    """Help and documentation window"""
 
-    def __init__(self, parent):
-        """
-        Initialize help window.
-
-        Args:
-            parent: Parent window
-        """
-        super().__init__(transient_for=parent, modal=True)
+def _load_builder():
+    """Load help_window.ui from the GResource bundle, or from disk in a checkout"""
+    builder = Gtk.Builder()
+    try:
+        builder.add_from_resource(UI_RESOURCE_PATH)
+    except GLib.Error:
+        builder.add_from_file(str(UI_FILE))
+    return builder
 
-        # Window properties
-        self.set_title(_("Jellyfix Help"))
-        self.set_default_size(800, 600)
 
-        # Build UI
-        self._build_ui()
+@lru_cache(maxsize=None)
+def _help_sections():
+    """(title, body markup) of each help section, translated once per process.
 
-    def _build_ui(self):
-        """Build help UI"""
-        # Main box
-        main_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
-
-        # Header bar
-        header = Adw.HeaderBar()
-        main_box.append(header)
-
-        # Scrolled window
-        scrolled = Gtk.ScrolledWindow()
-        scrolled.set_vexpand(True)
-        scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
-
-        # Content box
-        content_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=20)
-        content_box.set_margin_start(40)
-        content_box.set_margin_end(40)
-        content_box.set_margin_top(20)
-        content_box.set_margin_bottom(20)
-
-        # Title
-        title_label = Gtk.Label()
-        title_label.set_markup('<span size="xx-large" weight="bold">🎬 Jellyfix</span>')
-        title_label.set_halign(Gtk.Align.CENTER)
-        content_box.append(title_label)
-
-        # Version
-        version_label = Gtk.Label()
-        version_label.set_markup(f'<span size="small">{_("Version")} {APP_VERSION}</span>')
-        version_label.set_halign(Gtk.Align.CENTER)
-        content_box.append(version_label)
-
-        # Description
-        desc_label = Gtk.Label()
-        desc_label.set_markup(f'<b>{_("Intelligent Jellyfin Library Organizer")}</b>')
-        desc_label.set_halign(Gtk.Align.CENTER)
-        content_box.append(desc_label)
-
-        # Separator
-        separator = Gtk.Separator()
-        content_box.append(separator)
-
-        # What It Does section
-        self._add_section(
-            content_box,
+    Built on first use rather than at import so the gettext domain set up by
+    utils.i18n is always in place.
+    """
+    return (
+        (
             _("What Jellyfix Does"),
             _(
                 "Jellyfix automatically organizes your media library following Jellyfin naming conventions:\n"
@@ -94,11 +55,8 @@ class HelpWindow(Adw.Window):
                 "• <b>Detects and adds quality tags</b> (1080p, 720p, etc)\n"
                 "• <b>Adds provider IDs</b> to folder names ([tmdbid-12345])"
             ),
-        )
-
-        # Examples section
-        self._add_section(
-            content_box,
+        ),
+        (
             _("Examples"),
             _(
                 "<b>Movies:</b>\n"
@@ -115,11 +73,8 @@ class HelpWindow(Adw.Window):
                 "  • Removes foreign languages (keeps configured languages only)\n"
                 "  • <b>NEVER</b> removes .forced.srt files"
             ),
-        )
-
-        # How to Use section
-        self._add_section(
-            content_box,
+        ),
+        (
             _("How to Use"),
             _(
                 "<b>1. Configure TMDB API Key (recommended)</b>\n"
@@ -143,11 +98,8 @@ class HelpWindow(Adw.Window):
                 "\n"
                 "<b>Tip:</b> Always review the preview before executing!"
             ),
-        )
-
-        # Settings section
-        self._add_section(
-            content_box,
+        ),
+        (
             _("Settings"),
             _(
                 "Configure Jellyfix behavior:\n"
@@ -158,11 +110,8 @@ class HelpWindow(Adw.Window):
                 "• <b>Quality Tags:</b> Add resolution tags to filenames\n"
                 "• <b>ffprobe:</b> Use ffprobe for accurate quality detection"
             ),
-        )
-
-        # Important Notes section
-        self._add_section(
-            content_box,
+        ),
+        (
             _("Important Notes"),
             _(
                 "⚠️ <b>Dry-run is DEFAULT</b>\n"
@@ -177,42 +126,90 @@ class HelpWindow(Adw.Window):
                 "🌍 <b>Customize kept languages</b>\n"
                 "Configure which subtitle languages to keep in Preferences."
             ),
-        )
+        ),
+    )
 
-        # Links section
-        links_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=10)
-        links_box.set_halign(Gtk.Align.CENTER)
 
-        links_title = Gtk.Label()
-        links_title.set_markup(f'<b>{_("Links")}</b>')
-        links_box.append(links_title)
+def _parse(markup):
+    """Split markup into (Pango.AttrList, plain text)."""
+    _ok, attrs, text, _accel = Pango.parse_markup(markup, -1, '\0')
+    return attrs, text
 
-        homepage_button = Gtk.LinkButton(
-            uri="https://github.com/talesam/jellyfix",
-            label=_("Homepage")
-        )
-        links_box.append(homepage_button)
 
-        issues_button = Gtk.LinkButton(
-            uri="https://github.com/talesam/jellyfix/issues",
-            label=_("Report Issues")
-        )
-        links_box.append(issues_button)
+@lru_cache(maxsize=None)
+def _parsed_sections():
+    """Help sections with their markup parsed once per process.
 
-        tmdb_button = Gtk.LinkButton(
-            uri="https://www.themoviedb.org/settings/api",
-            label=_("Get TMDB API Key")
+    Labels get the attribute list and plain text directly, so opening the
+    window doesn't run the markup parser again for every section.
+    """
+    return tuple(
+        (
+            _parse(f'<span size="large" weight="bold">{GLib.markup_escape_text(title)}</span>'),
+            _parse(content.strip()),
         )
-        links_box.append(tmdb_button)
+        for title, content in _help_sections()
+    )
+
+
+def _set_parsed(label, parsed):
+    """Apply a pre-parsed (attributes, text) pair to a label."""
+    attrs, text = parsed
+    label.set_text(text)
+    label.set_attributes(attrs)
+
+
+class HelpWindow(Adw.Window):
+    """Help and documentation window"""
+
+    def __init__(self, parent):
+        """
+        Initialize help window.
+
+        Args:
+            parent: Parent window
+        """
+        super().__init__(transient_for=parent, modal=True)
+
+        # Window properties
+        self.set_title(_("Jellyfix Help"))
+        self.set_default_size(800, 600)
+
+        # Content is static: keep the window around on close and build the
+        # widget tree only the first time it is shown
+        self.set_hide_on_close(True)
+        self._ui_built = False
+
+    def present(self):
+        """Present the window, building its UI on first show"""
+        self._ensure_ui()
+        super().present()
+
+    def _ensure_ui(self):
+        """Build the UI once; later presents reuse the same widget tree"""
+        if self._ui_built:
+            return
+        self._build_ui()
+        self._ui_built = True
+
+    def _build_ui(self):
+        """Build help UI from help_window.ui"""
+        builder = _load_builder()
 
-        content_box.append(links_box)
+        builder.get_object('version_label').set_text(f'{_("Version")} {APP_VERSION}')
+        builder.get_object('desc_label').set_text(_("Intelligent Jellyfin Library Organizer"))
+        builder.get_object('links_label').set_text(_("Links"))
+        builder.get_object('homepage_button').set_label(_("Homepage"))
+        builder.get_object('issues_button').set_label(_("Report Issues"))
+        builder.get_object('tmdb_button').set_label(_("Get TMDB API Key"))
 
-        # Add content to scrolled window
-        scrolled.set_child(content_box)
-        main_box.append(scrolled)
+        # Help sections
+        sections_box = builder.get_object('sections_box')
+        for title, content in _parsed_sections():
+            self._add_section(sections_box, title, content)
 
         # Set content
-        self.set_content(main_box)
+        self.set_content(builder.get_object('main_box'))
 
     def _add_section(self, parent, title, content):
         """
@@ -220,19 +217,19 @@ class HelpWindow(Adw.Window):
 
         Args:
             parent: Parent widget
-            title: Section title
-            content: Section content (markup)
+            title: Section title as (attributes, text)
+            content: Section content as (attributes, text)
         """
         # Title
         title_label = Gtk.Label()
-        title_label.set_markup(f'<span size="large" weight="bold">{title}</span>')
+        _set_parsed(title_label, title)
         title_label.set_halign(Gtk.Align.START)
         title_label.set_margin_top(10)
         parent.append(title_label)
 
         # Content
         content_label = Gtk.Label()
-        content_label.set_markup(content.strip())
+        _set_parsed(content_label, content)
         content_label.set_wrap(True)
         content_label.set_halign(Gtk.Align.START)
         content_label.set_xalign(0)
@@ -19,12 +19,28 @@ gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
 
 import os
+import re
+import stat
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from gi.repository import Adw, GLib, Gtk, Pango
+from gi.repository import Adw, Gio, GLib, Gtk, Pango
 
+from ...core.detector import MediaType, detect_media_type
+from ...core.metadata import MetadataFetcher
 from ...core.subtitle_manager import SubtitleManager
+from ...utils.config_manager import get_config_manager
+from ...utils.helpers import (
+    SUBTITLE_EXTENSIONS,
+    VIDEO_EXTENSIONS,
+    clean_filename,
+    extract_year,
+    is_video_file,
+    normalize_spaces,
+    parse_destination_for_search,
+)
 from ...utils.i18n import _
 from ...utils.logger import get_logger
 from ..handlers import OperationsHandler
@@ -32,6 +48,129 @@ from ..widgets.dashboard import DashboardView
 from ..widgets.operations_list import OperationsListView
 from ..widgets.preview_panel import PreviewPanel
 
+# File lists of ScanResult that _filter_scan_result narrows to the selection
+_SCAN_FILE_LISTS = (
+    'video_files', 'subtitle_files', 'image_files', 'other_files',
+    'variant_subtitles', 'no_lang_subtitles', 'foreign_subtitles',
+    'kept_subtitles', 'unwanted_images', 'nfo_files', 'non_media_files',
+)
+
+# "[tmdbid-N]" tag that the renamer writes into destination folder names
+_TMDB_ID_RE = re.compile(r'\[tmdbid-(\d+)\]')
+
+# Parallel TMDB lookups when prefetching original titles for a batch
+_TITLE_PREFETCH_WORKERS = 8
+
+# Extensions counted as subtitle files after a download (lowercase)
+_SUBTITLE_SUFFIXES = ('.srt', '.ass', '.ssa', '.sub', '.vtt')
+
+# Subtitle stem split into video base name + language code ("Movie.por.forced")
+_SUBTITLE_BASE_RE = re.compile(r'(.+?)\.([a-z]{2,3}\d?)(\.forced)?$', re.IGNORECASE)
+
+# Extensions whose stem is compared with a re-planned video's stem
+_RELATED_SUFFIXES = frozenset(SUBTITLE_EXTENSIONS | {'.nfo', '.jpg', '.jpeg', '.png'})
+
+# Environment variables gettext reads to pick the UI language
+_LANGUAGE_ENV_VARS = ('LANGUAGE', 'LC_ALL', 'LC_MESSAGES', 'LANG')
+
+# Application menus already built, by language (see _create_menu)
+_MENU_CACHE = {}
+
+# Quiet time after a selection before its poster is fetched
+POSTER_SELECT_DELAY_MS = 150
+
+# Seconds a TMDB lookup made for the preview stays reusable
+_META_CACHE_TTL = 600
+
+
+def _list_subtitles(directory):
+    """
+    Names of the subtitle files in a directory.
+
+    Uses os.scandir, whose entries already carry the file type on most
+    filesystems, and matches extensions on the name string instead of
+    building a Path per entry.
+
+    Args:
+        directory: Directory to list
+
+    Returns:
+        Set of file names (empty if the directory can't be read)
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return {
+                entry.name for entry in entries
+                if entry.name.lower().endswith(_SUBTITLE_SUFFIXES) and entry.is_file()
+            }
+    except OSError:
+        return set()
+
+
+def _related_keys(source):
+    """
+    Keys under which an operation is found when re-planning a video.
+
+    Args:
+        source: Source path of the operation
+
+    Returns:
+        Tuple (stem_key, parent_key): the normalized base name shared with
+        the video (subtitles, NFO and images) and the folder for
+        convention files; either may be None
+    """
+    suffix = source.suffix.lower()
+    if suffix not in _RELATED_SUFFIXES:
+        # No stem matching for these; only non-video files follow the folder
+        return None, (None if suffix in VIDEO_EXTENSIONS else source.parent)
+    file_stem = source.stem
+    if suffix in SUBTITLE_EXTENSIONS:
+        base_match = _SUBTITLE_BASE_RE.match(file_stem)
+        file_base = base_match.group(1) if base_match else file_stem
+        return normalize_spaces(file_base), None
+    # NFO and images match by stem; convention files (backdrop.jpg,
+    # folder.jpg, ...) follow any video of their folder
+    return normalize_spaces(file_stem), source.parent
+
+
+def _build_related_index(operations):
+    """
+    Index operations by source, normalized stem and folder.
+
+    Built once per metadata change so every re-planned video finds its
+    related operations with dictionary lookups instead of a pass over
+    the whole list.
+
+    Args:
+        operations: List of RenameOperation
+
+    Returns:
+        Dict with 'source', 'stem' and 'parent' maps to lists of operations
+    """
+    index = {'source': {}, 'stem': {}, 'parent': {}}
+    for op in operations:
+        _index_related_op(index, op)
+    return index
+
+
+def _index_related_op(index, op):
+    """Add an operation to a related-operations index"""
+    index['source'].setdefault(op.source, []).append(op)
+    stem_key, parent_key = _related_keys(op.source)
+    if stem_key is not None:
+        index['stem'].setdefault(stem_key, []).append(op)
+    if parent_key is not None:
+        index['parent'].setdefault(parent_key, []).append(op)
+
+
+def _unindex_related_op(index, op):
+    """Remove an operation from a related-operations index"""
+    stem_key, parent_key = _related_keys(op.source)
+    for table, key in (('source', op.source), ('stem', stem_key), ('parent', parent_key)):
+        bucket = index[table].get(key)
+        if bucket:
+            bucket[:] = [other for other in bucket if other is not op]
+
 
 class JellyfixMainWindow(Adw.ApplicationWindow):
     """Main application window"""
@@ -47,10 +186,55 @@ class JellyfixMainWindow(Adw.ApplicationWindow):
 
         self.logger = get_logger()
         self.subtitle_manager = SubtitleManager()
+        self.config_manager = get_config_manager()
 
         # Flag for background threads to bail out after window close
         self._destroyed = False
 
+        # Selection from the file manager or drag-and-drop that the next scan
+        # result is narrowed to (see _filter_scan_result)
+        self.selected_folders = []
+        self.selected_files = []
+
+        # Indefinite toasts shown while scanning / generating operations
+        self.current_scan_toast = None
+        self.current_gen_toast = None
+
+        # State of the running batch subtitle download (None when idle)
+        self.batch_progress = None
+        self._batch_source_files = None
+        # Latest (index, filename, completed) from the batch worker; at most
+        # one idle flush is queued at a time (see _post_batch_update)
+        self._batch_update_lock = threading.Lock()
+        self._pending_batch_update = None
+        self._batch_update_queued = False
+
+        # Poster fetches share a small pool; only the latest request may
+        # update the preview (see _poster_seq)
+        self._poster_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="poster")
+        self._poster_seq = 0
+        # Pending debounced poster fetch (see on_operation_selected; 0 = none)
+        self._poster_select_id = 0
+        # Posters warmed after each generation (see _prefetch_posters) use
+        # their own pool so they never queue ahead of the selected row
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="poster-prefetch")
+        self._prefetch_futures = []
+
+        # Scan results are filtered to the selection on their own thread;
+        # _scan_seq lets a newer scan discard an older filter's result
+        self._filter_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scan-filter")
+        self._scan_seq = 0
+
+        # Batch subtitle progress card, built on first use (see _show_batch_progress)
+        self._batch_revealer = None
+
+        # Rename confirmation, built on first use (see _confirm_rename)
+        self._confirm_dialog = None
+        self._confirm_callback = None
+
+        # Preview lookups keyed by request: key -> (value, time.monotonic())
+        self._meta_cache = {}
+
         # Window properties
         self.set_title(_("Jellyfix"))
         self.set_default_size(1200, 800)
@@ -69,15 +253,19 @@ class JellyfixMainWindow(Adw.ApplicationWindow):
     def _on_close_request(self, *_args):
         """Mark window as destroyed so background threads can short-circuit."""
         self._destroyed = True
+        if self._poster_select_id:
+            GLib.source_remove(self._poster_select_id)
+            self._poster_select_id = 0
+        self._poster_pool.shutdown(wait=False, cancel_futures=True)
+        self._prefetch_pool.shutdown(wait=False, cancel_futures=True)
+        self._filter_pool.shutdown(wait=False, cancel_futures=True)
+        self.operations_handler.shutdown()
         return False
 
     def _check_clear_recent_on_start(self):
         """Clear recent libraries on startup unless the user opted to keep them."""
-        from ...utils.config_manager import ConfigManager
-
-        config_manager = ConfigManager()
-        if not config_manager.get_keep_recent_libraries():
-            config_manager.clear_recent_libraries()
+        if not self.config_manager.get_keep_recent_libraries():
+            self.config_manager.clear_recent_libraries()
             self.logger.debug("Cleared recent libraries on startup")
 
     def _build_ui(self):
@@ -162,12 +350,15 @@ class JellyfixMainWindow(Adw.ApplicationWindow):
 
     def _create_menu(self):
         """
-        Create application menu.
+        Create application menu, or reuse the one built for the current language.
 
         Returns:
             Gio.Menu instance
         """
-        from gi.repository import Gio
+        language = tuple(os.environ.get(var) for var in _LANGUAGE_ENV_VARS)
+        menu = _MENU_CACHE.get(language)
+        if menu is not None:
+            return menu
 
         menu = Gio.Menu()
 
@@ -186,6 +377,7 @@ class JellyfixMainWindow(Adw.ApplicationWindow):
         # Quit
         menu.append(_("Quit"), "app.quit")
 
+        _MENU_CACHE[language] = menu
         return menu
 
     def on_scan_library(self, widget=None):
@@ -197,14 +389,16 @@ class JellyfixMainWindow(Adw.ApplicationWindow):
         """
         self.logger.info("Scan library requested")
 
+        if self._refuse_during_batch():
+            return
+
         # Check if directory was pre-selected (from dashboard drag-drop or recent)
         if widget and hasattr(widget, 'selected_directory'):
             directory = widget.selected_directory
             
             # Check for selected paths (specific files/folders from drag-drop)
             if hasattr(widget, 'selected_paths') and widget.selected_paths:
-                files = [p for p in widget.selected_paths if p.is_file()]
-                folders = [p for p in widget.selected_paths if p.is_dir()]
+                folders, files = self._split_folders_files(widget.selected_paths)
                 
                 if files:
                     self.selected_files = files
@@ -232,20 +426,20 @@ class JellyfixMainWindow(Adw.ApplicationWindow):
         Args:
             directory: Path to directory to scan
         """
-        from ...utils.config_manager import ConfigManager
-
         # Ensure directory is a Path object
         if not isinstance(directory, Path):
             directory = Path(directory)
 
         self.logger.info(f"Directory selected: {directory}")
 
+        # Any scan result still being filtered is now stale
+        self._scan_seq += 1
+
         # Update operations handler current directory
         self.operations_handler.current_directory = directory
 
         # Add to recent libraries
-        config_manager = ConfigManager()
-        config_manager.add_recent_library(str(directory))
+        self.config_manager.add_recent_library(str(directory))
 
         # Refresh dashboard recent libraries
         if hasattr(self.dashboard, 'refresh_recent_libraries'):
@@ -263,6 +457,29 @@ class JellyfixMainWindow(Adw.ApplicationWindow):
             complete_callback=self.on_scan_complete
         )
 
+    @staticmethod
+    def _split_folders_files(paths):
+        """
+        Classify paths into folders and regular files with one stat() each.
+
+        Args:
+            paths: Iterable of Path objects
+
+        Returns:
+            Tuple (folders, files); missing paths and special files are dropped
+        """
+        folders, files = [], []
+        for p in paths:
+            try:
+                mode = os.stat(p).st_mode
+            except OSError:
+                continue
+            if stat.S_ISDIR(mode):
+                folders.append(p)
+            elif stat.S_ISREG(mode):
+                files.append(p)
+        return folders, files
+
     def load_paths(self, paths):
         """
         Load paths passed from command line (via file manager extension).
@@ -275,16 +492,19 @@ class JellyfixMainWindow(Adw.ApplicationWindow):
             self.logger.warning("load_paths called with empty paths")
             return
 
+        if self._refuse_during_batch():
+            return
+
         self.logger.info(f"Loading {len(paths)} path(s) from command line")
-        for p in paths:
-            self.logger.debug(f"  Path: {p}")
+        if self.logger.debug_enabled:
+            for p in paths:
+                self.logger.debug(f"  Path: {p}")
 
         # Convert all paths to Path objects
         path_objects = [Path(p) for p in paths]
 
         # Check if we have folders selected
-        folders = [p for p in path_objects if p.is_dir()]
-        files = [p for p in path_objects if p.is_file()]
+        folders, files = self._split_folders_files(path_objects)
 
         self.logger.debug(f"Found {len(folders)} folders and {len(files)} files")
 
@@ -295,29 +515,33 @@ class JellyfixMainWindow(Adw.ApplicationWindow):
         if folders:
             # If folders are selected, use the first folder as the directory to scan
             # This is the most common case when right-clicking on a folder
-            self.logger.debug(f"Folders: {[str(f) for f in folders]}")
+            if self.logger.debug_enabled:
+                self.logger.debug(f"Folders: {[os.fspath(f) for f in folders]}")
             if len(folders) == 1:
                 directory = folders[0]  # Scan THIS folder, not its parent
                 self.logger.info(f"Single folder selected, scanning: {directory}")
                 # No filtering needed for single folder
             else:
                 # Multiple folders - scan parent but filter to selected folders only
+                # Stringified once; shared by commonpath and the log line
+                folder_strs = [os.fspath(f) for f in folders]
                 try:
-                    directory = Path(os.path.commonpath([str(f) for f in folders]))
+                    directory = Path(os.path.commonpath(folder_strs))
                 except ValueError:
                     directory = folders[0].parent
                 self.logger.info(f"Multiple folders selected, scanning parent: {directory}")
-                self.logger.info(f"Will filter to only these folders: {[str(f) for f in folders]}")
+                self.logger.info(f"Will filter to only these folders: {folder_strs}")
                 # Store selected folders for filtering
                 self.selected_folders = folders
         else:
             # Only files selected - use their common parent
-            parent_dirs = set(p.parent for p in files)
-            if len(parent_dirs) == 1:
-                directory = parent_dirs.pop()
+            # (deduplicated as strings, which is what commonpath takes anyway)
+            parent_strs = {os.fspath(p.parent) for p in files}
+            if len(parent_strs) == 1:
+                directory = Path(parent_strs.pop())
             else:
                 try:
-                    directory = Path(os.path.commonpath([str(d) for d in parent_dirs]))
+                    directory = Path(os.path.commonpath(parent_strs))
                 except ValueError:
                     directory = files[0].parent
             self.logger.info(f"Files selected, using parent: {directory}")
@@ -327,9 +551,8 @@ class JellyfixMainWindow(Adw.ApplicationWindow):
 
         self.logger.info(f"Will scan directory: {directory}")
 
-        # Start scan after a short delay to ensure UI is ready
-        from gi.repository import GLib
-        GLib.timeout_add(100, lambda: self._start_scan(directory) or False)
+        # Start scan once GTK has drained pending layout/paint work
+        GLib.idle_add(lambda: self._start_scan(directory) or False, priority=GLib.PRIORITY_LOW)
 
     def on_scan_complete(self, files):
         """
@@ -339,24 +562,72 @@ class JellyfixMainWindow(Adw.ApplicationWindow):
             files: ScanResult from scan
         """
         # Dismiss scanning toast
-        if hasattr(self, 'current_scan_toast'):
+        if self.current_scan_toast is not None:
             self.current_scan_toast.dismiss()
+            self.current_scan_toast = None
 
         # Apply folder/file filtering if selected
-        has_folders = hasattr(self, 'selected_folders') and self.selected_folders
-        has_files = hasattr(self, 'selected_files') and self.selected_files
-        
-        if has_folders or has_files:
+        if self.selected_folders or self.selected_files:
             self.logger.info("Filtering scan results...")
-            files = self._filter_scan_result(files)
-            
+            selected_folders = self.selected_folders
+            selected_files = self.selected_files
+
             # Clear filters
-            if hasattr(self, 'selected_folders'):
-                self.selected_folders = []
-            if hasattr(self, 'selected_files'):
-                self.selected_files = []
+            self.selected_folders = []
+            self.selected_files = []
+
+            # Filtering resolves every path, which can take seconds on a slow
+            # disk; run it off the main loop and continue back on it
+            seq = self._scan_seq
+            future = self._filter_pool.submit(
+                self._filter_scan_result, files, selected_folders, selected_files
+            )
+            future.add_done_callback(lambda f: self._on_scan_filtered(f, seq))
+            return
+
+        self.logger.debug("No filtering - processing all files from scan")
+        self._continue_scan_complete(files)
+
+    def _on_scan_filtered(self, future, seq):
+        """
+        Hand a finished background filter back to the main loop (worker thread).
+
+        Args:
+            future: Future of _filter_scan_result
+            seq: _scan_seq when the filter was started
+        """
+        if future.cancelled() or self._destroyed:
+            return
+        error = future.exception()
+        if error is not None:
+            self.logger.error(f"Filtering scan results failed: {error}")
+            GLib.idle_add(self._on_scan_filter_error, str(error), seq)
         else:
-            self.logger.debug("No filtering - processing all files from scan")
+            GLib.idle_add(self._continue_scan_complete, future.result(), seq)
+
+    def _on_scan_filter_error(self, error, seq):
+        """Report a failed scan filter, unless a newer scan has started"""
+        if seq == self._scan_seq and not self._destroyed:
+            dialog = Adw.MessageDialog(
+                transient_for=self,
+                heading=_("Scan Failed"),
+                body=error
+            )
+            dialog.add_response("ok", _("OK"))
+            dialog.present()
+        return False  # Remove from GLib idle queue
+
+    def _continue_scan_complete(self, files, seq=None):
+        """
+        Generate operations for a (possibly filtered) scan result.
+
+        Args:
+            files: ScanResult to generate operations for
+            seq: _scan_seq when a background filter started; its result is
+                dropped if another scan has started since
+        """
+        if seq is not None and (seq != self._scan_seq or self._destroyed):
+            return False
 
         # Get file counts from ScanResult
         total_files = files.total_files if hasattr(files, 'total_files') else len(files)
@@ -374,6 +645,7 @@ class JellyfixMainWindow(Adw.ApplicationWindow):
             scan_result=files,
             complete_callback=self.on_operations_generated
         )
+        return False  # Remove from GLib idle queue (called via idle_add)
 
     def on_operations_generated(self, operations):
         """
@@ -383,8 +655,9 @@ class JellyfixMainWindow(Adw.ApplicationWindow):
             operations: List of generated operations
         """
         # Dismiss generating toast
-        if hasattr(self, 'current_gen_toast'):
+        if self.current_gen_toast is not None:
             self.current_gen_toast.dismiss()
+            self.current_gen_toast = None
 
         self.logger.success(f"{len(operations)} operations generated")
 
@@ -399,22 +672,27 @@ class JellyfixMainWindow(Adw.ApplicationWindow):
         # Switch to operations view
         self.content_stack.set_visible_child_name("operations")
 
-    def _filter_scan_result(self, scan_result):
+        self._prefetch_posters(operations)
+
+    def _filter_scan_result(self, scan_result, selected_folders, selected_files):
         """
         Filter ScanResult to include only selected files/folders.
-        Uses self.selected_folders and self.selected_files.
+        Runs on a worker thread, so the selection is passed in rather than
+        read from the window.
 
         Args:
             scan_result: Original ScanResult from scanner
+            selected_folders: Folders to keep files from
+            selected_files: Files to keep (plus their subtitles)
 
         Returns:
             Filtered ScanResult
         """
         from ...core.scanner import ScanResult
-        
-        selected_folders = getattr(self, 'selected_folders', []) or []
-        selected_files = getattr(self, 'selected_files', []) or []
-        
+
+        if not selected_folders and not selected_files:
+            return scan_result
+
         # Convert selected files to resolved paths for robust comparison
         # Also create a set of selected file stems (names without extension) 
         # to catch related files (like subtitles) if we decide to
@@ -429,6 +707,19 @@ class JellyfixMainWindow(Adw.ApplicationWindow):
             except Exception:
                 pass
 
+        # Folders are resolved once into a set; each file then walks its own
+        # parents and hashes into it instead of scanning every folder.
+        # Folders that can't be resolved (e.g. a symlink loop) fall back to
+        # a plain path-prefix match, tested in one str.startswith call
+        folder_set = set()
+        unresolved_prefixes = []
+        for folder in selected_folders:
+            try:
+                folder_set.add(Path(folder).resolve())
+            except Exception:
+                unresolved_prefixes.append(os.path.join(os.fspath(folder), ""))
+        unresolved_prefixes = tuple(unresolved_prefixes)
+
         def is_selected(file_path):
             """Check if file matches selection filters"""
             try:
@@ -449,15 +740,16 @@ class JellyfixMainWindow(Adw.ApplicationWindow):
                                 return True
 
                 # Check folder filter
-                if selected_folders:
-                    for folder in selected_folders:
-                        try:
-                            folder_resolved = folder.resolve()
-                            if file_resolved == folder_resolved or folder_resolved in file_resolved.parents:
-                                return True
-                        except Exception:
-                            if str(file_path).startswith(str(folder)):
-                                return True
+                if folder_set:
+                    parent = file_resolved
+                    while True:
+                        if parent in folder_set:
+                            return True
+                        if parent == parent.parent:
+                            break
+                        parent = parent.parent
+                if unresolved_prefixes and os.fspath(file_path).startswith(unresolved_prefixes):
+                    return True
 
                 # If we have file filters but no match, return False
                 if selected_files:
@@ -474,20 +766,21 @@ class JellyfixMainWindow(Adw.ApplicationWindow):
                 self.logger.warning(f"Error checking file {file_path}: {e}")
                 return False
 
+        # The same path appears in several lists (every categorised subtitle
+        # is also in subtitle_files), so each unique path is checked once up
+        # front and the lists are then partitioned with plain dict lookups
+        file_lists = {name: getattr(scan_result, name) for name in _SCAN_FILE_LISTS}
+        keep = {}
+        for files in file_lists.values():
+            for f in files:
+                if f not in keep:
+                    keep[f] = is_selected(f)
+
         # Filter all file lists
-        filtered_result = ScanResult(
-            video_files=[f for f in scan_result.video_files if is_selected(f)],
-            subtitle_files=[f for f in scan_result.subtitle_files if is_selected(f)],
-            image_files=[f for f in scan_result.image_files if is_selected(f)],
-            other_files=[f for f in scan_result.other_files if is_selected(f)],
-            variant_subtitles=[f for f in scan_result.variant_subtitles if is_selected(f)],
-            no_lang_subtitles=[f for f in scan_result.no_lang_subtitles if is_selected(f)],
-            foreign_subtitles=[f for f in scan_result.foreign_subtitles if is_selected(f)],
-            kept_subtitles=[f for f in scan_result.kept_subtitles if is_selected(f)],
-            unwanted_images=[f for f in scan_result.unwanted_images if is_selected(f)],
-            nfo_files=[f for f in scan_result.nfo_files if is_selected(f)],
-            non_media_files=[f for f in scan_result.non_media_files if is_selected(f)],
-        )
+        filtered_result = ScanResult(**{
+            name: [f for f in files if keep[f]]
+            for name, files in file_lists.items()
+        })
 
         # Update statistics
         filtered_result.total_movies = len(filtered_result.video_files)  # Approximate
@@ -507,28 +800,17 @@ class JellyfixMainWindow(Adw.ApplicationWindow):
         Args:
             operations: List of operations to apply
         """
+        if self._refuse_during_batch():
+            return
+
         self.logger.info(f"Applying {len(operations)} operations")
 
         # Store operations in handler
         self.operations_handler.operations = operations
 
-        # Show confirmation dialog
-        dialog = Adw.MessageDialog(
-            transient_for=self,
-            heading=_("Apply Operations?"),
-            body=_("This will rename {} files. Continue?").format(len(operations)),
+        self._confirm_rename(
+            len(operations), _("Apply Operations?"), _("Apply"), self._execute_operations
         )
-        dialog.add_response("cancel", _("Cancel"))
-        dialog.add_response("apply", _("Apply"))
-        dialog.set_response_appearance("apply", Adw.ResponseAppearance.SUGGESTED)
-
-        def on_response(dialog, response):
-            if response == "apply":
-                self.logger.info("Executing operations")
-                self.operations_handler.execute_operations(complete_callback=self.on_execution_complete)
-
-        dialog.connect("response", on_response)
-        dialog.present()
 
     def on_process_files(self, widget=None):
         """
@@ -539,29 +821,57 @@ class JellyfixMainWindow(Adw.ApplicationWindow):
         """
         self.logger.info("Process files requested")
 
+        if self._refuse_during_batch():
+            return
+
         # Check if we have operations
         if not self.operations_handler.operations:
             self.logger.warning("No operations to process. Scan library first.")
             return
 
-        # Show confirmation dialog
-        dialog = Adw.MessageDialog(
-            transient_for=self,
-            heading=_("Execute Operations?"),
-            body=_("This will rename {} files. Continue?").format(len(self.operations_handler.operations)),
+        self._confirm_rename(
+            len(self.operations_handler.operations),
+            _("Execute Operations?"), _("Execute"), self._execute_operations,
         )
-        dialog.add_response("cancel", _("Cancel"))
-        dialog.add_response("execute", _("Execute"))
-        dialog.set_response_appearance("execute", Adw.ResponseAppearance.SUGGESTED)
 
-        def on_response(dialog, response):
-            if response == "execute":
-                self.logger.info("Executing operations")
-                self.operations_handler.execute_operations(complete_callback=self.on_execution_complete)
+    def _execute_operations(self):
+        """Run the operations stored in the handler"""
+        self.logger.info("Executing operations")
+        self.operations_handler.execute_operations(complete_callback=self.on_execution_complete)
 
-        dialog.connect("response", on_response)
+    def _confirm_rename(self, count, heading, action_label, on_confirm):
+        """
+        Ask before renaming files, reusing one confirmation dialog.
+
+        Args:
+            count: Number of files that will be renamed
+            heading: Dialog heading
+            action_label: Label of the confirming response
+            on_confirm: Called without arguments if the user confirms
+        """
+        dialog = self._confirm_dialog
+        if dialog is None:
+            dialog = Adw.MessageDialog(transient_for=self)
+            # Hidden rather than destroyed on response, so it can be shown again
+            dialog.set_hide_on_close(True)
+            dialog.add_response("cancel", _("Cancel"))
+            dialog.add_response("confirm", action_label)
+            dialog.set_response_appearance("confirm", Adw.ResponseAppearance.SUGGESTED)
+            dialog.connect("response", self._on_confirm_response)
+            self._confirm_dialog = dialog
+
+        dialog.set_heading(heading)
+        dialog.set_body(_("This will rename {} files. Continue?").format(count))
+        dialog.set_response_label("confirm", action_label)
+        self._confirm_callback = on_confirm
         dialog.present()
 
+    def _on_confirm_response(self, dialog, response):
+        """Handle a response from the rename confirmation dialog"""
+        callback, self._confirm_callback = self._confirm_callback, None
+        if response == "confirm" and callback:
+            callback()
+
     def on_execution_complete(self, results, dry_run=False):
         """
         Handle execution completion.
@@ -595,8 +905,116 @@ class JellyfixMainWindow(Adw.ApplicationWindow):
         # Show operation in preview panel
         self.preview_panel.show_operation(operation)
 
+        # Poster lookups hit the network; while the user is still moving
+        # through the list, only the row they stop on triggers one
+        if self._poster_select_id:
+            GLib.source_remove(self._poster_select_id)
+        # A fetch already running for the previous row must not show up
+        self._poster_seq += 1
+        self._poster_select_id = GLib.timeout_add(
+            POSTER_SELECT_DELAY_MS, self._on_poster_select_timeout, operation
+        )
+
+    def _on_poster_select_timeout(self, operation):
+        """Fetch the poster for the row the selection settled on"""
+        self._poster_select_id = 0
         # Try to fetch and show poster if it's a movie
         self._try_fetch_poster(operation)
+        return False  # Remove from GLib timeout queue
+
+    def _cached(self, key, ttl, fn):
+        """
+        Return fn() memoized under key in the preview lookup cache.
+
+        Args:
+            key: Hashable cache key
+            ttl: Seconds an entry stays valid, or None to keep it for the session
+            fn: Zero-argument callable producing the value
+
+        Returns:
+            Cached or freshly computed value (None results are not cached)
+        """
+        now = time.monotonic()
+        entry = self._meta_cache.get(key)
+        if entry is not None and (ttl is None or now - entry[1] < ttl):
+            return entry[0]
+        value = fn()
+        if value is not None:
+            self._meta_cache[key] = (value, now)
+        return value
+
+    def _download_preview_poster(self, metadata):
+        """Download the preview-size poster once per TMDB ID and reuse the file"""
+        key = ("poster", metadata.tmdb_id, "medium")
+        entry = self._meta_cache.get(key)
+        if entry is not None and not entry[0].exists():
+            # Image cache was cleared on disk since the last lookup
+            self._meta_cache.pop(key, None)
+        return self._cached(
+            key, None,
+            lambda: self.operations_handler.image_manager.download_poster(metadata, size='medium'),
+        )
+
+    def _prefetch_posters(self, operations):
+        """
+        Warm the preview cache for the first titles of a new operations list.
+
+        Each title is looked up by the [tmdbid-N] tag of its destination,
+        under the same cache keys _try_fetch_poster reads, and its poster
+        downloaded, so selecting one of these rows finds both ready.
+
+        Args:
+            operations: Generated operations, in display order
+        """
+        # Work queued for the previous list is no longer useful
+        for future in self._prefetch_futures:
+            future.cancel()
+        self._prefetch_futures = []
+
+        if not self.operations_handler.metadata_fetcher or not self.operations_handler.image_manager:
+            return
+
+        limit = self.operations_handler.config.prefetch_limit
+        seen = set()
+        for op in operations:
+            if len(seen) >= limit:
+                break
+            if op.operation_type == 'delete':
+                continue
+            match = _TMDB_ID_RE.search(os.fspath(op.destination))
+            if not match:
+                continue
+            media_type = detect_media_type(op.source).media_type
+            if media_type not in (MediaType.MOVIE, MediaType.TVSHOW):
+                continue
+            key = (media_type == MediaType.MOVIE, int(match.group(1)))
+            if key in seen:
+                continue
+            seen.add(key)
+            self._prefetch_futures.append(
+                self._prefetch_pool.submit(self._prefetch_poster, *key)
+            )
+
+    def _prefetch_poster(self, is_movie, tmdb_id):
+        """Resolve one title by TMDB ID and download its poster (worker thread)"""
+        if self._destroyed:
+            return
+        fetcher = self.operations_handler.metadata_fetcher
+        try:
+            if is_movie:
+                metadata = self._cached(
+                    ("movie_id", tmdb_id), _META_CACHE_TTL,
+                    lambda: fetcher.get_movie_by_id(tmdb_id),
+                )
+            else:
+                metadata = self._cached(
+                    ("tv_id", tmdb_id), _META_CACHE_TTL,
+                    lambda: fetcher.get_tvshow_by_id(tmdb_id),
+                )
+            if metadata and not self._destroyed:
+                self._download_preview_poster(metadata)
+        except Exception as e:
+            self.logger.debug(f"Poster prefetch failed for TMDB ID {tmdb_id}: {e}")
 
     def _fetch_poster_from_metadata(self, metadata):
         """
@@ -611,19 +1029,20 @@ class JellyfixMainWindow(Adw.ApplicationWindow):
             GLib.idle_add(self.preview_panel.poster_image.set_visible, False)
             return
 
+        self._poster_seq += 1
+        seq = self._poster_seq
+
         def fetch_task():
             try:
-                if self._destroyed:
+                if self._destroyed or seq != self._poster_seq:
                     return
-                poster_path = self.operations_handler.image_manager.download_poster(
-                    metadata, size='medium'
-                )
-                if poster_path and not self._destroyed:
+                poster_path = self._download_preview_poster(metadata)
+                if poster_path and not self._destroyed and seq == self._poster_seq:
                     GLib.idle_add(self.preview_panel.load_poster, poster_path)
             except Exception as e:
                 self.logger.error(f"Erro ao baixar poster: {e}")
 
-        threading.Thread(target=fetch_task, daemon=True).start()
+        self._poster_pool.submit(fetch_task)
 
     def _try_fetch_poster(self, operation):
         """
@@ -632,11 +1051,6 @@ class JellyfixMainWindow(Adw.ApplicationWindow):
         Args:
             operation: RenameOperation instance
         """
-        import re
-
-        from ...core.detector import MediaType, detect_media_type
-        from ...utils.helpers import clean_filename, extract_year
-
         # Check if metadata fetcher is available
         if not self.operations_handler.metadata_fetcher:
             self.logger.debug("No metadata fetcher available")
@@ -658,56 +1072,78 @@ class JellyfixMainWindow(Adw.ApplicationWindow):
 
         # Try to extract TMDB ID from destination path
         tmdb_id = None
-        tmdb_match = re.search(r'\[tmdbid-(\d+)\]', str(operation.destination))
+        tmdb_match = _TMDB_ID_RE.search(os.fspath(operation.destination))
         if tmdb_match:
             tmdb_id = int(tmdb_match.group(1))
             self.logger.debug(f"Found TMDB ID: {tmdb_id}")
 
+        # A newer selection makes this request stale
+        self._poster_seq += 1
+        seq = self._poster_seq
+
         def fetch_task():
             """Background poster fetch"""
             try:
-                if self._destroyed:
+                if self._destroyed or seq != self._poster_seq:
                     return
                 metadata = None
                 is_movie = media_info.media_type == MediaType.MOVIE
+                fetcher = self.operations_handler.metadata_fetcher
 
                 # Try by ID first
                 if tmdb_id:
                     if is_movie:
                         self.logger.info(f"Fetching movie by TMDB ID: {tmdb_id}")
                         try:
-                            metadata = self.operations_handler.metadata_fetcher.get_movie_by_id(tmdb_id)
+                            metadata = self._cached(
+                                ("movie_id", tmdb_id), _META_CACHE_TTL,
+                                lambda: fetcher.get_movie_by_id(tmdb_id),
+                            )
                         except Exception as e:
                             self.logger.debug(f"get_movie_by_id failed: {e}")
                             # Fallback to search
-                            metadata = self.operations_handler.metadata_fetcher.search_movie(title, year)
+                            metadata = self._cached(
+                                ("movie_search", title, year), _META_CACHE_TTL,
+                                lambda: fetcher.search_movie(title, year),
+                            )
                     else:
                         self.logger.info(f"Fetching TV show by TMDB ID: {tmdb_id}")
                         try:
-                            metadata = self.operations_handler.metadata_fetcher.get_tvshow_by_id(tmdb_id)
+                            metadata = self._cached(
+                                ("tv_id", tmdb_id), _META_CACHE_TTL,
+                                lambda: fetcher.get_tvshow_by_id(tmdb_id),
+                            )
                         except Exception as e:
                             self.logger.debug(f"get_tvshow_by_id failed: {e}")
                             # Fallback to search
-                            metadata = self.operations_handler.metadata_fetcher.search_tvshow(title, year)
+                            metadata = self._cached(
+                                ("tv_search", title, year), _META_CACHE_TTL,
+                                lambda: fetcher.search_tvshow(title, year),
+                            )
                 else:
                     if is_movie:
                         self.logger.info(f"Searching movie: {title} ({year})")
-                        metadata = self.operations_handler.metadata_fetcher.search_movie(title, year)
+                        metadata = self._cached(
+                            ("movie_search", title, year), _META_CACHE_TTL,
+                            lambda: fetcher.search_movie(title, year),
+                        )
                     else:
                         self.logger.info(f"Searching TV show: {title}")
-                        metadata = self.operations_handler.metadata_fetcher.search_tvshow(title, year)
+                        metadata = self._cached(
+                            ("tv_search", title, year), _META_CACHE_TTL,
+                            lambda: fetcher.search_tvshow(title, year),
+                        )
 
-                if self._destroyed:
+                if self._destroyed or seq != self._poster_seq:
                     return
 
                 if metadata:
-                    self.logger.debug(f"Got metadata: {metadata}")
+                    if self.logger.debug_enabled:
+                        self.logger.debug(f"Got metadata: {metadata}")
                     if self.operations_handler.image_manager:
                         self.logger.debug("Downloading poster...")
-                        poster_path = self.operations_handler.image_manager.download_poster(
-                            metadata, size='medium'
-                        )
-                        if poster_path and not self._destroyed:
+                        poster_path = self._download_preview_poster(metadata)
+                        if poster_path and not self._destroyed and seq == self._poster_seq:
                             self.logger.info(f"Poster downloaded: {poster_path}")
                             GLib.idle_add(self.preview_panel.load_poster, poster_path)
                         elif not poster_path:
@@ -722,10 +1158,7 @@ class JellyfixMainWindow(Adw.ApplicationWindow):
                 import traceback
                 traceback.print_exc()
 
-        # Run in background thread
-        import threading
-        thread = threading.Thread(target=fetch_task, daemon=True)
-        thread.start()
+        self._poster_pool.submit(fetch_task)
 
     def on_download_batch_subtitles(self, operations):
         """
@@ -749,61 +1182,23 @@ class JellyfixMainWindow(Adw.ApplicationWindow):
             dialog.present()
             return
 
-        # Show progress dialog
-        # Since Adw doesn't have a built-in progress dialog, we can use a custom Gtk.Window 
-        # or use the Toast overlay with a spinner, but for batch operations a modal dialog is better.
-        # Let's creating a simple modal window.
-        
-        progress_window = Gtk.Window(transient_for=self, modal=True)
-        progress_window.set_title("")
-        progress_window.set_titlebar(Gtk.Box())  # Hide title bar
-        progress_window.set_default_size(400, 200)
-        progress_window.set_resizable(False)
-        
-        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
-        box.set_margin_top(24)
-        box.set_margin_bottom(24)
-        box.set_margin_start(24)
-        box.set_margin_end(24)
-        
-        # Status Label
-        status_label = Gtk.Label(label=_("Preparing..."))
-        status_label.set_wrap(True)
-        status_label.set_justify(Gtk.Justification.CENTER)
-        box.append(status_label)
-
-        # Spinner for activity indication
-        spinner = Gtk.Spinner()
-        spinner.set_size_request(32, 32)
-        spinner.set_halign(Gtk.Align.CENTER)
-        spinner.start()
-        box.append(spinner)
-
-        # Progress bar (only visible for multiple files)
-        progress_bar = Gtk.ProgressBar()
-        progress_bar.set_fraction(0.0)
-        progress_bar.set_show_text(True)
-        if len(operations) > 1:
-            box.append(progress_bar)
-        
-        # Current file label
-        file_label = Gtk.Label(label="")
-        file_label.set_wrap(True)
-        file_label.add_css_class("dim-label")
-        file_label.set_ellipsize(Pango.EllipsizeMode.MIDDLE)
-        box.append(file_label)
-        
-        progress_window.set_child(box)
-        progress_window.present()
-        
+        # Only one batch at a time; the progress card is shared
+        if self.batch_progress:
+            toast = Adw.Toast(title=_("Subtitle download already in progress"))
+            toast.set_timeout(3)
+            self.toast_overlay.add_toast(toast)
+            return
+
+        self._show_batch_progress(len(operations))
+        self._set_batch_running(True)
+
         # Store for updating
         self._batch_source_files = [op.source for op in operations]
         self.batch_progress = {
-            "window": progress_window,
-            "status": status_label,
-            "bar": progress_bar,
-            "spinner": spinner,
-            "file": file_label,
+            "status": self._batch_status_label,
+            "bar": self._batch_bar,
+            "spinner": self._batch_spinner,
+            "file": self._batch_file_label,
             "total": len(operations),
             "current": 0,
             "success": 0,
@@ -814,26 +1209,42 @@ class JellyfixMainWindow(Adw.ApplicationWindow):
         def batch_task():
             """Background batch download task"""
             try:
-                import re
-
                 from ...utils.config import get_config
 
                 config = get_config()
                 requested_langs = set(config.kept_languages) if config.kept_languages else {'por', 'eng'}
-
-                for i, op in enumerate(operations):
+                # Subtitle names per folder; a season shares one listing
+                # that is only refreshed after a download adds files
+                dir_cache = {}
+
+                # Title, year, episode and TMDB ID from one parse of each path
+                parsed_ops = [parse_destination_for_search(op.destination) for op in operations]
+
+                # Original titles keyed by (is_episode, tmdb_id), fetched
+                # concurrently up front so a season costs one TMDB request
+                orig_title_cache = {}
+                title_keys = {
+                    (parsed['is_episode'], parsed['tmdb_id'])
+                    for parsed in parsed_ops if parsed['tmdb_id']
+                }
+                if title_keys:
+                    fetcher = MetadataFetcher()
+                    workers = min(_TITLE_PREFETCH_WORKERS, len(title_keys))
+                    with ThreadPoolExecutor(max_workers=workers) as pool:
+                        futures = {
+                            key: pool.submit(self._fetch_original_title, fetcher, *key)
+                            for key in title_keys
+                        }
+                    for key, future in futures.items():
+                        orig_title_cache[key] = future.result()
+
+                for i, (op, parsed) in enumerate(zip(operations, parsed_ops)):
                     if self._destroyed:
                         return
                     # Update status to show current file being processed
-                    GLib.idle_add(self._update_batch_status, i, op.source.name)
+                    self._post_batch_update(i, op.source.name, i)
                     
-                    from ...utils.helpers import parse_destination_for_search
-
-                    # Extract TMDB ID from path
-                    tmdb_match = re.search(r'\[tmdbid-(\d+)\]', str(op.destination))
-                    tmdb_id = int(tmdb_match.group(1)) if tmdb_match else None
-
-                    parsed = parse_destination_for_search(op.destination)
+                    tmdb_id = parsed['tmdb_id']
                     tmdb_title = parsed['title']
                     tmdb_year = parsed['year']
                     is_episode = parsed['is_episode']
@@ -842,21 +1253,9 @@ class JellyfixMainWindow(Adw.ApplicationWindow):
                     
                     # IMPORTANT: Use original title from TMDB for subtitle search
                     # Subtitle providers index by original (usually English) title
-                    original_title = None
-                    if tmdb_id:
-                        try:
-                            from ...core.metadata import MetadataFetcher
-                            fetcher = MetadataFetcher()
-                            if is_episode:
-                                metadata = fetcher.get_tvshow_by_id(tmdb_id)
-                            else:
-                                metadata = fetcher.get_movie_by_id(tmdb_id)
-                            
-                            if metadata and metadata.original_title:
-                                original_title = metadata.original_title
-                                self.logger.info(f"Using original title for subtitle search: '{original_title}' (translated: '{tmdb_title}')")
-                        except Exception as e:
-                            self.logger.debug(f"Could not fetch original title: {e}")
+                    original_title = orig_title_cache.get((is_episode, tmdb_id))
+                    if original_title:
+                        self.logger.info(f"Using original title for subtitle search: '{original_title}' (translated: '{tmdb_title}')")
                     
                     # Use original title if available, fallback to translated title
                     search_title = original_title or tmdb_title
@@ -865,12 +1264,10 @@ class JellyfixMainWindow(Adw.ApplicationWindow):
                     self.logger.info(f"TMDB info for subtitle search: title='{search_title}', year={tmdb_year}, episode={is_episode}")
 
                     # Collect existing subtitle files before download
-                    existing_subs = set(
-                        f.name
-                        for f in op.source.parent.iterdir()
-                        if f.is_file()
-                        and f.suffix.lower() in (".srt", ".ass", ".ssa", ".sub", ".vtt")
-                    )
+                    parent_key = os.fspath(op.source.parent)
+                    existing_subs = dir_cache.get(parent_key)
+                    if existing_subs is None:
+                        existing_subs = dir_cache[parent_key] = _list_subtitles(parent_key)
 
                     # Download with TMDB metadata
                     try:
@@ -887,17 +1284,10 @@ class JellyfixMainWindow(Adw.ApplicationWindow):
                             found_langs = set(results.keys())
 
                             # Count only truly new subtitle files
-                            new_subs = (
-                                set(
-                                    f.name
-                                    for f in op.source.parent.iterdir()
-                                    if f.is_file()
-                                    and f.suffix.lower()
-                                    in (".srt", ".ass", ".ssa", ".sub", ".vtt")
-                                )
-                                - existing_subs
-                            )
-                            bp = getattr(self, "batch_progress", None)
+                            fresh_subs = _list_subtitles(parent_key)
+                            dir_cache[parent_key] = fresh_subs
+                            new_subs = fresh_subs - existing_subs
+                            bp = self.batch_progress
                             if bp is None:
                                 return  # Window closed mid-batch
                             bp["downloaded"] += len(new_subs)
@@ -917,17 +1307,19 @@ class JellyfixMainWindow(Adw.ApplicationWindow):
                                 bp['success'] += 1
                         else:
                             # No subtitles found at all
-                            bp = getattr(self, "batch_progress", None)
+                            bp = self.batch_progress
                             if bp is None:
                                 return
                             bp.setdefault('failed_ops', []).append(op)
                     except Exception as e:
                         self.logger.error(f"Error downloading for {op.source.name}: {e}")
+                        # The download may have written files before failing
+                        dir_cache.pop(parent_key, None)
 
                     # Update progress bar after each file is processed
                     if self._destroyed:
                         return
-                    GLib.idle_add(self._update_batch_progress, i + 1)
+                    self._post_batch_update(i, op.source.name, i + 1)
 
                 # Finish
                 if not self._destroyed:
@@ -943,51 +1335,181 @@ class JellyfixMainWindow(Adw.ApplicationWindow):
         thread = threading.Thread(target=batch_task, daemon=True)
         thread.start()
 
+    def _fetch_original_title(self, fetcher, is_episode, tmdb_id):
+        """
+        Look up the original title of a movie or show (worker thread).
+
+        Args:
+            fetcher: MetadataFetcher shared by the batch
+            is_episode: True to query the TV endpoint
+            tmdb_id: TMDB ID of the movie or show
+
+        Returns:
+            Original title, or None if unavailable
+        """
+        try:
+            if is_episode:
+                metadata = fetcher.get_tvshow_by_id(tmdb_id)
+            else:
+                metadata = fetcher.get_movie_by_id(tmdb_id)
+        except Exception as e:
+            self.logger.debug(f"Could not fetch original title: {e}")
+            return None
+        return metadata.original_title if metadata else None
+
+    def _show_batch_progress(self, total):
+        """
+        Reveal the batch download progress card, building it on first use.
+
+        The card sits in the toast overlay above the split view and is
+        reused by every batch instead of opening a window each time.
+
+        Args:
+            total: Number of videos in the batch
+        """
+        if self._batch_revealer is None:
+            box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
+            box.add_css_class("card")
+            box.set_size_request(400, -1)
+            box.set_margin_top(12)
+
+            inner = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
+            inner.set_margin_top(24)
+            inner.set_margin_bottom(24)
+            inner.set_margin_start(24)
+            inner.set_margin_end(24)
+            box.append(inner)
+
+            # Status Label
+            self._batch_status_label = Gtk.Label()
+            self._batch_status_label.set_wrap(True)
+            self._batch_status_label.set_justify(Gtk.Justification.CENTER)
+            inner.append(self._batch_status_label)
+
+            # Spinner for activity indication
+            self._batch_spinner = Gtk.Spinner()
+            self._batch_spinner.set_size_request(32, 32)
+            self._batch_spinner.set_halign(Gtk.Align.CENTER)
+            inner.append(self._batch_spinner)
+
+            # Progress bar (only visible for multiple files)
+            self._batch_bar = Gtk.ProgressBar()
+            self._batch_bar.set_show_text(True)
+            inner.append(self._batch_bar)
+
+            # Current file label
+            self._batch_file_label = Gtk.Label()
+            self._batch_file_label.set_wrap(True)
+            self._batch_file_label.add_css_class("dim-label")
+            self._batch_file_label.set_ellipsize(Pango.EllipsizeMode.MIDDLE)
+            inner.append(self._batch_file_label)
+
+            self._batch_progress_box = box
+            self._batch_revealer = Gtk.Revealer()
+            self._batch_revealer.set_transition_type(Gtk.RevealerTransitionType.SLIDE_DOWN)
+            self._batch_revealer.set_halign(Gtk.Align.CENTER)
+            self._batch_revealer.set_valign(Gtk.Align.START)
+            self._batch_revealer.set_child(box)
+            self.toast_overlay.add_overlay(self._batch_revealer)
+
+        self._batch_status_label.set_text(_("Preparing..."))
+        self._batch_file_label.set_text("")
+        self._batch_bar.set_fraction(0.0)
+        self._batch_bar.set_text(None)
+        self._batch_bar.set_visible(total > 1)
+        self._batch_spinner.start()
+        self._batch_revealer.set_reveal_child(True)
+
+    def _set_batch_running(self, running):
+        """
+        Lock scanning, applying and processing while a batch downloads.
+
+        The worker reads each video's folder and writes subtitles next to
+        it, so nothing may move or rescan those files until it finishes.
+
+        Args:
+            running: True when the batch starts, False when it ends
+        """
+        self.dashboard.set_sensitive(not running)
+        self.operations_list.set_busy(running)
+
+    def _refuse_during_batch(self):
+        """
+        Tell the user a batch download is still running, if one is.
+
+        Covers entry points the locked widgets don't (command line paths,
+        dialogs opened before the batch started).
+
+        Returns:
+            True if the caller must not proceed
+        """
+        if not self.batch_progress:
+            return False
+        toast = Adw.Toast(title=_("Wait for the subtitle download to finish"))
+        toast.set_timeout(3)
+        self.toast_overlay.add_toast(toast)
+        return True
+
+    def _hide_batch_progress(self):
+        """Hide the batch download progress card"""
+        if self._batch_revealer is not None:
+            self._batch_spinner.stop()
+            self._batch_revealer.set_reveal_child(False)
+
     def _pulse_progress(self):
         """Pulse progress bar for indeterminate status"""
-        if hasattr(self, 'batch_progress'):
+        if self.batch_progress is not None:
             self.batch_progress['bar'].pulse()
             return True
         return False
 
-    def _update_batch_status(self, index, filename):
-        """Update status text and current file label (before download)"""
-        bp = getattr(self, 'batch_progress', None)
-        if not bp:
-            return
+    def _post_batch_update(self, index, filename, completed):
+        """
+        Record batch progress from the worker thread and queue a UI flush.
+
+        Only the latest state is kept, so fast downloads collapse into a
+        single main-loop callback instead of two per file.
+
+        Args:
+            index: Index of the file being processed
+            filename: Name of the file being processed
+            completed: Number of files already processed
+        """
+        with self._batch_update_lock:
+            self._pending_batch_update = (index, filename, completed)
+            if self._batch_update_queued:
+                return
+            self._batch_update_queued = True
+        GLib.idle_add(self._flush_batch_update)
+
+    def _flush_batch_update(self):
+        """Apply the latest batch progress to the card (main thread)"""
+        with self._batch_update_lock:
+            update = self._pending_batch_update
+            self._pending_batch_update = None
+            self._batch_update_queued = False
+        bp = self.batch_progress
+        if not bp or update is None:
+            return False
+        index, filename, completed = update
         try:
             total = bp["total"]
             bp["status"].set_text(
                 _("Searching subtitles ({}/{})").format(index + 1, total)
             )
             bp["file"].set_text(filename)
-        except (KeyError, AttributeError):
-            # Window was closed between idle_add scheduling and execution
-            return
-
-    def _update_batch_progress(self, completed):
-        """Update progress bar after a file has been processed"""
-        bp = getattr(self, "batch_progress", None)
-        if not bp:
-            return
-        try:
-            total = bp['total']
             fraction = completed / total if total else 0
             bp["bar"].set_fraction(fraction)
             bp["bar"].set_text(f"{int(fraction * 100)}%")
-        except (KeyError, AttributeError, ZeroDivisionError):
-            return
+        except (KeyError, AttributeError):
+            # Window was closed between idle_add scheduling and execution
+            pass
+        return False
 
     def _on_batch_complete(self):
         """Handle batch completion"""
-        bp = getattr(self, 'batch_progress', None)
+        bp = self.batch_progress
         if bp:
-            # Stop spinner
-            try:
-                bp["spinner"].stop()
-            except (KeyError, AttributeError):
-                pass
-
             # Stop pulsing if active
             if bp.get('pulse_id'):
                 try:
@@ -995,10 +1517,8 @@ class JellyfixMainWindow(Adw.ApplicationWindow):
                 except Exception:
                     pass
 
-            try:
-                bp['window'].close()
-            except (KeyError, AttributeError):
-                pass
+            self._hide_batch_progress()
+            self._set_batch_running(False)
             
             total = bp.get('total', 0)
             success = bp.get('success', 0)
@@ -1011,10 +1531,7 @@ class JellyfixMainWindow(Adw.ApplicationWindow):
             self._last_partial_ops = partial_ops
             self._last_failed_ops = failed_ops
 
-            try:
-                del self.batch_progress
-            except AttributeError:
-                pass
+            self.batch_progress = None
             
             # Determine message and options based on results
             sub_word = _("subtitle") if downloaded == 1 else _("subtitles")
@@ -1075,8 +1592,8 @@ class JellyfixMainWindow(Adw.ApplicationWindow):
                         self._open_manual_subtitle_search()
                 # Rescan to pick up new subtitles; preserve original selection
                 # so non-media delete ops are not lost
-                if hasattr(self, "_batch_source_files") and self._batch_source_files:
-                    del self._batch_source_files
+                if self._batch_source_files:
+                    self._batch_source_files = None
                     if hasattr(self.operations_handler, "current_directory"):
                         self._start_scan(self.operations_handler.current_directory)
             
@@ -1085,21 +1602,16 @@ class JellyfixMainWindow(Adw.ApplicationWindow):
 
     def _on_batch_error(self, error_msg):
         """Handle batch error"""
-        bp = getattr(self, 'batch_progress', None)
+        bp = self.batch_progress
         if bp:
             if bp.get('pulse_id'):
                 try:
                     GLib.source_remove(bp['pulse_id'])
                 except Exception:
                     pass
-            try:
-                bp['window'].close()
-            except (KeyError, AttributeError):
-                pass
-            try:
-                del self.batch_progress
-            except AttributeError:
-                pass
+            self._hide_batch_progress()
+            self._set_batch_running(False)
+            self.batch_progress = None
             
         dialog = Adw.MessageDialog(
             transient_for=self,
@@ -1127,7 +1639,6 @@ class JellyfixMainWindow(Adw.ApplicationWindow):
             operation: Optional RenameOperation to search for. If None, uses current selection.
         """
         from .subtitle_search_dialog import SubtitleSearchDialog
-        from ...utils.helpers import parse_destination_for_search
 
         # Get operation from current selection if not provided
         if operation is None:
@@ -1160,61 +1671,34 @@ class JellyfixMainWindow(Adw.ApplicationWindow):
             self.toast_overlay.add_toast(toast)
 
 
-    def _replan_video_ops(self, operations, video_source, metadata, renamer):
+    def _replan_video_ops(self, operations, video_source, metadata, renamer, related_index):
         """
         Re-planeja as operações de UM vídeo (e arquivos relacionados) com o
         metadata escolhido, substituindo as operações antigas na lista in-place.
 
+        O índice (ver _build_related_index) é atualizado junto com a lista,
+        para servir aos próximos vídeos da mesma série.
+
         Returns:
             Lista das novas operações (vazia se o vídeo não foi encontrado
             ou o re-planejamento falhou).
         """
-        import re
-
-        from ...utils.helpers import is_subtitle_file, is_video_file, normalize_spaces
-
-        video_stem_original = video_source.stem
-        video_normalized = normalize_spaces(video_stem_original)
-
-        # Find indices of all operations related to this video
-        related_indices = []
-        video_index = None
-
-        for i, op in enumerate(operations):
-            if op.source == video_source:
-                # This is the video itself
-                video_index = i
-                related_indices.append(i)
-            else:
-                # Check if this operation is related to the video
-                file_stem = op.source.stem
-
-                # For subtitles, remove language code before comparing
-                if is_subtitle_file(op.source):
-                    base_match = re.match(r'(.+?)\.([a-z]{2,3}\d?)(\.forced)?$', file_stem, re.IGNORECASE)
-                    if base_match:
-                        file_base = base_match.group(1)
-                    else:
-                        file_base = file_stem
-
-                    if normalize_spaces(file_base) == video_normalized or file_base == video_stem_original:
-                        related_indices.append(i)
-
-                # For NFO and image files, compare full stem
-                elif op.source.suffix.lower() in ['.nfo', '.jpg', '.png', '.jpeg']:
-                    if normalize_spaces(file_stem) == video_normalized or file_stem == video_stem_original:
-                        related_indices.append(i)
-
-                # Convention files in the same folder (backdrop.jpg, folder.jpg, etc.)
-                # that don't match video stem — they're handled by replan_for_video_with_metadata
-                if op.source.parent == video_source.parent and i not in related_indices:
-                    if not is_video_file(op.source) and not is_subtitle_file(op.source):
-                        related_indices.append(i)
-
-        if video_index is None:
+        video_ops = related_index['source'].get(video_source)
+        if not video_ops:
             self.logger.warning(f"Video operation not found in list: {video_source.name}")
             return []
 
+        # The video, plus subtitles/NFO/images sharing its normalized stem and
+        # non-media files in its folder (subtitles compare without language code)
+        video_normalized = normalize_spaces(video_source.stem)
+        related = {}
+        for op in (
+            video_ops
+            + related_index['stem'].get(video_normalized, [])
+            + related_index['parent'].get(video_source.parent, [])
+        ):
+            related[id(op)] = op
+
         # Re-plan operations for this video with the new metadata
         # This will respect ALL config settings (remove_foreign_subs, organize_folders, etc.)
         new_operations = renamer.replan_for_video_with_metadata(
@@ -1226,17 +1710,20 @@ class JellyfixMainWindow(Adw.ApplicationWindow):
             self.logger.warning(f"Failed to re-plan operations for {video_source.name}")
             return []
 
-        # Remove old related operations (in reverse order to maintain indices)
-        for i in sorted(related_indices, reverse=True):
-            del operations[i]
+        # Drop the old related operations and put the new ones where the
+        # first of them was, in a single splice of the list
+        insert_position = next(i for i, op in enumerate(operations) if id(op) in related)
+        operations[insert_position:] = new_operations + [
+            op for op in operations[insert_position:] if id(op) not in related
+        ]
 
-        # Insert new operations at the position where the video was
-        insert_position = min(related_indices)
-        for i, new_op in enumerate(new_operations):
-            operations.insert(insert_position + i, new_op)
+        for op in related.values():
+            _unindex_related_op(related_index, op)
+        for new_op in new_operations:
+            _index_related_op(related_index, new_op)
 
         # Log what was updated
-        self.logger.info(f"Replaced {len(related_indices)} old operations with {len(new_operations)} new operations")
+        self.logger.info(f"Replaced {len(related)} old operations with {len(new_operations)} new operations")
         for new_op in new_operations:
             if new_op.operation_type == 'delete':
                 self.logger.info(f"  - DELETE: {new_op.source.name} ({new_op.reason})")
@@ -1253,9 +1740,6 @@ class JellyfixMainWindow(Adw.ApplicationWindow):
         Assim, corrigir o título de UM episódio pelo SearchDialog corrige a
         série inteira de uma vez, em vez de exigir um clique por episódio.
         """
-        from ...core.detector import detect_media_type
-        from ...utils.helpers import is_video_file, normalize_spaces
-
         ref = detect_media_type(video_source)
         ref_title = normalize_spaces(ref.title or '').lower()
         if not ref_title:
@@ -1296,7 +1780,12 @@ class JellyfixMainWindow(Adw.ApplicationWindow):
         # Create a Renamer instance with the current metadata_fetcher (preserves cache)
         renamer = Renamer(metadata_fetcher=self.operations_handler.metadata_fetcher)
 
-        new_operations = self._replan_video_ops(operations, video_source, metadata, renamer)
+        # Related operations by stem/folder, shared by every video re-planned here
+        related_index = _build_related_index(operations)
+
+        new_operations = self._replan_video_ops(
+            operations, video_source, metadata, renamer, related_index
+        )
         if not new_operations:
             return
 
@@ -1305,7 +1794,7 @@ class JellyfixMainWindow(Adw.ApplicationWindow):
         episodes_updated = 0
         if metadata.media_type == "tvshow":
             for sibling in self._find_same_series_videos(operations, video_source):
-                if self._replan_video_ops(operations, sibling, metadata, renamer):
+                if self._replan_video_ops(operations, sibling, metadata, renamer, related_index):
                     episodes_updated += 1
             if episodes_updated:
                 self.logger.info(
@@ -40,8 +40,8 @@ class PreferencesWindow(Adw.PreferencesWindow):
         self.logger = get_logger()
         self.config = get_config()
 
-        from ...utils.config_manager import ConfigManager
-        self.config_manager = ConfigManager()
+        from ...utils.config_manager import get_config_manager
+        self.config_manager = get_config_manager()
 
         # Window properties
         self.set_title(_("Preferences"))
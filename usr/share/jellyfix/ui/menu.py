@@ -14,7 +14,7 @@ from ..core.scanner import ScanResult
 from ..core.renamer import Renamer
 from ..utils.config import Config, get_config, APP_VERSION
 from ..utils.logger import get_logger, console
-from ..utils.config_manager import ConfigManager
+from ..utils.config_manager import get_config_manager
 
 
 # Estilo customizado para o menu
@@ -335,33 +335,33 @@ class InteractiveMenu:
                 break
             elif "Renomear variações" in choice:
                 config.rename_por2 = not config.rename_por2
-                config_mgr = ConfigManager()
+                config_mgr = get_config_manager()
                 config_mgr.set('rename_por2', config.rename_por2)
             elif "Remover variações duplicadas" in choice:
                 config.remove_language_variants = not config.remove_language_variants
-                config_mgr = ConfigManager()
+                config_mgr = get_config_manager()
                 config_mgr.set('remove_language_variants', config.remove_language_variants)
             elif "código de idioma" in choice:
                 config.rename_no_lang = not config.rename_no_lang
-                config_mgr = ConfigManager()
+                config_mgr = get_config_manager()
                 config_mgr.set('rename_no_lang', config.rename_no_lang)
             elif "estrangeiras" in choice:
                 config.remove_foreign_subs = not config.remove_foreign_subs
-                config_mgr = ConfigManager()
+                config_mgr = get_config_manager()
                 config_mgr.set('remove_foreign_subs', config.remove_foreign_subs)
             elif "Idiomas mantidos" in choice:
                 self._language_selection_menu(config)
             elif "Organizar em pastas" in choice:
                 config.organize_folders = not config.organize_folders
-                config_mgr = ConfigManager()
+                config_mgr = get_config_manager()
                 config_mgr.set('organize_folders', config.organize_folders)
             elif "Buscar metadados" in choice:
                 config.fetch_metadata = not config.fetch_metadata
-                config_mgr = ConfigManager()
+                config_mgr = get_config_manager()
                 config_mgr.set('fetch_metadata', config.fetch_metadata)
             elif "não-mídia" in choice:
                 config.remove_non_media = not config.remove_non_media
-                config_mgr = ConfigManager()
+                config_mgr = get_config_manager()
                 config_mgr.set('remove_non_media', config.remove_non_media)
             elif "palavras portuguesas" in choice:
                 new_value = questionary.text(
@@ -373,7 +373,7 @@ class InteractiveMenu:
                     value = int(new_value)
                     config.min_pt_words = value
                     # Salva no arquivo de configuração
-                    config_mgr = ConfigManager()
+                    config_mgr = get_config_manager()
                     config_mgr.set_min_pt_words(value)
                     self.console.print("[green]✓ Salvo em ~/.jellyfix/config.json[/green]")
                 except ValueError:
@@ -418,8 +418,8 @@ class InteractiveMenu:
             self.console.print(f"\n[green]✓ Idiomas mantidos: {', '.join(selected)}[/green]")
 
             # Salva no arquivo de configuração
-            from ..utils.config_manager import ConfigManager
-            config_mgr = ConfigManager()
+            from ..utils.config_manager import get_config_manager
+            config_mgr = get_config_manager()
             config_mgr.set('kept_languages', selected)
             self.console.print("[green]✓ Salvo em ~/.jellyfix/config.json[/green]")
 
@@ -430,7 +430,7 @@ class InteractiveMenu:
         self.console.clear()
         self.console.print("\n[bold cyan]🔍 Testando conexão com TMDB...[/bold cyan]\n")
 
-        config_mgr = ConfigManager()
+        config_mgr = get_config_manager()
         api_key = config_mgr.get_tmdb_api_key()
 
         if not api_key:
@@ -495,7 +495,7 @@ class InteractiveMenu:
 
     def _api_settings_menu(self, config: Config):
         """Menu de configuração de APIs"""
-        config_mgr = ConfigManager()
+        config_mgr = get_config_manager()
 
         while True:
             self.console.clear()
@@ -39,12 +39,16 @@ class Config:
     # Network / API tunables
     image_download_timeout: int = 10  # seconds for poster/backdrop HTTP requests
     max_search_results: int = 10  # max TMDB/subtitle results shown in pickers
+    prefetch_limit: int = 10  # posters fetched ahead of time after operations are generated (GUI)
     title_similarity_threshold: float = 0.5  # min ratio for fuzzy title matching
     # Confiança mínima (similaridade de título PT/original x proximidade de ano)
     # para aceitar um match do TMDB no modo não-interativo. Abaixo disso o
     # jellyfix NÃO renomeia (evita match errado) e registra p/ revisão manual.
     match_confidence_threshold: float = 0.55
     min_subtitle_bytes: int = 20  # files smaller than this are skipped as junk
+    # Lista diretórios em paralelo no scan da GUI. Detectado automaticamente
+    # para montagens de rede (SMB/NFS); True força o modo concorrente.
+    network_scan: bool = False
 
     # Modos de execução
     dry_run: bool = True
@@ -166,7 +170,7 @@ class Config:
         for key in ['rename_por2', 'rename_no_lang', 'remove_foreign_subs',
                     'remove_language_variants', 'organize_folders', 'fetch_metadata',
                     'ask_on_multiple_results', 'rename_nfo', 'remove_non_media',
-                    'fix_mirabel_files']:
+                    'fix_mirabel_files', 'network_scan']:
             saved_value = config_mgr.get(key)
             if saved_value is not None:
                 setattr(self, key, saved_value)
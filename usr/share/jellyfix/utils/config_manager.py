@@ -1,8 +1,10 @@
 """Gerenciador de configuração persistente em JSON"""
 
+import copy
 import json
 import os
 import shutil
+import threading
 from pathlib import Path
 from typing import Optional, Dict, Any
 
@@ -15,6 +17,11 @@ class ConfigManager:
     def __init__(self):
         self.config_dir = Path.home() / '.jellyfix'
         self.config_file = self.config_dir / 'config.json'
+        # Last parsed config, keyed by the file's (inode, mtime, size)
+        self._cache_key = None
+        self._cache: Dict[str, Any] = {}
+        # The GUI shares one instance across threads (get_config_manager)
+        self._cache_lock = threading.Lock()
         self._ensure_config_dir()
 
     def _ensure_config_dir(self):
@@ -28,12 +35,29 @@ class ConfigManager:
         Returns:
             Dicionário com configurações ou dict vazio se arquivo não existir
         """
-        if not self.config_file.exists():
+        try:
+            st = os.stat(self.config_file)
+        except FileNotFoundError:
+            return {}
+        except OSError as e:
+            get_logger().warning(f"Config file unreadable ({self.config_file}): {e} — using defaults")
             return {}
 
+        # The file is only re-parsed when it changed on disk; callers get a
+        # copy because they mutate the dict before save()
+        key = (st.st_ino, st.st_mtime_ns, st.st_size)
+        with self._cache_lock:
+            cached = self._cache if key == self._cache_key else None
+        if cached is not None:
+            return copy.deepcopy(cached)
+
         try:
             with open(self.config_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+                config = json.load(f)
+            with self._cache_lock:
+                self._cache = config
+                self._cache_key = key
+            return copy.deepcopy(config)
         except json.JSONDecodeError as e:
             get_logger().warning(f"Config file corrupted ({self.config_file}): {e} — using defaults")
             return {}
@@ -202,7 +226,7 @@ class ConfigManager:
         Args:
             path: Path to the library directory
         """
-        from datetime import datetime
+        import time
 
         libraries = self.get('recent_libraries', [])
 
@@ -212,7 +236,7 @@ class ConfigManager:
         # Add to beginning
         libraries.insert(0, {
             'path': path,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': time.time()
         })
 
         # Keep only last 10
@@ -251,3 +275,13 @@ class ConfigManager:
         self.set('last_directory', path)
 
 
+# Instância compartilhada (singleton pattern, como get_config/get_logger)
+_config_manager: Optional[ConfigManager] = None
+
+
+def get_config_manager() -> ConfigManager:
+    """Retorna o gerenciador de configuração compartilhado"""
+    global _config_manager
+    if _config_manager is None:
+        _config_manager = ConfigManager()
+    return _config_manager
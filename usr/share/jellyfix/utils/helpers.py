@@ -701,6 +701,7 @@ _RE_QUALITY_TAG_TRAILING = re.compile(r'\s*-\s*(2160p|1080p|720p|480p|4K).*', re
 _RE_EPISODE_DASH = re.compile(r'(.+?)\s+-\s+S(\d+)E(\d+)', re.IGNORECASE)
 _RE_EPISODE_PLAIN = re.compile(r'(.+?)\s+S(\d+)E(\d+)', re.IGNORECASE)
 _RE_PAREN_YEAR = re.compile(r'\((\d{4})\)')
+_RE_TMDB_ID_TAG = re.compile(r'\[tmdbid-(\d+)\]')
 
 
 def parse_destination_for_search(destination: Path) -> dict:
@@ -711,27 +712,35 @@ def parse_destination_for_search(destination: Path) -> dict:
     Recognized patterns:
       - "Title (YYYY) - 1080p" → movie with title + year
       - "Title (YYYY) - S01E01" or "Title S01E01" → episode (year may come from parent folder)
+      - "[tmdbid-N]" anywhere in the path → TMDB ID
 
     Args:
         destination: Path to the planned destination file (operation.destination).
 
     Returns:
         Dict with keys: title (str), year (Optional[int]), is_episode (bool),
-        season (Optional[int]), episode (Optional[int]).
+        season (Optional[int]), episode (Optional[int]), tmdb_id (Optional[int]).
     """
+    dest_str = str(destination)
+    tmdb_match = _RE_TMDB_ID_TAG.search(dest_str)
+    tmdb_id = int(tmdb_match.group(1)) if tmdb_match else None
+
     dest_name = destination.stem
     # Strip trailing quality tags so they don't get glued onto the title.
     dest_name = _RE_QUALITY_TAG_TRAILING.sub('', dest_name)
 
-    episode_match = _RE_EPISODE_DASH.search(dest_name) or _RE_EPISODE_PLAIN.search(dest_name)
-    year_match = _RE_PAREN_YEAR.search(dest_name)
+    # Every "Title - S01E01" also matches the plain pattern, so the dash
+    # variant is only tried once the plain one has found an episode
+    episode_match = _RE_EPISODE_PLAIN.search(dest_name)
+    if episode_match:
+        episode_match = _RE_EPISODE_DASH.search(dest_name) or episode_match
 
     if episode_match:
         title = episode_match.group(1).strip()
         season = int(episode_match.group(2))
         episode = int(episode_match.group(3))
         # Episodes usually omit the year — try the parent folder ("Show (YYYY)/Season XX").
-        folder_year_match = _RE_PAREN_YEAR.search(str(destination.parent))
+        folder_year_match = _RE_PAREN_YEAR.search(dest_str, 0, len(dest_str) - len(destination.name))
         year = int(folder_year_match.group(1)) if folder_year_match else None
         return {
             'title': title,
@@ -739,8 +748,10 @@ def parse_destination_for_search(destination: Path) -> dict:
             'is_episode': True,
             'season': season,
             'episode': episode,
+            'tmdb_id': tmdb_id,
         }
 
+    year_match = _RE_PAREN_YEAR.search(dest_name)
     if year_match:
         return {
             'title': dest_name[: year_match.start()].strip(),
@@ -748,6 +759,7 @@ def parse_destination_for_search(destination: Path) -> dict:
             'is_episode': False,
             'season': None,
             'episode': None,
+            'tmdb_id': tmdb_id,
         }
 
     return {
@@ -756,4 +768,5 @@ def parse_destination_for_search(destination: Path) -> dict:
         'is_episode': False,
         'season': None,
         'episode': None,
+        'tmdb_id': tmdb_id,
     }
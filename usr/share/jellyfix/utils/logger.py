@@ -70,6 +70,11 @@ class Logger:
             self.console.print(f"[action]→ {escape(message)}[/action]")
         self._write_to_file(message, "ACTION")
 
+    @property
+    def debug_enabled(self) -> bool:
+        """Indica se mensagens de debug vão para algum lugar (console ou arquivo)"""
+        return self.verbose or bool(self.log_file)
+
     def debug(self, message: str):
         """Mensagem de debug (apenas se verbose)"""
         if self.verbose: